@@ -0,0 +1,82 @@
+"""
+Benchmark throughput and 429s of fixed versus adaptive concurrency against a saturating server.
+
+The mock server answers in `--latency` seconds while at most `--capacity` requests are in
+flight, slows down proportionally beyond that, and rejects requests with 429 once more than
+1.5 times its capacity are in flight. `--requests` course details are fetched with
+``UdemyClient.get_many_course_details`` three ways:
+
+- fixed low: a concurrency of 2, well under the server's capacity;
+- fixed high: a concurrency of 32, far over it;
+- adaptive: a concurrency of 32 capped by an ``AdaptiveLimiter`` starting at 2.
+
+Usage:
+    python benchmarks/adaptive_concurrency.py [--requests 600] [--capacity 8] [--latency 0.01]
+"""
+
+import argparse
+import threading
+import time
+from typing import Optional, Tuple
+
+import httpx
+from parse_entry import ENTRIES
+
+from pydemy import AdaptiveLimiter, UdemyClient
+
+
+def make_client(
+    capacity: int, latency: float, limiter: Optional[AdaptiveLimiter]
+) -> Tuple[UdemyClient, list]:
+    """Returns a client of the saturating server and the list its 429s are counted in."""
+    lock, active, throttled = threading.Lock(), [0], []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            active[0] += 1
+            load = active[0]
+        try:
+            if load > capacity * 1.5:
+                throttled.append(1)
+                return httpx.Response(429)
+            time.sleep(latency * max(1.0, load / capacity))
+            return httpx.Response(200, json=ENTRIES["course"])
+        finally:
+            with lock:
+                active[0] -= 1
+
+    client = UdemyClient("bench", "bench", concurrency_limiter=limiter)
+    client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client, throttled
+
+
+def run(args: argparse.Namespace, concurrency: int, limiter: Optional[AdaptiveLimiter]) -> str:
+    """Fetches the course details and returns a summary line."""
+    client, throttled = make_client(args.capacity, args.latency, limiter)
+    start = time.perf_counter()
+    results = list(client.get_many_course_details(range(args.requests), concurrency))
+    elapsed = time.perf_counter() - start
+    client.close()
+    ok = sum(result.ok for result in results)
+    summary = f"{ok / elapsed:8.1f} ok/s  {len(throttled):5d} x 429  {ok:5d} ok"
+    if limiter is not None:
+        summary += f"  final limit {limiter.limit}"
+    return summary
+
+
+def main() -> None:
+    """Runs the three configurations and prints their throughput and 429 counts."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=600)
+    parser.add_argument("--capacity", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.01)
+    args = parser.parse_args()
+
+    print(f"fixed low  (2):  {run(args, 2, None)}")
+    print(f"fixed high (32): {run(args, 32, None)}")
+    limiter = AdaptiveLimiter(initial_limit=2, max_limit=32, window=10)
+    print(f"adaptive   (32): {run(args, 32, limiter)}")
+
+
+if __name__ == "__main__":
+    main()
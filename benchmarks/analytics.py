@@ -0,0 +1,96 @@
+"""
+Benchmark refreshing rating statistics for many courses.
+
+For each course, computes the histogram, mean, median and monthly trend two ways:
+
+- before: Python loops over lists of CourseReview ratings and creation times;
+- after: ReviewStats, counting each page once and answering from its histogram.
+
+Usage:
+    python benchmarks/analytics.py [--courses 1000] [--reviews 200]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List
+
+from parse_entry import ENTRIES
+
+from pydemy import ReviewStats
+from pydemy.models import CourseReview, CourseReviewRecord
+
+
+def list_stats(reviews: List[CourseReview]) -> Dict[str, Any]:
+    """Computes the statistics with Python loops over the reviews."""
+    ratings = [review.rating for review in reviews]
+    by_month: Dict[str, List[float]] = defaultdict(list)
+    for review in reviews:
+        by_month[review.created.strftime("%Y-%m")].append(review.rating)
+    return {
+        "histogram": Counter(ratings),
+        "mean": statistics.fmean(ratings),
+        "median": statistics.median_low(ratings),
+        "trend": {month: statistics.fmean(values) for month, values in sorted(by_month.items())},
+    }
+
+
+def histogram_stats(stats: ReviewStats) -> Dict[str, Any]:
+    """Computes the statistics from ReviewStats."""
+    return {
+        "histogram": stats.histogram(),
+        "mean": stats.mean(),
+        "median": stats.percentiles((50,))[50],
+        "trend": stats.trend(),
+    }
+
+
+def time_once(run: Callable[[], Any]) -> float:
+    """Returns the time of `run` in milliseconds."""
+    start = time.perf_counter()
+    run()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main() -> None:
+    """Builds random review pages per course and times both ways of computing stats."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--courses", type=int, default=1000)
+    parser.add_argument("--reviews", type=int, default=200)
+    args = parser.parse_args()
+
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    courses = []
+    for _ in range(args.courses):
+        entries = [
+            dict(
+                ENTRIES["course_review"],
+                rating=random.choice((1.0, 2.0, 3.0, 3.5, 4.0, 4.5, 5.0)),
+                created=(start + timedelta(days=random.randrange(1500))).isoformat(),
+            )
+            for _ in range(args.reviews)
+        ]
+        courses.append(
+            (
+                [CourseReview.model_validate(entry) for entry in entries],
+                [CourseReviewRecord(**entry) for entry in entries],
+            )
+        )
+
+    before = time_once(lambda: [list_stats(models) for models, _ in courses])
+    after = time_once(
+        lambda: [
+            histogram_stats(ReviewStats(bucket=timedelta(days=30)).update(records))
+            for _, records in courses
+        ]
+    )
+    print(f"{args.courses} courses x {args.reviews} reviews")
+    print(f"lists (ms)       {before:9.1f}")
+    print(f"ReviewStats (ms) {after:9.1f}  ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
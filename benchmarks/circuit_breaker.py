@@ -0,0 +1,89 @@
+"""
+Benchmark call latency during an upstream outage with and without a circuit breaker.
+
+The mock server hangs until the client's timeout on every review request (an outage of one
+endpoint) while course details stay healthy. `--calls` alternating review and detail calls are
+made by `--workers` threads two ways:
+
+- before: a plain ``UdemyClient``; every review call waits for the full timeout;
+- after: a ``UdemyClient`` with a ``CircuitBreaker``; once the reviews circuit opens, review
+  calls fail in microseconds and the worker threads stay free for the healthy endpoint.
+
+Usage:
+    python benchmarks/circuit_breaker.py [--calls 400] [--workers 8] [--timeout 0.2]
+"""
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import httpx
+from parse_entry import ENTRIES
+
+from pydemy import CircuitBreaker, UdemyClient
+from pydemy._exceptions import UdemyAPIError
+
+
+def make_client(timeout: float, breaker: Optional[CircuitBreaker]) -> UdemyClient:
+    """Returns a client whose review requests time out after `timeout` seconds."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/reviews/"):
+            time.sleep(timeout)
+            raise httpx.ReadTimeout("timed out", request=request)
+        time.sleep(0.005)
+        return httpx.Response(200, json=ENTRIES["course"])
+
+    client = UdemyClient("bench", "bench", circuit_breaker=breaker)
+    client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+def run(client: UdemyClient, calls: int, workers: int) -> List[float]:
+    """Makes the calls on a thread pool and returns the latency of every call in seconds."""
+
+    def call(index: int) -> float:
+        start = time.perf_counter()
+        try:
+            if index % 2:
+                client.get_course_reviews(index)
+            else:
+                client.get_course_details(index)
+        except UdemyAPIError:
+            pass
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(call, range(calls)))
+
+
+def describe(latencies: List[float], elapsed: float) -> str:
+    """Formats the p50 and p99 latency and the wall time."""
+    percentiles = statistics.quantiles(latencies, n=100)
+    p50, p99 = percentiles[49], percentiles[98]
+    return f"p50 {p50 * 1e3:7.1f} ms  p99 {p99 * 1e3:7.1f} ms  total {elapsed:6.2f} s"
+
+
+def main() -> None:
+    """Runs the calls with and without a circuit breaker and prints the latencies."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--timeout", type=float, default=0.2)
+    args = parser.parse_args()
+
+    for label, breaker in (
+        ("before (no breaker):", None),
+        ("after  (breaker):   ", CircuitBreaker(min_requests=8, open_seconds=60)),
+    ):
+        client = make_client(args.timeout, breaker)
+        start = time.perf_counter()
+        latencies = run(client, args.calls, args.workers)
+        print(label, describe(latencies, time.perf_counter() - start))
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
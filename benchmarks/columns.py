@@ -0,0 +1,92 @@
+"""
+Benchmark rating analytics over a list of reviews versus ReviewColumns.
+
+Computes the mean rating and the number of reviews per month (only the mean without NumPy)
+two ways:
+
+- before: a Python loop over CourseReview models, one attribute access per object;
+- after: vectorized NumPy operations over the zero-copy views of ReviewColumns (if NumPy is
+  installed), or plain ``sum``/``len`` over the contiguous arrays otherwise.
+
+Also reports the memory retained by the models and by the columns.
+
+Usage:
+    python benchmarks/columns.py [--reviews 100000]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Callable, List, Tuple
+
+from parse_entry import ENTRIES
+
+from pydemy import ReviewColumns
+from pydemy.models import CourseReview
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def measure(build: Callable[[], Any]) -> Tuple[Any, int]:
+    """Returns the result of `build` and the bytes it retained."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, retained
+
+
+def time_best(run: Callable[[], Any], repeat: int = 5) -> float:
+    """Returns the best time of `run` in milliseconds over `repeat` runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1e3
+
+
+def loop_analytics(reviews: List[CourseReview]) -> Tuple[float, Any]:
+    """Returns the mean rating and reviews per month with a Python loop."""
+    mean = sum(review.rating for review in reviews) / len(reviews)
+    if numpy is None:
+        return mean, None
+    return mean, Counter(review.created.strftime("%Y-%m") for review in reviews)
+
+
+def column_analytics(columns: ReviewColumns) -> Tuple[float, Any]:
+    """Returns the mean rating and reviews per month from the columns."""
+    if numpy is None:
+        return sum(columns["rating"]) / len(columns), None
+    arrays = columns.to_numpy()
+    months = arrays["created"].astype("datetime64[M]")
+    return float(arrays["rating"].mean()), numpy.unique(months, return_counts=True)
+
+
+def main() -> None:
+    """Builds both representations, then times the analytics and prints the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--reviews", type=int, default=100000)
+    args = parser.parse_args()
+
+    entries = [dict(ENTRIES["course_review"], id=index) for index in range(args.reviews)]
+    reviews, model_bytes = measure(lambda: [CourseReview.model_validate(e) for e in entries])
+    columns, column_bytes = measure(lambda: ReviewColumns(reviews))
+    assert loop_analytics(reviews)[0] == column_analytics(columns)[0]
+
+    loop_ms = time_best(lambda: loop_analytics(reviews))
+    column_ms = time_best(lambda: column_analytics(columns))
+    print(f"{args.reviews} reviews ({'numpy' if numpy else 'no numpy'})")
+    print(f"memory (MB)      models {model_bytes / 1e6:9.1f}  columns {column_bytes / 1e6:9.1f}")
+    print(f"analytics (ms)   loop   {loop_ms:9.1f}  columns {column_ms:9.1f}")
+    print(f"speedup          {loop_ms / column_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
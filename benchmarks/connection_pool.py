@@ -0,0 +1,126 @@
+"""
+Benchmark requests/sec of per-call connections versus the pooled UdemyClient.
+
+Starts a local HTTP/1.1 keep-alive stub server that serves a course detail payload, then issues
+the same number of get_course_details calls two ways:
+
+- before: a fresh connection per request through the module-level ``httpx.get`` (the client's
+  behavior prior to connection pooling);
+- after: ``UdemyClient.get_course_details`` reusing the client's pooled ``httpx.Client``.
+
+Usage:
+    python benchmarks/connection_pool.py [--requests 500]
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from pydemy import UdemyClient
+from pydemy.models import Course
+
+COURSE_PAYLOAD = {
+    "_class": "course",
+    "id": 12345,
+    "title": "Benchmark Course",
+    "url": "/course/benchmark-course/",
+    "is_paid": True,
+    "price": "$19.99",
+    "price_detail": {
+        "amount": 19.99,
+        "currency": "USD",
+        "price_string": "$19.99",
+        "currency_symbol": "$",
+    },
+    "price_serve_tracking_id": "tracking-id",
+    "visible_instructors": [
+        {
+            "_class": "user",
+            "title": "John Doe",
+            "name": "John",
+            "display_name": "John Doe",
+            "initials": "JD",
+            "url": "/user/john-doe/",
+        }
+    ],
+    "image_125_H": "https://example.com/125.jpg",
+    "image_240x135": "https://example.com/240.jpg",
+    "is_practice_test_course": False,
+    "image_480x270": "https://example.com/480.jpg",
+    "published_title": "benchmark-course",
+    "locale": {
+        "locale": "en_US",
+        "title": "English (US)",
+        "english_title": "English (US)",
+        "simple_english_title": "English",
+    },
+}
+BODY = json.dumps(COURSE_PAYLOAD).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves the course payload for every GET request over keep-alive connections."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # noqa: N802  # pylint: disable=invalid-name
+        """Writes the JSON course payload."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Silences per-request logging."""
+
+
+def run_before(base_url: str, requests: int) -> float:
+    """Fetches course details with a new connection per request and returns requests/sec."""
+    url = base_url + "courses/12345/"
+    auth = httpx.BasicAuth("bench", "bench")
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = httpx.get(url=url, auth=auth)
+        response.raise_for_status()
+        UdemyClient._parse_entry(response.json(), Course)
+    return requests / (time.perf_counter() - start)
+
+
+def run_after(base_url: str, requests: int) -> float:
+    """Fetches course details through the pooled UdemyClient and returns requests/sec."""
+    with UdemyClient("bench", "bench", base_url=base_url) as client:
+        start = time.perf_counter()
+        for _ in range(requests):
+            client.get_course_details(12345)
+        return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Runs both benchmarks against the local stub server and prints the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/api-2.0/"
+
+    try:
+        before = run_before(base_url, args.requests)
+        after = run_after(base_url, args.requests)
+    finally:
+        server.shutdown()
+
+    print(f"before (httpx.get per call): {before:8.1f} req/s")
+    print(f"after  (pooled httpx.Client): {after:8.1f} req/s")
+    print(f"speedup: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark course searches answered by CourseIndex.
+
+Indexes a synthetic catalogue and times typical CourseFilter searches against it; the same
+searches through get_courses cost an API round trip each. Relevance ranking scores every
+matching course, so the "common word" search, which matches a third of the catalogue, shows
+the cost of very broad queries.
+
+Usage:
+    python benchmarks/course_index.py [--courses 20000] [--queries 1000]
+"""
+
+import argparse
+import random
+import time
+
+from parse_entry import ENTRIES
+
+from pydemy import CourseIndex
+from pydemy.models import Course, CourseFilter, Ordering, Price
+
+# A vocabulary of 1000 words, each in about 1% of the courses, plus one very common word
+WORDS = [f"word{number}" for number in range(1000)]
+COMMON = "python"
+
+
+def main() -> None:
+    """Builds the index, then prints the upsert time and per-query latencies."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--courses", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=1000)
+    args = parser.parse_args()
+
+    courses = [
+        Course.model_validate(
+            dict(
+                ENTRIES["course"],
+                id=course_id,
+                title=" ".join(random.sample(WORDS, 4)) + f" course {course_id}",
+                headline=" ".join(random.sample(WORDS, 6)) + (f" {COMMON}" * (course_id % 3 == 0)),
+                is_paid=random.random() < 0.8,
+            )
+        )
+        for course_id in range(args.courses)
+    ]
+    index = CourseIndex()
+    start = time.perf_counter()
+    index.upsert(courses)
+    upsert_ms = (time.perf_counter() - start) * 1e3
+
+    searches = {
+        "one word": lambda: CourseFilter(search=random.choice(WORDS)),
+        "two words, paid": lambda: CourseFilter(
+            search=" ".join(random.sample(WORDS, 2)), price=Price.PRICE_PAID
+        ),
+        "by price": lambda: CourseFilter(
+            search=random.choice(WORDS), ordering=Ordering.PRICE_LOW_TO_HIGH
+        ),
+        "language only": lambda: CourseFilter(language="en"),
+        "common word": lambda: CourseFilter(search=COMMON),
+    }
+    print(f"{args.courses} courses indexed in {upsert_ms:.0f} ms")
+    print(f"{'query':<18}{'mean (ms)':>10}")
+    for name, make_filter in searches.items():
+        filters = [make_filter() for _ in range(args.queries)]
+        start = time.perf_counter()
+        for course_filter in filters:
+            index.search(course_filter)
+        print(f"{name:<18}{(time.perf_counter() - start) * 1e3 / args.queries:10.3f}")
+
+
+if __name__ == "__main__":
+    main()
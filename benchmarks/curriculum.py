@@ -0,0 +1,96 @@
+"""
+Benchmark per-page parse time of public curriculum pages.
+
+Parses the same raw curriculum page (chapters, lectures and quizzes) two ways:
+
+- before: the previous ``_parse_curriculum``, which decoded the page into dicts, passed
+  chapters and quizzes through as raw dicts and stripped ``_class`` from lectures, followed by
+  the validation into Chapter, Lecture and Quiz models that callers had to do themselves;
+- after: ``BaseClient._parse_curriculum``, which validates the raw bytes against the
+  ``_class``-discriminated CurriculumItem union in a single pass.
+
+Usage:
+    python benchmarks/curriculum.py [--pages 1000] [--page-size 100]
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from parse_entry import ENTRIES
+
+from pydemy._base_client import BaseClient
+from pydemy.models import Chapter, Lecture, Quiz
+
+CHAPTER = {
+    "_class": "chapter",
+    "id": 1,
+    "created": "2023-01-01T00:00:00Z",
+    "sort_order": 3,
+    "title": "Introduction",
+    "description": "Course introduction",
+    "is_published": True,
+}
+QUIZ = {
+    "_class": "quiz",
+    "id": 3,
+    "title": "Knowledge Check",
+    "type": "simple-quiz",
+    "created": "2023-01-01T00:00:00Z",
+    "description": "Check your knowledge",
+    "title_cleaned": "knowledge-check",
+    "is_published": True,
+    "sort_order": 1,
+    "object_index": 1,
+    "is_draft": False,
+    "version": 1,
+    "duration": 300,
+    "pass_percent": 80.0,
+}
+MODELS: Dict[str, Any] = {"chapter": Chapter, "lecture": Lecture, "quiz": Quiz}
+
+
+def parse_before(content: bytes) -> List[Any]:
+    """Runs the previous dict handling, then validates the items as callers had to."""
+    items = []
+    for entry in json.loads(content)["results"]:
+        if entry["_class"] in ["chapter", "quiz"]:
+            items.append(entry)
+        elif entry["_class"] == "lecture":
+            items.append({key: value for key, value in entry.items() if key != "_class"})
+    return [
+        MODELS[item.get("_class", "lecture")].model_validate(item)  # Lectures lost their _class
+        for item in items
+    ]
+
+
+def time_per_page(parse: Callable[[], Any], pages: int) -> float:
+    """Returns the mean time of `parse` in milliseconds over `pages` calls."""
+    start = time.perf_counter()
+    for _ in range(pages):
+        parse()
+    return (time.perf_counter() - start) / pages * 1e3
+
+
+def main() -> None:
+    """Runs both parsers over a mixed curriculum page and prints the per-page times."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    pattern = [CHAPTER, ENTRIES["lecture"], ENTRIES["lecture"], ENTRIES["lecture"], QUIZ]
+    results = (pattern * (args.page_size // len(pattern) + 1))[: args.page_size]
+    content = json.dumps({"next": None, "results": results}).encode()
+    assert parse_before(content) == BaseClient._parse_curriculum(content)
+
+    before = time_per_page(lambda: parse_before(content), args.pages)
+    after = time_per_page(lambda: BaseClient._parse_curriculum(content), args.pages)
+    print(f"before (dicts + re-validation): {before:8.3f} ms/page")
+    print(f"after  (discriminated union):   {after:8.3f} ms/page")
+    print(f"speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark wall time of enriching many courses with details, reviews and curriculum.
+
+Serves course details, review pages and `--pages` curriculum pages per course through a mock
+transport that waits `--latency` seconds per request, then enriches `--courses` course IDs
+two ways:
+
+- before: chaining ``get_course_details``, ``get_course_reviews`` and
+  ``get_course_public_curriculum`` (one call per curriculum page) per ID by hand;
+- after: ``UdemyClient.enrich_courses``, which runs every request of every course as one job
+  graph on a shared concurrency budget.
+
+Usage:
+    python benchmarks/enrichment.py [--courses 50] [--pages 3] [--latency 0.02] [--concurrency 8]
+"""
+
+import argparse
+import time
+
+import httpx
+from curriculum import CHAPTER, QUIZ
+from parse_entry import ENTRIES
+
+from pydemy import UdemyClient
+
+
+def make_client(pages: int, latency: float) -> UdemyClient:
+    """Returns a client whose requests take `latency` seconds each to be answered."""
+    items = [CHAPTER, *[ENTRIES["lecture"]] * 98, QUIZ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(latency)
+        if request.url.path.endswith("/reviews/"):
+            return httpx.Response(200, json={"results": [ENTRIES["course_review"]] * 10})
+        if request.url.path.endswith("/public-curriculum-items/"):
+            page = int(request.url.params["page"])
+            next_url = None
+            if page < pages:
+                next_url = str(request.url.copy_merge_params({"page": page + 1}))
+            results = items if page < pages else items[:50]  # The last page is not full
+            body = {"count": (pages - 1) * len(items) + 50, "next": next_url, "results": results}
+            return httpx.Response(200, json=body)
+        return httpx.Response(200, json=ENTRIES["course"])
+
+    client = UdemyClient("bench", "bench")
+    client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+def run_before(client: UdemyClient, course_ids: range) -> int:
+    """Enriches the courses one request after the other and returns the number of items."""
+    items = 0
+    for course_id in course_ids:
+        client.get_course_details(course_id)
+        client.get_course_reviews(course_id)
+        page = 1
+        while True:
+            curriculum = client.get_course_public_curriculum(course_id, page, 100)
+            items += len(curriculum)
+            if len(curriculum) < 100:
+                break
+            page += 1
+    return items
+
+
+def run_after(client: UdemyClient, course_ids: range, concurrency: int) -> int:
+    """Enriches the courses with enrich_courses and returns the number of items."""
+    items = 0
+    for enrichment in client.enrich_courses(course_ids, concurrency=concurrency):
+        items += sum(len(section.items) + 1 for section in enrichment.curriculum)
+    return items
+
+
+def main() -> None:
+    """Enriches the courses both ways and prints the wall times."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--courses", type=int, default=50)
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+    course_ids = range(1, args.courses + 1)
+
+    client = make_client(args.pages, args.latency)
+    start = time.perf_counter()
+    before_items = run_before(client, course_ids)
+    before = time.perf_counter() - start
+    client.close()
+
+    client = make_client(args.pages, args.latency)
+    start = time.perf_counter()
+    after_items = run_after(client, course_ids, args.concurrency)
+    after = time.perf_counter() - start
+    client.close()
+    assert before_items == after_items
+
+    print(f"before (chained per ID):  {before * 1e3:8.1f} ms")
+    print(f"after  (enrich_courses):  {after * 1e3:8.1f} ms")
+    print(f"speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark peak memory of exporting reviews to JSON Lines.
+
+Exports the same reviews two ways:
+
+- before: building the full list of CourseReview models, then writing ``model_dump_json``
+  per model;
+- after: export_jsonl over a generator of lean records, written in fixed-size chunks.
+
+Usage:
+    python benchmarks/export.py [--reviews 100000]
+"""
+
+import argparse
+import io
+import time
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+from parse_entry import ENTRIES
+
+from pydemy import export_jsonl
+from pydemy.models import CourseReview, CourseReviewRecord
+
+
+def measure(run: Callable[[], Any]) -> Tuple[float, int]:
+    """Returns the time of `run` in milliseconds and its peak traced memory in bytes."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed * 1e3, peak
+
+
+class Sink(io.RawIOBase):
+    """Binary file that discards what is written, so only the export itself is measured."""
+
+    def write(self, data: bytes) -> int:
+        """Discards `data`."""
+        return len(data)
+
+
+def export_list(reviews: int) -> None:
+    """Materializes every model, then writes one line per model."""
+    models = [CourseReview.model_validate(ENTRIES["course_review"]) for _ in range(reviews)]
+    target = Sink()
+    for model in models:
+        target.write(model.model_dump_json().encode() + b"\n")
+
+
+def export_stream(reviews: int) -> None:
+    """Streams lean records through export_jsonl into a sink that discards the chunks."""
+    records = (CourseReviewRecord(**ENTRIES["course_review"]) for _ in range(reviews))
+    export_jsonl(records, Sink())
+
+
+def main() -> None:
+    """Runs both exports and prints time and peak memory."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--reviews", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"{args.reviews} reviews        time (ms)  peak (MB)")
+    for name, export in (("list + model_dump", export_list), ("export_jsonl", export_stream)):
+        elapsed, peak = measure(lambda: export(args.reviews))
+        print(f"{name:<22}{elapsed:10.1f} {peak / 1e6:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
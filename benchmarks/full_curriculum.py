@@ -0,0 +1,71 @@
+"""
+Benchmark wall time of retrieving a long course curriculum over a slow connection.
+
+Serves a curriculum of `--pages` pages through a mock transport that waits `--latency` seconds
+per request, then retrieves the whole curriculum two ways:
+
+- before: ``UdemyClient.iter_course_curriculum``, which follows the next page links one by one
+  (prefetching one page ahead);
+- after: ``UdemyClient.get_full_curriculum``, which reads ``count`` from the first page and
+  fetches the remaining pages concurrently.
+
+Usage:
+    python benchmarks/full_curriculum.py [--pages 20] [--page-size 100] [--latency 0.05]
+"""
+
+import argparse
+import time
+
+import httpx
+from curriculum import CHAPTER, QUIZ
+from parse_entry import ENTRIES
+
+from pydemy import UdemyClient
+
+
+def make_client(pages: int, page_size: int, latency: float) -> UdemyClient:
+    """Returns a client whose curriculum pages take `latency` seconds each to arrive."""
+    items = [CHAPTER, *[ENTRIES["lecture"]] * (page_size - 2), QUIZ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(latency)
+        page = int(request.url.params["page"])
+        next_url = None
+        if page < pages:
+            next_url = str(request.url.copy_merge_params({"page": page + 1}))
+        body = {"count": pages * page_size, "next": next_url, "results": items}
+        return httpx.Response(200, json=body)
+
+    client = UdemyClient("bench", "bench")
+    client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+def main() -> None:
+    """Retrieves the curriculum both ways and prints the wall times."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    client = make_client(args.pages, args.page_size, args.latency)
+    start = time.perf_counter()
+    items = list(client.iter_course_curriculum(1, page_size=args.page_size))
+    before = time.perf_counter() - start
+    client.close()
+
+    client = make_client(args.pages, args.page_size, args.latency)
+    start = time.perf_counter()
+    sections = client.get_full_curriculum(1, page_size=args.page_size)
+    after = time.perf_counter() - start
+    client.close()
+    assert sum(len(section.items) + 1 for section in sections) == len(items)
+
+    print(f"before (next links):      {before * 1e3:8.1f} ms")
+    print(f"after  (concurrent pages): {after * 1e3:8.1f} ms")
+    print(f"speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
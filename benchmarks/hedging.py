@@ -0,0 +1,88 @@
+"""
+Benchmark course details latency with and without hedged requests against a server with a slow
+tail.
+
+The mock server answers in `--latency` seconds, except for a random `--slow-share` of requests
+that take `--slow-latency` seconds. `--calls` course details are fetched with
+``AsyncUdemyClient.get_course_details``, `--concurrency` at a time, two ways:
+
+- before: a plain ``AsyncUdemyClient``; every slow response is waited for;
+- after: an ``AsyncUdemyClient`` with a ``HedgingPolicy``; requests slower than the 95th
+  latency percentile are sent again, within a budget of 10% extra requests.
+
+Usage:
+    python benchmarks/hedging.py [--calls 2000] [--concurrency 16] [--slow-share 0.03]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import List, Optional
+
+import httpx
+from parse_entry import ENTRIES
+
+from pydemy import AsyncUdemyClient, HedgingPolicy
+
+
+def make_client(args: argparse.Namespace, policy: Optional[HedgingPolicy]) -> AsyncUdemyClient:
+    """Returns a client of the server with a slow tail, counting the requests it receives."""
+    rng = random.Random(0)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        slow = rng.random() < args.slow_share
+        await asyncio.sleep(args.slow_latency if slow else args.latency)
+        return httpx.Response(200, json=ENTRIES["course"])
+
+    client = AsyncUdemyClient("bench", "bench", hedging_policy=policy)
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+async def run(client: AsyncUdemyClient, calls: int, concurrency: int) -> List[float]:
+    """Fetches the course details and returns the latency of every call in seconds."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(course_id: int) -> float:
+        async with semaphore:
+            start = time.perf_counter()
+            await client.get_course_details(course_id)
+            return time.perf_counter() - start
+
+    return await asyncio.gather(*(call(course_id) for course_id in range(calls)))
+
+
+def describe(latencies: List[float]) -> str:
+    """Formats the p50, p99 and p99.9 latency."""
+    percentiles = statistics.quantiles(latencies, n=1000)
+    p50, p99, p999 = percentiles[499], percentiles[989], percentiles[998]
+    return f"p50 {p50 * 1e3:6.1f} ms  p99 {p99 * 1e3:6.1f} ms  p99.9 {p999 * 1e3:6.1f} ms"
+
+
+async def main() -> None:
+    """Runs the calls with and without hedging and prints the latencies."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--slow-latency", type=float, default=0.2)
+    parser.add_argument("--slow-share", type=float, default=0.03)
+    args = parser.parse_args()
+
+    for label, policy in (
+        ("before (no hedging):", None),
+        ("after  (hedging):   ", HedgingPolicy(max_extra_load=0.1)),
+    ):
+        client = make_client(args, policy)
+        latencies = await run(client, args.calls, args.concurrency)
+        summary = describe(latencies)
+        if policy is not None:
+            summary += f"  hedges {policy.hedges_issued} issued, {policy.hedges_won} won"
+        print(label, summary)
+        await client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
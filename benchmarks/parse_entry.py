@@ -0,0 +1,154 @@
+"""
+Benchmark per-entry parse time of BaseClient._parse_entry for courses, reviews and lectures.
+
+Parses the same decoded JSON entries two ways:
+
+- before: the legacy field loop, which copied each entry, built the nested User, PriceDetail,
+  Instructor, Locale and Asset models by hand and then had the outer model validate them again;
+- after: ``BaseClient._parse_entry``, which validates the raw entry against the model looked up
+  from its ``_class`` in a single pass.
+
+Usage:
+    python benchmarks/parse_entry.py [--entries 20000]
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict
+
+from pydemy._base_client import BaseClient
+from pydemy.models import (
+    Asset,
+    Course,
+    CourseReview,
+    Instructor,
+    Lecture,
+    Locale,
+    PriceDetail,
+    User,
+)
+
+USER = {"_class": "user", "title": "John Doe", "name": "John", "display_name": "John Doe"}
+ENTRIES: Dict[str, Dict[str, Any]] = {
+    "course": {
+        "_class": "course",
+        "id": 12345,
+        "title": "Benchmark Course",
+        "url": "/course/benchmark-course/",
+        "is_paid": True,
+        "price": "$19.99",
+        "price_detail": {
+            "amount": 19.99,
+            "currency": "USD",
+            "price_string": "$19.99",
+            "currency_symbol": "$",
+        },
+        "price_serve_tracking_id": "tracking-id",
+        "visible_instructors": [
+            {**USER, "initials": "JD", "url": "/user/john-doe/"},
+            {**USER, "initials": "JS", "url": "/user/jane-smith/", "job_title": "Developer"},
+        ],
+        "image_125_H": "https://example.com/125.jpg",
+        "image_240x135": "https://example.com/240.jpg",
+        "is_practice_test_course": False,
+        "image_480x270": "https://example.com/480.jpg",
+        "published_title": "benchmark-course",
+        "locale": {
+            "_class": "locale",
+            "locale": "en_US",
+            "title": "English (US)",
+            "english_title": "English (US)",
+            "simple_english_title": "English",
+        },
+        "headline": "Learn by benchmarking",
+        "curriculum_items": [],
+    },
+    "course_review": {
+        "_class": "course_review",
+        "id": 987,
+        "content": "Great course!",
+        "rating": 5.0,
+        "created": "2023-01-01T00:00:00Z",
+        "modified": "2023-01-02T00:00:00Z",
+        "user_modified": "2023-01-02T00:00:00Z",
+        "user": USER,
+    },
+    "lecture": {
+        "_class": "lecture",
+        "id": 2,
+        "title": "Getting Started",
+        "created": "2023-01-01T00:00:00Z",
+        "description": "First steps",
+        "title_cleaned": "getting-started",
+        "is_published": True,
+        "is_downloadable": False,
+        "is_free": True,
+        "asset": {
+            "_class": "asset",
+            "id": 123,
+            "asset_type": "Video",
+            "title": "intro.mp4",
+            "created": "2023-01-01T00:00:00Z",
+        },
+        "sort_order": 2,
+        "can_be_previewed": True,
+    },
+}
+MODELS = {"course": Course, "course_review": CourseReview, "lecture": Lecture}
+
+
+def legacy_parse_entry(entry_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """The field loop BaseClient._parse_entry used before the single-pass rewrite."""
+    parsed_data = entry_dict.copy()
+    parsed_data.pop("_class", None)
+
+    def parse_nested_model(field_name, model_class):
+        if field_name in parsed_data and isinstance(parsed_data[field_name], dict):
+            if model_class:
+                parsed_data[field_name] = model_class(**parsed_data[field_name])
+
+    if "_class" in entry_dict:
+        model_class = {"course": Course, "course_review": CourseReview, "lecture": Lecture}.get(
+            entry_dict["_class"]
+        )
+        if model_class:
+            for field, value in entry_dict.items():
+                parse_nested_model(field, User if field == "user" else None)
+                parse_nested_model(field, PriceDetail if field == "price_detail" else None)
+                parse_nested_model(field, Instructor if field == "visible_instructors" else None)
+                parse_nested_model(field, Locale if field == "locale" else None)
+                parse_nested_model(field, Asset if field == "asset" else None)
+                if isinstance(value, list) and any(isinstance(item, dict) for item in value):
+                    model_class_list = {"visible_instructors": Instructor}.get(field)
+                    if model_class_list:
+                        parsed_data[field] = [
+                            model_class_list(**item) if item else item for item in value
+                        ]
+    return parsed_data
+
+
+def time_per_entry(parse: Callable[[], Any], entries: int) -> float:
+    """Returns the mean time of `parse` in microseconds over `entries` calls."""
+    start = time.perf_counter()
+    for _ in range(entries):
+        parse()
+    return (time.perf_counter() - start) / entries * 1e6
+
+
+def main() -> None:
+    """Runs both parsers over each entry type and prints the per-entry times."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'entry':<14}{'before (us)':>12}{'after (us)':>12}{'speedup':>9}")
+    for entry_class, entry in ENTRIES.items():
+        model_class = MODELS[entry_class]
+        assert BaseClient._parse_entry(entry) == model_class(**legacy_parse_entry(entry))
+        before = time_per_entry(lambda: model_class(**legacy_parse_entry(entry)), args.entries)
+        after = time_per_entry(lambda: BaseClient._parse_entry(entry), args.entries)
+        print(f"{entry_class:<14}{before:>12.2f}{after:>12.2f}{before / after:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
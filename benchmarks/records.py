@@ -0,0 +1,63 @@
+"""
+Benchmark the memory and parse time of full models versus lean records.
+
+Parses the same page of entries two ways and measures the memory retained per object with
+tracemalloc:
+
+- full: Course and CourseReview Pydantic models, each with a ``__dict__`` and a fields set;
+- lean: CourseRecord and CourseReviewRecord, slotted frozen dataclasses validated by
+  pydantic-core.
+
+Usage:
+    python benchmarks/records.py [--entries 10000]
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, List, Tuple, Type
+
+from parse_entry import ENTRIES
+
+from pydemy import UdemyClient
+from pydemy.models import Course, CourseRecord, CourseReview, CourseReviewRecord
+
+
+def parse_page(content: bytes, model_class: Type[Any]) -> Tuple[List[Any], float, int]:
+    """Returns the parsed entries, the parse time in ms and the retained bytes per entry."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    parsed = UdemyClient._validate_results(content, model_class)
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return parsed, elapsed * 1e3, retained // len(parsed)
+
+
+def main() -> None:
+    """Parses pages of courses and reviews both ways and prints time and memory."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=10000)
+    args = parser.parse_args()
+
+    print(f"{args.entries} entries       parse (ms)  bytes/entry")
+    for name, model_class, record_class in (
+        ("course", Course, CourseRecord),
+        ("course_review", CourseReview, CourseReviewRecord),
+    ):
+        content = json.dumps({"results": [ENTRIES[name]] * args.entries}).encode()
+        models, model_ms, model_bytes = parse_page(content, model_class)
+        records, record_ms, record_bytes = parse_page(content, record_class)
+        assert records[0].to_model() == models[0]
+        del models, records
+
+        print(f"{name + ' full':<22}{model_ms:10.1f} {model_bytes:12d}")
+        print(f"{name + ' lean':<22}{record_ms:10.1f} {record_bytes:12d}")
+        print(f"{'':<22}{'':10} {model_bytes / record_bytes:11.2f}x smaller")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark serialization of CourseReview models.
+
+Serializes the same reviews two ways:
+
+- before: the previous DateTimeSerializer, a Python ``model_serializer`` that walked
+  ``model_fields`` with ``getattr``/``isinstance`` for every field, with one
+  ``model_dump_json`` call per review joined into an array;
+- after: ISO 8601 datetime fields serialized by pydantic-core, and ``dump_many_json`` writing
+  the whole batch in one pass.
+
+Usage:
+    python benchmarks/serialization.py [--reviews 10000]
+"""
+
+import argparse
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict
+
+from parse_entry import ENTRIES
+from pydantic import BaseModel, model_serializer
+
+from pydemy.models import CourseReview, User, dump_many_json
+
+
+class LegacyDateTimeSerializer(BaseModel):
+    """The DateTimeSerializer mixin as it was before the compiled serializer."""
+
+    @model_serializer()
+    def serialize_datetimes(self) -> Dict[str, Any]:
+        """Converts datetime fields to ISO 8601 format, one field at a time."""
+        model_dict = {}
+        for field_name, _ in self.model_fields.items():
+            field_value = getattr(self, field_name)
+            if isinstance(field_value, datetime):
+                model_dict[field_name] = field_value.isoformat()
+            else:
+                model_dict[field_name] = field_value
+        return model_dict
+
+
+class LegacyCourseReview(LegacyDateTimeSerializer):
+    """CourseReview on top of the legacy mixin."""
+
+    id: int
+    content: str
+    rating: float
+    created: datetime
+    modified: datetime
+    user_modified: datetime
+    user: User
+
+
+def time_batch(serialize: Callable[[], Any], repeat: int = 5) -> float:
+    """Returns the best time of `serialize` in milliseconds over `repeat` runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        serialize()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1e3
+
+
+def main() -> None:
+    """Serializes a batch of reviews both ways and prints the times."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--reviews", type=int, default=10000)
+    args = parser.parse_args()
+
+    entry = ENTRIES["course_review"]
+    legacy = [LegacyCourseReview.model_validate(entry) for _ in range(args.reviews)]
+    reviews = [CourseReview.model_validate(entry) for _ in range(args.reviews)]
+    assert legacy[0].model_dump() == reviews[0].model_dump()
+
+    dump_before = time_batch(lambda: [review.model_dump() for review in legacy])
+    dump_after = time_batch(lambda: [review.model_dump() for review in reviews])
+    json_before = time_batch(
+        lambda: b"[" + b",".join(review.model_dump_json().encode() for review in legacy) + b"]"
+    )
+    json_after = time_batch(lambda: dump_many_json(reviews))
+
+    print(f"{args.reviews} reviews     before (ms)  after (ms)  speedup")
+    for name, before, after in (
+        ("model_dump", dump_before, dump_after),
+        ("JSON array", json_before, json_after),
+    ):
+        print(f"{name:<18}{before:11.1f} {after:11.1f} {before / after:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
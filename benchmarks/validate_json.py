@@ -0,0 +1,67 @@
+"""
+Benchmark per-page parse time of decoding JSON in Python versus validating raw bytes.
+
+Parses the same raw result page two ways:
+
+- before: ``json.loads`` followed by ``BaseClient._parse_entry`` for every entry (decoding into
+  Python dicts first, then validating them);
+- after: ``BaseClient._validate_results``, which validates the raw bytes into the models with a
+  cached pydantic TypeAdapter in a single pass.
+
+Usage:
+    python benchmarks/validate_json.py [--pages 500] [--page-size 100]
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, List
+
+from parse_entry import ENTRIES, MODELS
+
+from pydemy._base_client import BaseClient
+
+
+def parse_before(content: bytes, model_class: Any) -> List[Any]:
+    """Decodes the page into dicts, then validates each entry."""
+    data = json.loads(content)
+    return [BaseClient._parse_entry(entry, model_class) for entry in data["results"]]
+
+
+def time_per_page(parse: Callable[[], Any], pages: int) -> float:
+    """Returns the mean time of `parse` in milliseconds over `pages` calls."""
+    start = time.perf_counter()
+    for _ in range(pages):
+        parse()
+    return (time.perf_counter() - start) / pages * 1e3
+
+
+def main() -> None:
+    """Runs both parsers over course and review pages and prints the per-page times."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"{'page':<14}{'before (ms)':>12}{'after (ms)':>12}{'speedup':>9}")
+    for entry_class in ("course", "course_review"):
+        model_class = MODELS[entry_class]
+        content = json.dumps(
+            {
+                "count": args.page_size,
+                "next": None,
+                "results": [ENTRIES[entry_class]] * args.page_size,
+            }
+        ).encode()
+        assert parse_before(content, model_class) == BaseClient._validate_results(
+            content, model_class
+        )
+        before = time_per_page(lambda: parse_before(content, model_class), args.pages)
+        after = time_per_page(
+            lambda: BaseClient._validate_results(content, model_class), args.pages
+        )
+        print(f"{entry_class:<14}{before:>12.3f}{after:>12.3f}{before / after:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -43,8 +43,8 @@ async def main():
                         print("\n\t- Transcript Available (content not shown here)")
                 elif isinstance(entry, Quiz):
                     print("\n\t- Type: Quiz")
-                    print("\n\t- Duration: {entry.duration} seconds")
-                    print("\n\t- Pass Percentage: {entry.pass_percent:.2f}")
+                    print(f"\n\t- Duration: {entry.duration} seconds")
+                    print(f"\n\t- Pass Percentage: {entry.pass_percent:.2f}")
 
         except Exception as exc:
             print(f"Error retrieving course curriculum: {exc}")
@@ -1,9 +1,66 @@
 """Python library for interacting with the Udemy Affiliate API."""
 
 __author__ = "mertigenet@gmail.com"
-__all__ = ["_exceptions", "models", "AsyncUdemyClient", "UdemyClient"]
+__all__ = [
+    "_exceptions",
+    "models",
+    "AdaptiveLimiter",
+    "AsyncJSONLWriter",
+    "AsyncUdemyClient",
+    "CacheBackend",
+    "CachedResponse",
+    "CacheStats",
+    "CatalogSync",
+    "CircuitBreaker",
+    "CircuitState",
+    "CircuitStatus",
+    "ColumnTable",
+    "CourseColumns",
+    "CourseDetailsResult",
+    "CourseEnrichment",
+    "CourseIndex",
+    "CurriculumSection",
+    "DictionaryColumn",
+    "FileTokenBucket",
+    "HedgingPolicy",
+    "JSONLWriter",
+    "LimitChange",
+    "MemoryCache",
+    "RateLimiter",
+    "RetryAttempt",
+    "RetryPolicy",
+    "ReviewColumns",
+    "ReviewStats",
+    "SQLiteCache",
+    "StringColumn",
+    "SyncPartition",
+    "SyncStats",
+    "TokenBucket",
+    "TrendPoint",
+    "UdemyClient",
+    "export_jsonl",
+    "export_jsonl_async",
+]
 
 
 from . import _exceptions, models
+from ._analytics import ReviewStats, TrendPoint
 from ._async_client import AsyncUdemyClient
+from ._cache import CacheBackend, CachedResponse, CacheStats, MemoryCache, SQLiteCache
+from ._circuit import CircuitBreaker, CircuitState, CircuitStatus
 from ._client import UdemyClient
+from ._columns import (
+    ColumnTable,
+    CourseColumns,
+    DictionaryColumn,
+    ReviewColumns,
+    StringColumn,
+)
+from ._concurrency import AdaptiveLimiter, LimitChange
+from ._export import AsyncJSONLWriter, JSONLWriter, export_jsonl, export_jsonl_async
+from ._hedging import HedgingPolicy
+from ._index import CourseIndex
+from ._rate_limit import FileTokenBucket, RateLimiter, TokenBucket
+from ._results import CourseDetailsResult, CourseEnrichment, CurriculumSection
+from ._retry import RetryAttempt, RetryPolicy
+from ._sync import CatalogSync, SyncPartition, SyncStats
@@ -0,0 +1,220 @@
+"""Incrementally updatable rating statistics over the reviews of a course."""
+
+import math
+from collections import Counter
+from datetime import datetime, timedelta
+from itertools import repeat
+from operator import floordiv, mul
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Union
+
+from ._columns import _EPOCH, _MICROSECOND, ReviewColumns, _epoch_us
+
+
+class TrendPoint(NamedTuple):
+    """Number and mean rating of the reviews created in one time bucket."""
+
+    start: datetime
+    count: int
+    mean: float
+
+
+class ReviewStats:
+    """
+    Rating statistics of a course's reviews, updated page by page.
+
+    Reviews are not kept: each update counts them into a joint histogram of (time bucket of
+    `created`, half-star rating) in a single C-level counting pass. Every statistic is then
+    computed from that histogram, so queries cost time proportional to the number of buckets,
+    not reviews, and the stats of thousands of courses fit in memory and refresh quickly.
+
+    Ratings are binned to the nearest half star, which is exact for Udemy ratings; time-based
+    statistics (trend, since, weighted_mean) have the resolution of `bucket`. Pages must not
+    overlap, since a review added twice is counted twice.
+    """
+
+    def __init__(self, bucket: timedelta = timedelta(days=7)) -> None:
+        """
+        Initializes empty statistics.
+
+        Args:
+            bucket (timedelta, optional): The width of the time buckets of trend and the
+                resolution of the time-based statistics. Defaults to 7 days.
+
+        Raises:
+            ValueError: If bucket is shorter than one microsecond.
+        """
+        if bucket < _MICROSECOND:
+            raise ValueError("bucket must be at least one microsecond")
+        self.bucket = bucket
+        self._bucket_us = bucket // _MICROSECOND
+        self._counts: Counter = Counter()  # (bucket index, rating in half stars) -> reviews
+        self._ratings_total: Counter = Counter()  # Rating in half stars -> reviews
+
+    def __len__(self) -> int:
+        """Returns the number of counted reviews."""
+        return sum(self._ratings_total.values())
+
+    def update(self, reviews: Union[ReviewColumns, Iterable]) -> "ReviewStats":
+        """
+        Counts a batch of reviews, typically one page from get_course_reviews.
+
+        Args:
+            reviews (Union[ReviewColumns, Iterable]): CourseReview models, lean records, or
+                ReviewColumns.
+
+        Returns:
+            ReviewStats: The statistics themselves, for chaining.
+        """
+        if isinstance(reviews, ReviewColumns):
+            created, ratings = reviews["created"], reviews["rating"]
+        else:
+            reviews = reviews if isinstance(reviews, (list, tuple)) else list(reviews)
+            created = [_epoch_us(review.created) for review in reviews]
+            ratings = [review.rating for review in reviews]
+        buckets = map(floordiv, created, repeat(self._bucket_us))
+        half_stars = list(map(round, map(mul, ratings, repeat(2.0))))
+        self._counts.update(zip(buckets, half_stars))
+        self._ratings_total.update(half_stars)
+        return self
+
+    def merge(self, other: "ReviewStats") -> "ReviewStats":
+        """
+        Adds the counts of another ReviewStats, e.g. one built in another worker.
+
+        Args:
+            other (ReviewStats): Statistics with the same bucket width.
+
+        Returns:
+            ReviewStats: The statistics themselves, for chaining.
+
+        Raises:
+            ValueError: If the bucket widths differ.
+        """
+        if other.bucket != self.bucket:
+            raise ValueError("Cannot merge ReviewStats with different bucket widths")
+        self._counts.update(other._counts)
+        self._ratings_total.update(other._ratings_total)
+        return self
+
+    def _bucket_start(self, index: int) -> datetime:
+        """Returns the start time of the bucket with the given index."""
+        return _EPOCH + index * self.bucket
+
+    def _first_bucket(self, since: Optional[datetime]) -> Optional[int]:
+        """Returns the index of the first bucket starting at or after `since`, if given."""
+        return None if since is None else -(-_epoch_us(since) // self._bucket_us)
+
+    def _ratings(self, since: Optional[datetime] = None) -> Dict[int, int]:
+        """Returns review counts by rating in half stars, of buckets starting at `since`."""
+        if since is None:
+            return dict(sorted(self._ratings_total.items()))
+        first = self._first_bucket(since)
+        ratings: Counter = Counter()
+        for (index, half_stars), count in self._counts.items():
+            if index >= first:
+                ratings[half_stars] += count
+        return dict(sorted(ratings.items()))
+
+    def histogram(self, since: Optional[datetime] = None) -> Dict[float, int]:
+        """
+        Returns the number of reviews per rating.
+
+        Args:
+            since (datetime, optional): Only counts the time buckets starting at or after it.
+
+        Returns:
+            Dict[float, int]: Review counts by rating in half-star steps, in rating order.
+        """
+        return {half_stars / 2: count for half_stars, count in self._ratings(since).items()}
+
+    def mean(self, since: Optional[datetime] = None) -> float:
+        """
+        Returns the mean rating, or NaN if there are no reviews.
+
+        Args:
+            since (datetime, optional): Only counts the time buckets starting at or after it,
+                e.g. for the recent sentiment of a course.
+        """
+        ratings = self._ratings(since)
+        count = sum(ratings.values())
+        if not count:
+            return math.nan
+        return sum(half_stars * n for half_stars, n in ratings.items()) / (2 * count)
+
+    def weighted_mean(self, half_life: timedelta) -> float:
+        """
+        Returns the mean rating with exponentially decaying weights by review age.
+
+        A review `half_life` older than another counts half as much, measured between the
+        time buckets of the reviews. Since only relative ages matter, weights are taken
+        relative to the newest bucket, which keeps them from underflowing for old courses.
+
+        Args:
+            half_life (timedelta): The age difference at which a review's weight halves.
+
+        Returns:
+            float: The weighted mean rating, or NaN if there are no reviews.
+        """
+        if not self._counts:
+            return math.nan
+        newest = max(index for index, _ in self._counts)
+        decay = 0.5 ** (self.bucket / half_life)  # Weight ratio between adjacent buckets
+        total = weighted = 0.0
+        for (index, half_stars), count in self._counts.items():
+            weight = decay ** (newest - index) * count
+            total += weight
+            weighted += weight * half_stars
+        return weighted / (2 * total)
+
+    def percentiles(self, qs: Sequence[float] = (10, 50, 90)) -> Dict[float, float]:
+        """
+        Returns rating percentiles using the nearest-rank method.
+
+        Args:
+            qs (Sequence[float], optional): The percentiles to compute, between 0 and 100.
+                Defaults to 10, 50 and 90.
+
+        Returns:
+            Dict[float, float]: The rating at each percentile, or NaN if there are no reviews.
+
+        Raises:
+            ValueError: If a percentile is outside 0 to 100.
+        """
+        if any(not 0 <= q <= 100 for q in qs):
+            raise ValueError("Percentiles must be between 0 and 100")
+        ratings = self._ratings()
+        count = sum(ratings.values())
+        results = {}
+        for q in qs:
+            if not count:
+                results[q] = math.nan
+                continue
+            rank, seen = max(1, math.ceil(q / 100 * count)), 0
+            for half_stars, n in ratings.items():
+                seen += n
+                if seen >= rank:
+                    results[q] = half_stars / 2
+                    break
+        return results
+
+    def trend(self, since: Optional[datetime] = None) -> List[TrendPoint]:
+        """
+        Returns the number and mean rating of reviews per time bucket.
+
+        Args:
+            since (datetime, optional): Only returns buckets starting at or after it.
+
+        Returns:
+            List[TrendPoint]: The buckets that have reviews, oldest first.
+        """
+        first = self._first_bucket(since)
+        counts: Counter = Counter()
+        sums: Counter = Counter()
+        for (index, half_stars), count in self._counts.items():
+            if first is None or index >= first:
+                counts[index] += count
+                sums[index] += half_stars * count
+        return [
+            TrendPoint(self._bucket_start(index), counts[index], sums[index] / (2 * counts[index]))
+            for index in sorted(counts)
+        ]
@@ -1,74 +1,360 @@
 """Asynchronously interact with the Udemy API for courses, reviews, curriculum, and more."""
 
-from typing import List, Self, Union, cast
+import asyncio
+import time
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Self,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 import httpx
 
-from ._base_client import BaseClient
+from ._base_client import BaseClient, ModelT, ResultT
+from ._circuit import CircuitBreaker
+from ._enrichment import EnrichmentPlan
 from ._exceptions import UdemyAPIError
+from ._hedging import HedgingPolicy
+from ._results import CourseDetailsResult, CourseEnrichment, CurriculumSection
 from .models._chapter import Chapter
 from .models._course import Course
 from .models._course_review import CourseReview
+from .models._curriculum import CurriculumItem
 from .models._filters.course_filters import CourseFilter
 from .models._filters.review_filters import ReviewFilter
 from .models._lecture import Lecture
 from .models._quiz import Quiz
+from .models._records import CourseRecord, CourseReviewRecord
 
 
 class AsyncUdemyClient(BaseClient):
-    """Asynchronous client for interacting with the Udemy API."""
+    """
+    Asynchronous client for interacting with the Udemy API.
+
+    All coroutines share one pooled httpx.AsyncClient. It is opened when entering an async with
+    block or, in lazy-open mode, on the first request, and must then be released with aclose().
+    """
+
+    def __init__(
+        self, *args: Any, hedging_policy: Optional[HedgingPolicy] = None, **kwargs: Any
+    ) -> None:
+        """
+        Initializes the asynchronous Udemy client.
+
+        Accepts the same arguments as BaseClient, plus:
+
+        Args:
+            hedging_policy (HedgingPolicy, optional): Duplicates requests that answer slower
+                than usual and uses the first answer. Defaults to None (no hedging).
+        """
+        super().__init__(*args, **kwargs)
+        self._hedging_policy = hedging_policy
+        self._closing_http_clients: Set["asyncio.Task[None]"] = set()
+
+    @property
+    def hedging_policy(self) -> Optional[HedgingPolicy]:
+        """Returns the policy hedging slow requests, or None if there is none."""
+        return self._hedging_policy
 
     async def __aenter__(self) -> Self:
-        """Initializes the client for use within an async with block."""
-        self._http_client = httpx.AsyncClient()
+        """Initializes the client for use within an async with block, reusing an open pool."""
+        self._get_http_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Cleans up resources when exiting the async with block."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the pooled HTTP client and its keep-alive connections."""
         if hasattr(self, "_http_client"):
             await self._http_client.aclose()
 
-    async def get_courses(self, filters: CourseFilter = CourseFilter()) -> List[Course]:
+    def _open_http_client(self) -> httpx.AsyncClient:
+        """Creates the pooled httpx.AsyncClient bound to the running event loop."""
+        self._http_client_loop = asyncio.get_running_loop()
+        return httpx.AsyncClient(limits=self._limits, http2=self._http2)
+
+    def _get_http_client(self) -> httpx.AsyncClient:
         """
-        Retrieves a list of Udemy courses based on provided search parameters asynchronously.
+        Returns the pooled httpx.AsyncClient, opening it lazily on first use.
+
+        A new pool is also opened after aclose() or when called from a different event loop
+        (e.g. successive asyncio.run calls), since connections cannot cross event loops.
+        """
+        http_client = getattr(self, "_http_client", None)
+        opened_in = getattr(self, "_http_client_loop", None)
+        if (
+            http_client is None
+            or http_client.is_closed
+            or opened_in not in (None, asyncio.get_running_loop())
+        ):
+            if http_client is not None and not http_client.is_closed:
+                self._close_stale_http_client(http_client)
+            http_client = self._http_client = self._open_http_client()
+        return http_client
+
+    def _close_stale_http_client(self, http_client: httpx.AsyncClient) -> None:
+        """
+        Closes a pool opened in another event loop from a task of the running loop.
+
+        If the other loop is closed, its connections cannot be shut down cleanly any more; the
+        pool is still marked closed and their sockets are released with their transports.
+        """
+
+        async def aclose() -> None:
+            try:
+                await http_client.aclose()
+            except RuntimeError:  # Event loop is closed
+                pass
+            finally:
+                self._closing_http_clients.discard(task)
+
+        task = asyncio.get_running_loop().create_task(aclose())
+        self._closing_http_clients.add(task)  # Keeps the task alive until it finishes
+
+    async def _get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Sends a GET request asynchronously, serving it from the cache when possible.
 
         Args:
-            filters (CourseFilter, optional): A namedtuple containing optional filters.
+            url (str): The absolute URL of the API endpoint.
+            params (Dict[str, Any], optional): Query parameters for the request.
+            headers (Dict[str, str], optional): Extra request headers.
 
         Returns:
-            A list of Course objects representing the retrieved courses.
+            The httpx.Response object of a successful (2xx) or 304 Not Modified request. A 304
+            revalidating an expired cache entry is answered with the cached body instead.
 
         Raises:
-            UdemyAPIError: If there's an error communicating with the API or the response status
-                code indicates an error.
+            httpx.HTTPStatusError: If the response status code indicates an error.
+            httpx.RequestError: If the request could not be sent.
+        """
+        cache_key = stale = None
+        if self._cache is not None:
+            cache_key = self._cache_key(url, params)
+            content = self._cache.get(cache_key)
+            if content is not None:
+                return self._cached_response(url, params, content)
+            stale = self._stale_cache_entry(cache_key, headers)
+
+        response = await self._send(url, params, headers or (stale.headers if stale else None))
+        if response.status_code == 304:
+            return self._revalidated(url, params, headers, stale, response)
+        response.raise_for_status()  # Raise exception for non-2xx status codes
+        if cache_key is not None:
+            self._cache.set_with_validators(
+                cache_key,
+                response.content,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+        return response
+
+    async def _send(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Sends a GET request to the API asynchronously, guarded by the circuit breaker,
+        throttled by the rate limiter and the concurrency limiter, hedged by the hedging policy
+        and retried according to the retry policy.
+
+        Args:
+            url (str): The absolute URL of the API endpoint.
+            params (Dict[str, Any], optional): Query parameters for the request.
+            headers (Dict[str, str], optional): Extra request headers.
+
+        Returns:
+            The httpx.Response object of the final attempt, whatever its status code.
+
+        Raises:
+            httpx.RequestError: If the final attempt could not be sent.
+            CircuitOpenError: If the circuit breaker rejects an attempt.
         """
+        attempt = 0
+        while True:
+            attempt += 1
+            started, response, error = await self._attempt(
+                url, lambda: self._send_once(url, params, headers)
+            )
+            delay = self._retry_delay(url, attempt, started, response, error)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            if response is not None:
+                await response.aclose()
+            await asyncio.sleep(delay)
+
+    async def _attempt(
+        self, url: str, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> Tuple[Optional[float], Optional[httpx.Response], Optional[httpx.RequestError]]:
+        """
+        Sends a request through the circuit breaker, the rate limiter and the concurrency
+        limiter, reporting how it ended to them.
+
+        Args:
+            url (str): The absolute URL of the API endpoint.
+            send (Callable[[], Awaitable[httpx.Response]]): Sends the request once admitted.
 
-        url = self._base_url + "courses/"
-        query_params = {
-            key: str(value) for key, value in filters.model_dump(exclude_unset=True).items()
-        }
+        Returns:
+            Tuple: The time.perf_counter() value at which the request was sent, and its
+                response or its transport error.
 
+        Raises:
+            CircuitOpenError: If the circuit breaker rejects the request.
+        """
+        endpoint, probe = self._enter_circuit(url)
+        started = response = error = None
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url=url, params=query_params, auth=self._auth, timeout=self._timeout
-                )
-                response.raise_for_status()  # Raise exception for non-2xx status codes
-                data = response.json()
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire_async()
+            if self._concurrency_limiter is not None:
+                await self._concurrency_limiter.acquire_async()
+            started = time.perf_counter()
+            try:
+                response = await send()
+            except httpx.RequestError as exc:
+                error = exc
+        finally:
+            self._exit_attempt(endpoint, probe, started, response, error)
+        return started, response, error
+
+    async def _send_once(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Sends one attempt of a GET request, hedged by the hedging policy if there is one.
+
+        Hedges are sent through _attempt like any other request, so they count against the
+        rate limit, the concurrency limit and the circuit breaker; one that is rejected or
+        throttled past the primary's answer is simply lost to it.
+
+        Args:
+            url (str): The absolute URL of the API endpoint.
+            params (Dict[str, Any], optional): Query parameters for the request.
+            headers (Dict[str, str], optional): Extra request headers.
+
+        Returns:
+            The httpx.Response object of the first request to answer, whatever its status code.
+
+        Raises:
+            httpx.RequestError: If no request could be sent.
+        """
+        http_client = self._get_http_client()
+
+        def send() -> Awaitable[httpx.Response]:
+            return http_client.get(
+                url=url, params=params, headers=headers, auth=self._auth, timeout=self._timeout
+            )
+
+        async def hedge() -> httpx.Response:
+            _, response, error = await self._attempt(url, send)
+            if error is not None:
+                raise error
+            return response
+
+        if self._hedging_policy is None:
+            return await send()
+        return await self._hedging_policy.run(CircuitBreaker.endpoint(url), send, hedge)
+
+    async def _fetch(
+        self, url: str, params: Optional[Dict[str, Any]], parse: Callable[[bytes], ResultT]
+    ) -> ResultT:
+        """
+        Sends a GET request asynchronously and parses the JSON response body, coalescing
+        identical calls.
 
-            # Extract course entries based on the response format
-            course_entries = cast(dict, data).get("results", [data])
-            if not isinstance(course_entries, list):
-                raise UdemyAPIError(f"Unexpected response format: {data}")
+        With request coalescing enabled, coroutines issuing the same request while it is in
+        flight await the first one's task and share its parsed result (or error) instead of
+        sending their own request. Cancelling one waiter does not cancel the shared request.
 
-            courses = []
-            for course_entry in course_entries:
-                parsed_entry = self._parse_entry(course_entry)
-                course = Course(**parsed_entry)
-                courses.append(course)
+        Args:
+            url (str): The absolute URL of the API endpoint.
+            params (Dict[str, Any], optional): Query parameters for the request.
+            parse (Callable[[bytes], ResultT]): Converts the raw JSON body into the result.
+
+        Returns:
+            ResultT: The parsed result.
+
+        Raises:
+            UdemyAPIError: If there's an error communicating with the API or the response
+                status code indicates an error.
+        """
+        if not self._coalesce_requests:
+            return await self._fetch_once(url, params, parse)
+
+        key = (self._cache_key(url, params), parse)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_once(url, params, parse))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self._coalesced_requests += 1
+
+        result = await asyncio.shield(task)
+        return list(result) if isinstance(result, list) else result
+
+    async def _fetch_once(
+        self, url: str, params: Optional[Dict[str, Any]], parse: Callable[[bytes], ResultT]
+    ) -> ResultT:
+        """
+        Sends a GET request asynchronously and parses the JSON response body.
 
-            return courses
+        With conditional requests enabled, the validators of the previous response to the same
+        request are sent along, and a 304 Not Modified reuses the result parsed from it without
+        decoding or validating anything.
 
+        Args:
+            url (str): The absolute URL of the API endpoint.
+            params (Dict[str, Any], optional): Query parameters for the request.
+            parse (Callable[[bytes], ResultT]): Converts the raw JSON body into the result.
+
+        Returns:
+            ResultT: The parsed result.
+
+        Raises:
+            UdemyAPIError: If there's an error communicating with the API or the response
+                status code indicates an error.
+        """
+        cache_key = validators = None
+        if self._validator_cache is not None:
+            # Keyed by parser too: a lean and a full request to one URL keep separate results
+            cache_key = (self._cache_key(url, params), parse)
+            validators = self._validator_cache.get(cache_key)
+
+        try:
+            response = await self._get(
+                url, params=params, headers=validators.headers if validators else None
+            )
+            if validators is not None and response.status_code == 304:
+                self._validator_cache.stats.record("hits")
+                result = validators.result
+                return list(result) if isinstance(result, list) else result
+            result = parse(response.content)
         except httpx.HTTPStatusError as exc:
             raise UdemyAPIError(f"HTTP error {exc.response.status_code}: {exc}") from exc
         except httpx.RequestError as exc:
@@ -76,6 +362,126 @@ class AsyncUdemyClient(BaseClient):
         except ValueError as exc:
             raise UdemyAPIError(f"JSON parsing error: {exc}") from exc
 
+        if cache_key is not None:
+            self._validator_cache.stats.record("misses")
+            self._validator_cache.put(cache_key, response, result)
+        return result
+
+    async def _get_page(
+        self, url: str, model_class: Type[ModelT], params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[ModelT], Optional[str]]:
+        """
+        Fetches one page of a paginated endpoint asynchronously and validates its entries.
+
+        Args:
+            url (str): The URL of the page, either the endpoint or a next page link.
+            model_class (Type[ModelT]): The Pydantic model each entry is parsed into.
+            params (Dict[str, Any], optional): Query parameters for the request.
+
+        Returns:
+            Tuple[List[ModelT], Optional[str]]: The parsed models and the next page link.
+
+        Raises:
+            UdemyAPIError: If there's an error communicating with the API or the response
+                status code indicates an error.
+        """
+        return await self._fetch(url, params, self._page_parser(model_class))
+
+    async def _iter_pages(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        page: int,
+        page_size: Optional[int],
+        model_class: Type[ModelT],
+    ) -> AsyncIterator[ModelT]:
+        """
+        Yields the models of every page of a paginated endpoint by following its next links.
+
+        The next page is fetched in a background task while the current one is consumed, so
+        at most two pages are held in memory at a time.
+
+        Args:
+            url (str): The URL of the endpoint.
+            params (Dict[str, Any]): Query parameters of the first page.
+            page (int): The number of the first page.
+            page_size (int, optional): The number of entries per page.
+            model_class (Type[ModelT]): The Pydantic model each entry is parsed into.
+
+        Yields:
+            ModelT: The parsed models, one at a time and in API order.
+        """
+        pending: Optional[asyncio.Task] = asyncio.ensure_future(
+            self._get_page(url, model_class, params)
+        )
+        try:
+            while pending is not None:
+                models, next_url = await pending
+                pending = None
+                if self._has_next_page(next_url, page, page_size):
+                    pending = asyncio.ensure_future(self._get_page(next_url, model_class))
+                page += 1
+                for model in models:
+                    yield model
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def get_courses(
+        self, filters: CourseFilter = CourseFilter(), lean: bool = False
+    ) -> Union[List[Course], List[CourseRecord]]:
+        """
+        Retrieves a list of Udemy courses based on provided search parameters asynchronously.
+
+        Args:
+            filters (CourseFilter, optional): A namedtuple containing optional filters.
+            lean (bool, optional): Whether to return slotted CourseRecord objects instead of
+                Course models, which take several times less memory. Defaults to False.
+
+        Returns:
+            A list of Course objects, or CourseRecord objects if lean, representing the
+            retrieved courses.
+
+        Raises:
+            UdemyAPIError: If there's an error communicating with the API or the response status
+                code indicates an error.
+        """
+        url = self.base_url + "courses/"
+        parse = self._parse_course_records if lean else self._parse_courses
+        return await self._fetch(url, self._query_params(filters), parse)
+
+    async def iter_courses(
+        self, filters: CourseFilter = CourseFilter(), lean: bool = False
+    ) -> AsyncIterator[Union[Course, CourseRecord]]:
+        """
+        Iterates asynchronously over every Udemy course matching the search parameters.
+
+        Starts at `filters.page` and follows the API's next links, prefetching the next page
+        while the current one is consumed. Iteration stops at the last page or before
+        page * page_size would exceed 10000.
+
+        Args:
+            filters (CourseFilter, optional): A namedtuple containing optional filters.
+            lean (bool, optional): Whether to return slotted CourseRecord objects instead of
+                Course models, which take several times less memory. Defaults to False.
+
+        Yields:
+            Course: The retrieved courses (CourseRecord objects if lean), one at a time.
+
+        Raises:
+            UdemyAPIError: If there's an error communicating with the API or the response status
+                code indicates an error.
+        """
+        url = self.base_url + "courses/"
+        async for course in self._iter_pages(
+            url,
+            self._query_params(filters),
+            filters.page or 1,
+            filters.page_size,
+            CourseRecord if lean else Course,
+        ):
+            yield course
+
     async def get_course_details(self, course_id: int) -> Course:
         """
         Retrieves details of a specified course by its ID and returns a Course object
@@ -91,75 +497,140 @@ class AsyncUdemyClient(BaseClient):
             UdemyAPIError: If there's an error communicating with the API or the response
                 status code indicates an error.
         """
-        url = self._base_url + f"courses/{course_id}/"
+        url = self.base_url + f"courses/{course_id}/"
+        return await self._fetch(url, None, self._parse_course)
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url=url, auth=self._auth, timeout=self._timeout)
-                response.raise_for_status()  # Raise exception for non-2xx status codes
-                course_data = response.json()
+    async def get_many_course_details(
+        self, course_ids: Iterable[int], concurrency: int = 8, ordered: bool = False
+    ) -> AsyncIterator[CourseDetailsResult]:
+        """
+        Retrieves the details of many courses concurrently with bounded parallelism.
 
-            parsed_course_data = self._parse_entry(course_data)
-            course = Course(**parsed_course_data)
+        A semaphore of `concurrency` slots gates task creation, so at most `concurrency`
+        requests are in flight over the shared connection pool. IDs are consumed lazily from
+        `course_ids`, so arbitrarily long ID streams use constant memory.
 
-            return course
+        Args:
+            course_ids (Iterable[int]): The IDs of the courses to retrieve details for.
+            concurrency (int, optional): The maximum number of requests in flight. Defaults to 8.
+            ordered (bool, optional): Whether to yield results in input order instead of
+                completion order. Defaults to False.
 
-        except httpx.HTTPStatusError as exc:
-            raise UdemyAPIError(f"HTTP error {exc.response.status_code}: {exc}") from exc
-        except httpx.RequestError as exc:
-            raise UdemyAPIError(f"Request error: {exc}") from exc
-        except ValueError as exc:
-            raise UdemyAPIError(f"JSON parsing error: {exc}") from exc
+        Yields:
+            CourseDetailsResult: One result per course ID holding either the Course object or
+                the UdemyAPIError raised while retrieving it.
+
+        Raises:
+            ValueError: If concurrency is lower than 1.
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+
+        slots = asyncio.Semaphore(concurrency)
+
+        async def fetch(course_id: int) -> CourseDetailsResult:
+            try:
+                course = await self.get_course_details(course_id)
+                return CourseDetailsResult(course_id, course=course)
+            except UdemyAPIError as exc:
+                return CourseDetailsResult(course_id, error=exc)
+            finally:
+                slots.release()
+
+        in_flight: deque = deque()
+        try:
+            for course_id in course_ids:
+                while slots.locked():
+                    async for result in self._drain_tasks(in_flight, ordered):
+                        yield result
+                await slots.acquire()
+                in_flight.append(asyncio.ensure_future(fetch(course_id)))
+            while in_flight:
+                async for result in self._drain_tasks(in_flight, ordered):
+                    yield result
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    @staticmethod
+    async def _drain_tasks(in_flight: deque, ordered: bool) -> AsyncIterator[Any]:
+        """
+        Waits for in-flight tasks and yields the results of the finished ones.
+
+        Args:
+            in_flight (deque): The tasks in creation order; finished ones are removed.
+            ordered (bool): Whether to only yield the oldest task's result, keeping input order.
+
+        Yields:
+            Any: The results of the finished tasks.
+        """
+        if ordered:
+            yield await in_flight.popleft()
+            return
+        done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+        for task in [task for task in in_flight if task in done]:
+            in_flight.remove(task)
+            yield task.result()
 
     async def get_course_reviews(
-        self, course_id: int, filters: ReviewFilter = ReviewFilter()
-    ) -> List[CourseReview]:
+        self, course_id: int, filters: ReviewFilter = ReviewFilter(), lean: bool = False
+    ) -> Union[List[CourseReview], List[CourseReviewRecord]]:
         """
         Retrieves a list of reviews for a course using review filters asynchronously.
 
         Args:
             course_id (int): The ID of the course to retrieve reviews for.
             filters (ReviewFilter, optional): A namedtuple containing optional filters.
+            lean (bool, optional): Whether to return slotted CourseReviewRecord objects instead
+                of CourseReview models, which take several times less memory.
+                Defaults to False.
 
         Returns:
-            A list of CourseReview objects representing the retrieved reviews.
+            A list of CourseReview objects, or CourseReviewRecord objects if lean,
+            representing the retrieved reviews.
 
         Raises:
             UdemyAPIError: If there's an error communicating with the API or the response
                 status code indicates an error.
         """
-        url = self._base_url + f"courses/{course_id}/reviews/"
-        query_params = {
-            key: str(value) for key, value in filters.model_dump(exclude_unset=True).items()
-        }
+        url = self.base_url + f"courses/{course_id}/reviews/"
+        parse = self._parse_review_records if lean else self._parse_reviews
+        return await self._fetch(url, self._query_params(filters), parse)
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url=url, params=query_params, auth=self._auth, timeout=self._timeout
-                )
-                response.raise_for_status()  # Raise exception for non-2xx status codes
-                data = response.json()
+    async def iter_course_reviews(
+        self, course_id: int, filters: ReviewFilter = ReviewFilter(), lean: bool = False
+    ) -> AsyncIterator[Union[CourseReview, CourseReviewRecord]]:
+        """
+        Iterates asynchronously over every review of a course matching the review filters.
 
-            # Extract course entries based on the response format
-            review_entries = cast(dict, data).get("results", [data])
-            if not isinstance(review_entries, list):
-                raise UdemyAPIError(f"Unexpected response format: {data}")
+        Starts at `filters.page` and follows the API's next links, prefetching the next page
+        while the current one is consumed. Iteration stops at the last page or before
+        page * page_size would exceed 10000.
 
-            reviews = []
-            for review_entry in review_entries:
-                parsed_entry = self._parse_entry(review_entry)
-                review = CourseReview(**parsed_entry)
-                reviews.append(review)
+        Args:
+            course_id (int): The ID of the course to retrieve reviews for.
+            filters (ReviewFilter, optional): A namedtuple containing optional filters.
+            lean (bool, optional): Whether to return slotted CourseReviewRecord objects instead
+                of CourseReview models, which take several times less memory.
+                Defaults to False.
 
-            return reviews
+        Yields:
+            CourseReview: The retrieved reviews (CourseReviewRecord objects if lean), one at a
+                time.
 
-        except httpx.HTTPStatusError as exc:
-            raise UdemyAPIError(f"HTTP error {exc.response.status_code}: {exc}") from exc
-        except httpx.RequestError as exc:
-            raise UdemyAPIError(f"Request error: {exc}") from exc
-        except ValueError as exc:
-            raise UdemyAPIError(f"JSON parsing error: {exc}") from exc
+        Raises:
+            UdemyAPIError: If there's an error communicating with the API or the response
+                status code indicates an error.
+        """
+        url = self.base_url + f"courses/{course_id}/reviews/"
+        async for review in self._iter_pages(
+            url,
+            self._query_params(filters),
+            filters.page or 1,
+            filters.page_size,
+            CourseReviewRecord if lean else CourseReview,
+        ):
+            yield review
 
     async def get_course_public_curriculum(
         self, course_id: int, page: int = 1, page_size: int = 10
@@ -184,38 +655,146 @@ class AsyncUdemyClient(BaseClient):
             UdemyAPIError: If there's an error communicating with the API or the response
                 status code indicates an error.
         """
-        url = self._base_url + f"courses/{course_id}/public-curriculum-items/"
+        url = self.base_url + f"courses/{course_id}/public-curriculum-items/"
         query_params = {"page": page, "page_size": page_size}
+        return await self._fetch(url, query_params, self._parse_curriculum)
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url=url, params=query_params, auth=self._auth, timeout=self._timeout
+    async def iter_course_curriculum(
+        self, course_id: int, page: int = 1, page_size: int = 10
+    ) -> AsyncIterator[Union[Chapter, Quiz, Lecture]]:
+        """
+        Iterates asynchronously over the whole public curriculum of a course, page by page.
+
+        Each page is validated into Chapter, Quiz or Lecture objects in a single pass, selected
+        by the _class attribute; item types without a model are skipped. The next page is
+        prefetched while the current one is consumed.
+
+        Args:
+            course_id (int): The ID of the course to retrieve the public curriculum for.
+            page (int, optional): The page to start at. Defaults to 1.
+            page_size (int, optional): The number of items per page. Defaults to 10.
+
+        Yields:
+            Union[Chapter, Quiz, Lecture]: The curriculum items, one at a time and in order.
+
+        Raises:
+            UdemyAPIError: If there's an error communicating with the API or the response
+                status code indicates an error.
+        """
+        url = self.base_url + f"courses/{course_id}/public-curriculum-items/"
+        query_params = {"page": page, "page_size": page_size}
+        async for item in self._iter_pages(url, query_params, page, page_size, CurriculumItem):
+            yield item
+
+    async def get_full_curriculum(
+        self, course_id: int, page_size: int = 100, concurrency: int = 8
+    ) -> List[CurriculumSection]:
+        """
+        Retrieves the whole public curriculum of a course as a chapter tree.
+
+        The first page tells the total item count; the remaining pages are then requested at
+        once, at most `concurrency` at a time, so the curriculum takes about two round trips
+        instead of one per page. The items are then sorted into course order by their
+        sort_order, since pages may be served or arrive in any order.
+
+        Args:
+            course_id (int): The ID of the course to retrieve the public curriculum for.
+            page_size (int, optional): The number of items per page. Defaults to 100.
+            concurrency (int, optional): The maximum number of pages fetched at the same time.
+                Defaults to 8.
+
+        Returns:
+            List[CurriculumSection]: The chapters in order, each with its lectures and quizzes.
+
+        Raises:
+            UdemyAPIError: If there's an error communicating with the API or the response
+                status code indicates an error.
+            ValueError: If concurrency is lower than 1.
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        url = self.base_url + f"courses/{course_id}/public-curriculum-items/"
+        slots = asyncio.Semaphore(concurrency)
+
+        async def fetch(
+            page: int,
+        ) -> Tuple[List[Union[Chapter, Quiz, Lecture]], Optional[str], Optional[int]]:
+            async with slots:
+                return await self._fetch(
+                    url, {"page": page, "page_size": page_size}, self._parse_curriculum_page
                 )
-                response.raise_for_status()  # Raise exception for non-2xx status codes
-                data = response.json()
-
-            # Extract course entries based on the response format
-            curriculum_entries = cast(dict, data).get("results", [data])
-            if not isinstance(curriculum_entries, list):
-                raise UdemyAPIError(f"Unexpected response format: {data}")
-
-            curriculums = []
-            for entry in curriculum_entries:
-                if entry["_class"] in ["chapter", "quiz"]:
-                    curriculums.append(entry)  # Chapters and Quizs can be directly added
-                elif entry["_class"] == "lecture":
-                    parsed_entry = self._parse_entry(entry)
-                    curriculums.append(parsed_entry)
-                else:
-                    # Don't handle unexpected item types
-                    pass
-
-            return curriculums
 
-        except httpx.HTTPStatusError as exc:
-            raise UdemyAPIError(f"HTTP error {exc.response.status_code}: {exc}") from exc
-        except httpx.RequestError as exc:
-            raise UdemyAPIError(f"Request error: {exc}") from exc
-        except ValueError as exc:
-            raise UdemyAPIError(f"JSON parsing error: {exc}") from exc
+        items, next_url, count = await fetch(1)
+        items = list(items)  # Parsed results may be shared through the caches
+        if count is None:  # Without a count, follow the next links one by one
+            if next_url:
+                async for item in self.iter_course_curriculum(course_id, 2, page_size):
+                    items.append(item)
+            return self._curriculum_tree(items)
+
+        tasks = [
+            asyncio.ensure_future(fetch(page)) for page in self._remaining_pages(count, page_size)
+        ]
+        try:
+            for page_items, _, _ in await asyncio.gather(*tasks):
+                items.extend(page_items)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return self._curriculum_tree(items)
+
+    async def enrich_courses(
+        self,
+        course_ids: Iterable[int],
+        concurrency: int = 8,
+        weights: Optional[Dict[str, int]] = None,
+        review_filters: ReviewFilter = ReviewFilter(),
+        page_size: int = 100,
+    ) -> AsyncIterator[CourseEnrichment]:
+        """
+        Retrieves the details, first page of reviews and full curriculum of many courses.
+
+        Every request of every course is planned as one job graph (see EnrichmentPlan): the
+        curriculum's remaining pages join it once its first page reports the item count. Requests
+        share a budget of `concurrency` units, each taking its part's weight, and a course is
+        yielded as soon as all of its parts are done. IDs are consumed lazily, at most
+        `concurrency` courses at a time.
+
+        Args:
+            course_ids (Iterable[int]): The IDs of the courses to enrich.
+            concurrency (int, optional): The budget units of the requests in flight.
+                Defaults to 8.
+            weights (Dict[str, int], optional): Budget units per request of the "details",
+                "reviews" and "curriculum" parts. Defaults to 1, 1 and 2.
+            review_filters (ReviewFilter, optional): The filters of the review page.
+            page_size (int, optional): The number of items per curriculum page. Defaults to 100.
+
+        Yields:
+            CourseEnrichment: One record per course ID, in completion order, holding the parts
+                retrieved and the UdemyAPIError of each part that failed.
+
+        Raises:
+            ValueError: If concurrency or a weight is lower than 1, or a weight names an
+                unknown part.
+        """
+        plan = EnrichmentPlan(self, course_ids, concurrency, weights, review_filters, page_size)
+        in_flight: Dict[asyncio.Future, Any] = {}
+        try:
+            while True:
+                for job in plan.start():
+                    task = asyncio.ensure_future(self._fetch(job.url, job.params, job.parse))
+                    in_flight[task] = job
+                if not in_flight:
+                    return
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    job = in_flight.pop(task)
+                    try:
+                        finished = plan.finish(job, task.result())
+                    except UdemyAPIError as exc:
+                        finished = plan.finish(job, error=exc)
+                    for enrichment in finished:
+                        yield enrichment
+        finally:
+            for task in in_flight:
+                task.cancel()
@@ -1,20 +1,91 @@
-from typing import Any, Dict
+import json
+import threading
+import time
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+from urllib.parse import urlencode
 
 import httpx
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
+from ._cache import CacheBackend, CachedResponse, ValidatorCache
+from ._circuit import CircuitBreaker
+from ._concurrency import AdaptiveLimiter
 from ._exceptions import UdemyAPIError
-from .models._course import Course, Instructor, Locale, PriceDetail
+from ._rate_limit import RateLimiter
+from ._results import CurriculumSection
+from ._retry import RetryAttempt, RetryPolicy
+from .models._chapter import Chapter
+from .models._course import Course
 from .models._course_review import CourseReview
-from .models._lecture import Asset, Lecture
-from .models._user import User
+from .models._curriculum import CurriculumItem
+from .models._lecture import Lecture
+from .models._quiz import Quiz
+from .models._records import CourseRecord, CourseReviewRecord
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+ResultT = TypeVar("ResultT")
+
+
+class _Page(BaseModel, Generic[ModelT]):
+    """A page of a list endpoint; other keys such as previous are ignored."""
+
+    results: List[ModelT]
+    next: Optional[str] = None
+    count: Optional[int] = None
+
+
+@lru_cache(maxsize=None)
+def _adapter(type_: Any) -> TypeAdapter:
+    """Returns the TypeAdapter of `type_`, building its validator only once per process."""
+    return TypeAdapter(type_)
 
 
 class BaseClient:
     """Base class for Udemy API clients (sync and async)."""
 
     __base_url = "https://www.udemy.com/api-2.0/"
+    _max_result_window = 10000  # The API rejects pages where page * page_size exceeds this
+    # Model of each entry `_class`; nested objects are validated by these models' field types
+    _entry_models: Dict[str, Type[BaseModel]] = {
+        "course": Course,
+        "course_review": CourseReview,
+        "chapter": Chapter,
+        "lecture": Lecture,
+        "quiz": Quiz,
+    }
+    _curriculum_classes = frozenset({"chapter", "lecture", "quiz"})  # Members of CurriculumItem
 
-    def __init__(self, client_id: str, client_secret: str, timeout: int = 5) -> None:
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        timeout: int = 5,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        base_url: Optional[str] = None,
+        cache: Optional[CacheBackend] = None,
+        conditional_requests: bool = False,
+        coalesce_requests: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        concurrency_limiter: Optional[AdaptiveLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
         """
         Initializes the base Udemy client.
 
@@ -23,18 +94,69 @@ class BaseClient:
             client_secret (str): Your Udemy client secret.
             timeout (int, optional): The timeout value in seconds for requests to the Udemy API.
                 Defaults to 5.
+            limits (httpx.Limits, optional): Connection pool limits (maximum connections,
+                keep-alive connections and keep-alive expiry) of the pooled HTTP client.
+                Defaults to httpx's default limits.
+            http2 (bool, optional): Whether the pooled HTTP client negotiates HTTP/2. Requires
+                the optional ``h2`` package (``pip install pydemy[http2]``). Defaults to False.
+            base_url (str, optional): Overrides the Udemy API base URL, e.g. to point the
+                client at a proxy or a local stub server. Defaults to the public API.
+            cache (CacheBackend, optional): A response cache (e.g. MemoryCache) consulted by
+                every endpoint method before sending a request. Defaults to None (no caching).
+            conditional_requests (bool, optional): Whether to remember the ETag/Last-Modified
+                validators of responses and revalidate them with If-None-Match/
+                If-Modified-Since, reusing the previously parsed objects on 304 Not Modified.
+                Defaults to False.
+            coalesce_requests (bool, optional): Whether concurrent identical requests (same
+                endpoint and query parameters) share a single in-flight request and parsed
+                result instead of each hitting the API. Defaults to False.
+            rate_limiter (RateLimiter, optional): A token bucket (e.g. TokenBucket or, to split a
+                quota between processes, FileTokenBucket) every request sent to the API waits
+                on. Cached responses are not throttled. Defaults to None (no throttling).
+            retry_policy (RetryPolicy, optional): Retries transient failures (connection errors,
+                timeouts, 429 and 5xx responses) with exponential backoff and jitter, honoring
+                Retry-After. Defaults to None (every failure is raised immediately).
+            concurrency_limiter (AdaptiveLimiter, optional): Caps the requests in flight,
+                adapting the cap to the observed latency, errors and 429 responses; the
+                `concurrency` of the bulk methods then only bounds it from above. Defaults to
+                None (no cap).
+            circuit_breaker (CircuitBreaker, optional): Fails requests to an endpoint with
+                CircuitOpenError, without waiting for the timeout, while the endpoint's recent
+                error rate is too high. Defaults to None (every request is sent).
         Raises:
-            UdemyAPIError: If either client_id or client_secret is not provided.
+            UdemyAPIError: If either client_id or client_secret is not provided, or HTTP/2 is
+                requested without the h2 package installed.
         """
         if not client_id:
             raise UdemyAPIError("The argument client_id is required.")
         if not client_secret:
             raise UdemyAPIError("The argument client_secret is required.")
+        if http2:
+            try:
+                import h2  # noqa: F401  # pylint: disable=import-outside-toplevel,unused-import
+            except ImportError as exc:
+                raise UdemyAPIError(
+                    "HTTP/2 support requires the h2 package: pip install pydemy[http2]"
+                ) from exc
 
         self._client_id = client_id
         self._client_secret = client_secret
         self._auth = httpx.BasicAuth(self._client_id, self._client_secret)
         self._timeout = httpx.Timeout(timeout)
+        self._limits = limits or httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        self._http2 = http2
+        self._cache = cache
+        self._validator_cache = ValidatorCache() if conditional_requests else None
+        self._coalesce_requests = coalesce_requests
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._concurrency_limiter = concurrency_limiter
+        self._circuit_breaker = circuit_breaker
+        self._coalesced_requests = 0
+        self._in_flight: Dict[Tuple[str, Any], Any] = {}
+        self._in_flight_lock = threading.Lock()
+        if base_url:
+            self.__base_url = base_url if base_url.endswith("/") else base_url + "/"
 
     @property
     def base_url(self) -> str:
@@ -73,6 +195,51 @@ class BaseClient:
         """Returns the httpx.BasicAuth object used for authentication."""
         return self._auth
 
+    @property
+    def limits(self) -> httpx.Limits:
+        """Returns the httpx.Limits object used to size the connection pool."""
+        return self._limits
+
+    @property
+    def http2(self) -> bool:
+        """Returns whether the pooled HTTP client negotiates HTTP/2."""
+        return self._http2
+
+    @property
+    def cache(self) -> Optional[CacheBackend]:
+        """Returns the response cache backend, or None if caching is disabled."""
+        return self._cache
+
+    @property
+    def validator_cache(self) -> Optional[ValidatorCache]:
+        """Returns the store of response validators, or None if conditional requests are off."""
+        return self._validator_cache
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """Returns the rate limiter throttling requests, or None if requests are unthrottled."""
+        return self._rate_limiter
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """Returns the policy retrying failed requests, or None if failures are not retried."""
+        return self._retry_policy
+
+    @property
+    def concurrency_limiter(self) -> Optional[AdaptiveLimiter]:
+        """Returns the adaptive limit on requests in flight, or None if there is none."""
+        return self._concurrency_limiter
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """Returns the circuit breaker failing requests fast, or None if there is none."""
+        return self._circuit_breaker
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Returns how many calls were served by joining an identical in-flight request."""
+        return self._coalesced_requests
+
     @property
     def timeout(self) -> httpx.Timeout:
         """Returns the httpx.Timeout object used for API requests."""
@@ -85,56 +252,427 @@ class BaseClient:
             raise ValueError("Timeout value must be non-negative")
         self._timeout = httpx.Timeout(value)
 
+    def _enter_circuit(self, url: str) -> Tuple[Optional[str], int]:
+        """
+        Admits an attempt through the circuit breaker, if there is one.
+
+        Returns:
+            Tuple[Optional[str], int]: The endpoint of the request (None without a circuit
+                breaker) and the probe token of CircuitBreaker.acquire(), 0 if the attempt is
+                not a probe of a half-open circuit.
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit rejects the attempt.
+        """
+        if self._circuit_breaker is None:
+            return None, 0
+        endpoint = self._circuit_breaker.endpoint(url)
+        return endpoint, self._circuit_breaker.acquire(endpoint)
+
+    def _exit_attempt(
+        self,
+        endpoint: Optional[str],
+        probe: int,
+        started: Optional[float],
+        response: Optional[httpx.Response],
+        error: Optional[Exception],
+    ) -> None:
+        """
+        Reports how an attempt ended to the concurrency limiter and the circuit breaker.
+
+        Args:
+            endpoint (str, optional): The endpoint returned by _enter_circuit.
+            probe (int): The probe token returned by _enter_circuit.
+            started (float, optional): The time.perf_counter() value at which the request was
+                sent, or None if it was abandoned before taking a concurrency slot.
+            response (httpx.Response, optional): The response, if one was received.
+            error (Exception, optional): The transport error, if the request failed. Without
+                a response or an error the attempt was abandoned, e.g. cancelled.
+        """
+        status_code = response.status_code if response is not None else None
+        completed = response is not None or error is not None
+        if self._concurrency_limiter is not None and started is not None:
+            if completed:
+                self._concurrency_limiter.release(time.perf_counter() - started, status_code)
+            else:
+                self._concurrency_limiter.cancel()
+        if endpoint is not None:
+            failed = (status_code is None or status_code >= 500) if completed else None
+            self._circuit_breaker.release(endpoint, failed, probe)
+
+    def _retry_delay(
+        self,
+        url: str,
+        attempt: int,
+        started: float,
+        response: Optional[httpx.Response],
+        error: Optional[Exception],
+    ) -> Optional[float]:
+        """
+        Decides whether a finished attempt is retried and reports it to the retry policy's hook.
+
+        Args:
+            url (str): The URL of the request.
+            attempt (int): The number of the finished attempt (1-based).
+            started (float): The time.perf_counter() value at which the attempt started.
+            response (httpx.Response, optional): The response, if one was received.
+            error (Exception, optional): The transport error, if the request failed.
+
+        Returns:
+            float, optional: The wait in seconds before the next attempt, or None if the
+                outcome is final (always None without a retry policy).
+        """
+        if self._retry_policy is None:
+            return None
+        delay = self._retry_policy.next_delay("GET", attempt, response, error)
+        self._retry_policy.notify(
+            RetryAttempt(
+                method="GET",
+                url=url,
+                attempt=attempt,
+                elapsed=time.perf_counter() - started,
+                status_code=response.status_code if response is not None else None,
+                error=error,
+                delay=delay,
+            )
+        )
+        return delay
+
+    @staticmethod
+    def _query_params(filters: BaseModel) -> Dict[str, str]:
+        """Converts the explicitly set fields of a filter model into query parameters."""
+        return {
+            key: str(value)
+            for key, value in filters.model_dump(mode="json", exclude_unset=True).items()
+        }
+
     @staticmethod
-    def _parse_entry(entry_dict: Dict[str, Any]) -> Dict[str, Any]:
+    def _cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Builds the cache key of a request from its endpoint and normalized query parameters.
+
+        Parameters given in the URL (e.g. next page links) and in `params` are merged and
+        sorted, so equivalent requests share one key regardless of parameter order.
+
+        Args:
+            url (str): The URL of the request.
+            params (Dict[str, Any], optional): Query parameters for the request.
+
+        Returns:
+            str: The cache key.
+        """
+        request_url = httpx.URL(url)
+        if params:
+            request_url = request_url.copy_merge_params(params)
+        query = urlencode(sorted(request_url.params.multi_items()))
+        return f"{request_url.copy_with(query=None)}?{query}"
+
+    def _stale_cache_entry(
+        self, cache_key: str, headers: Optional[Dict[str, str]]
+    ) -> Optional[CachedResponse]:
+        """
+        Returns the expired response cache entry a request can revalidate, if any.
+
+        Only used with conditional requests. An entry whose validators differ from those the
+        caller sends (i.e. an older version of the response) cannot be refreshed by its 304.
+        """
+        if self._validator_cache is None:
+            return None
+        stale = self._cache.get_stale(cache_key)
+        if stale is None or (headers is not None and headers != stale.headers):
+            return None
+        return stale
+
+    def _revalidated(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        stale: Optional[CachedResponse],
+        response: httpx.Response,
+    ) -> httpx.Response:
         """
-        Parses an entry dictionary from the Udemy API response, removing the _class key
-        and transforming it for creating Pydantic objects.
+        Handles a 304 Not Modified, refreshing the revalidated response cache entry.
+
+        Args:
+            url (str): The URL of the request.
+            params (Dict[str, Any], optional): Query parameters for the request.
+            headers (Dict[str, str], optional): The validators the caller sent, if any.
+            stale (CachedResponse, optional): The expired cache entry that was revalidated.
+            response (httpx.Response): The 304 response.
+
+        Returns:
+            The 304 response if the caller sent its own validators (and reuses its own result),
+            otherwise a 200 response with the cached body.
+        """
+        if stale is None:
+            return response
+        self._cache.set_with_validators(
+            self._cache_key(url, params), stale.body, stale.etag, stale.last_modified
+        )
+        if headers is not None:
+            return response
+        return self._cached_response(url, params, stale.body)
+
+    @staticmethod
+    def _cached_response(
+        url: str, params: Optional[Dict[str, Any]], content: bytes
+    ) -> httpx.Response:
+        """Wraps a cached response body in a 200 httpx.Response for the given request."""
+        request = httpx.Request("GET", url, params=params)
+        return httpx.Response(
+            200, content=content, headers={"Content-Type": "application/json"}, request=request
+        )
+
+    @staticmethod
+    def _extract_results(data: Any) -> List[Dict[str, Any]]:
+        """
+        Extracts the result entries of a response, treating a bare object as a single entry.
+
+        Raises:
+            UdemyAPIError: If the results are not a list.
+        """
+        # Extract entries based on the response format
+        entries = cast(dict, data).get("results", [data])
+        if not isinstance(entries, list):
+            raise UdemyAPIError(f"Unexpected response format: {data}")
+        return entries
+
+    @classmethod
+    def _parse_courses(cls, content: bytes) -> List[Course]:
+        """Parses a raw courses response body into Course objects."""
+        return cls._validate_results(content, Course)
+
+    @staticmethod
+    def _parse_course(content: bytes) -> Course:
+        """Parses a raw course details response body into a Course object."""
+        return _adapter(Course).validate_json(content)
+
+    @classmethod
+    def _parse_reviews(cls, content: bytes) -> List[CourseReview]:
+        """Parses a raw course reviews response body into CourseReview objects."""
+        return cls._validate_results(content, CourseReview)
+
+    @classmethod
+    def _parse_course_records(cls, content: bytes) -> List[CourseRecord]:
+        """Parses a raw courses response body into lean CourseRecord objects."""
+        return cls._validate_results(content, CourseRecord)
+
+    @classmethod
+    def _parse_review_records(cls, content: bytes) -> List[CourseReviewRecord]:
+        """Parses a raw course reviews response body into lean CourseReviewRecord objects."""
+        return cls._validate_results(content, CourseReviewRecord)
+
+    @classmethod
+    def _parse_curriculum(cls, content: bytes) -> List[CurriculumItem]:
+        """Parses a raw public curriculum response body, skipping unexpected item types."""
+        return cls._validate_results(content, CurriculumItem)
+
+    @classmethod
+    def _parse_entries(cls, entries: List[Dict[str, Any]], model_class: Any) -> List[Any]:
+        """
+        Parses decoded entries one at a time into `model_class`.
+
+        For CurriculumItem, entries whose `_class` has no model (e.g. practice tests) are
+        skipped instead of failing the whole page.
+        """
+        if model_class is CurriculumItem:
+            return [
+                cls._parse_entry(entry)
+                for entry in entries
+                if isinstance(entry, dict) and entry.get("_class") in cls._curriculum_classes
+            ]
+        return [cls._parse_entry(entry, model_class) for entry in entries]
+
+    @classmethod
+    def _validate_results(cls, content: bytes, model_class: Type[ModelT]) -> List[ModelT]:
+        """
+        Validates the results of a raw list response body into models.
+
+        Well-formed pages are validated straight from the bytes by a cached TypeAdapter in one
+        pass, without building intermediate Python dicts. Anything else (a bare entry, a
+        malformed page, a curriculum item type without a model) goes through the generic
+        decoder so it is handled exactly like an entry-by-entry parse.
+
+        Args:
+            content (bytes): The raw JSON body of the response.
+            model_class (Type[ModelT]): The Pydantic model of the entries, or CurriculumItem.
+
+        Returns:
+            List[ModelT]: The validated models.
+
+        Raises:
+            UdemyAPIError: If the response has an unexpected format.
+            ValueError: If the body is not valid JSON or an entry does not validate.
+        """
+        try:
+            return _adapter(_Page[model_class]).validate_json(content).results
+        except ValidationError:
+            data = json.loads(content)
+        return cls._parse_entries(cls._extract_results(data), model_class)
+
+    @classmethod
+    def _validate_page(
+        cls, content: bytes, model_class: Type[ModelT]
+    ) -> Tuple[List[ModelT], Optional[str]]:
+        """
+        Validates a raw page body of a paginated endpoint into models and its next page link.
+
+        Args:
+            content (bytes): The raw JSON body of the page.
+            model_class (Type[ModelT]): The Pydantic model of the entries, or CurriculumItem.
+
+        Returns:
+            Tuple[List[ModelT], Optional[str]]: The validated models and the URL of the next
+                page, or None on the last page.
+
+        Raises:
+            UdemyAPIError: If the response has no list of results.
+            ValueError: If the body is not valid JSON or an entry does not validate.
+        """
+        try:
+            page = _adapter(_Page[model_class]).validate_json(content)
+            return page.results, page.next
+        except ValidationError:
+            data = json.loads(content)
+        entries, next_url = cls._extract_page(data)
+        return cls._parse_entries(entries, model_class), next_url
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _page_parser(
+        cls, model_class: Type[ModelT]
+    ) -> Callable[[bytes], Tuple[List[ModelT], Optional[str]]]:
+        """Returns the page parser of `model_class`, the same object each time for coalescing."""
+        return partial(cls._validate_page, model_class=model_class)
+
+    @classmethod
+    def _parse_curriculum_page(
+        cls, content: bytes
+    ) -> Tuple[List[Union[Chapter, Lecture, Quiz]], Optional[str], Optional[int]]:
+        """
+        Parses a raw curriculum page body into its items, next page link and total item count.
+
+        Args:
+            content (bytes): The raw JSON body of the page.
+
+        Returns:
+            Tuple[List[Union[Chapter, Lecture, Quiz]], Optional[str], Optional[int]]: The
+                curriculum items, the URL of the next page (None on the last page) and the
+                `count` of items in the whole curriculum, if the API sent it.
+
+        Raises:
+            UdemyAPIError: If the response has no list of results.
+            ValueError: If the body is not valid JSON or an item does not validate.
+        """
+        try:
+            page = _adapter(_Page[CurriculumItem]).validate_json(content)
+            return page.results, page.next, page.count
+        except ValidationError:
+            data = json.loads(content)
+        entries, next_url = cls._extract_page(data)
+        count = data.get("count")
+        return (
+            cls._parse_entries(entries, CurriculumItem),
+            next_url,
+            count if isinstance(count, int) else None,
+        )
+
+    @classmethod
+    def _remaining_pages(cls, count: int, page_size: int) -> range:
+        """Returns the page numbers after the first of `count` items, within the result window."""
+        last_page = min(-(-count // page_size), cls._max_result_window // page_size)
+        return range(2, last_page + 1)
+
+    @staticmethod
+    def _curriculum_tree(
+        items: Iterable[Union[Chapter, Lecture, Quiz]],
+    ) -> List[CurriculumSection]:
+        """
+        Groups curriculum items into chapters with their lectures and quizzes.
+
+        The items are put in course order by their sort_order, which counts down through the
+        course, so pages may be stitched together in any order.
+
+        Args:
+            items (Iterable[Union[Chapter, Lecture, Quiz]]): The items of every page.
+
+        Returns:
+            List[CurriculumSection]: One section per chapter; items before the first chapter
+                form a leading section without a chapter.
+        """
+        sections: List[CurriculumSection] = []
+        for item in sorted(items, key=attrgetter("sort_order"), reverse=True):
+            if isinstance(item, Chapter):
+                sections.append(CurriculumSection(item, []))
+            else:
+                if not sections:
+                    sections.append(CurriculumSection(None, []))
+                sections[-1].items.append(item)
+        return sections
+
+    @staticmethod
+    def _extract_page(data: Any) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Extracts the result entries and the next page link from a paginated API response.
+
+        Args:
+            data (Any): The decoded JSON body of a paginated response.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], Optional[str]]: The raw result entries and the URL of the
+                next page, or None on the last page.
+
+        Raises:
+            UdemyAPIError: If the response has no list of results.
+        """
+        entries = data.get("results") if isinstance(data, dict) else None
+        if not isinstance(entries, list):
+            raise UdemyAPIError(f"Unexpected response format: {data}")
+        return entries, data.get("next")
+
+    @classmethod
+    def _has_next_page(cls, next_url: Optional[str], page: int, page_size: Optional[int]) -> bool:
+        """
+        Checks whether the page after `page` should be fetched.
+
+        Args:
+            next_url (str, optional): The next page link of the current page.
+            page (int): The number of the current page.
+            page_size (int, optional): The number of entries per page. Defaults to 10 if None.
+
+        Returns:
+            bool: True if a next page exists and stays within the page * page_size limit.
+        """
+        return bool(next_url) and (page + 1) * (page_size or 10) <= cls._max_result_window
+
+    @classmethod
+    def _parse_entry(
+        cls, entry_dict: Dict[str, Any], model_class: Optional[Type[ModelT]] = None
+    ) -> ModelT:
+        """
+        Parses an entry dictionary from the Udemy API response into its Pydantic model.
+
+        The model is looked up from the entry's `_class` in `_entry_models` unless given. The
+        raw dictionary is validated in a single pass: nested objects (user, price_detail,
+        visible_instructors, locale, asset) are validated by the model's own field types and
+        `_class` keys are ignored as extra fields, so nothing is copied or validated twice.
 
         Args:
             entry_dict (Dict[str, Any]): A dictionary representing an entry from the Udemy API
                 response.
+            model_class (Type[ModelT], optional): The model (or lean record class) to validate
+                the entry against. Defaults to the model registered for the entry's `_class`.
 
         Returns:
-            Dict[str, Any]: A modified dictionary suitable for creating a Pydantic object.
-        """
-        parsed_data = entry_dict.copy()  # Avoid modifying the original dict
-        parsed_data.pop("_class", None)
-
-        def parse_nested_model(field_name, model_class):
-            if field_name in parsed_data and isinstance(parsed_data[field_name], dict):
-                if model_class:
-                    parsed_data[field_name] = model_class(**parsed_data[field_name])
-                else:
-                    pass
-
-        if "_class" in entry_dict:
-            # Handle top-level model selection
-            model_class = {
-                "course": Course,
-                "course_review": CourseReview,
-                "lecture": Lecture,
-            }.get(entry_dict["_class"])
-
-            if model_class:
-                for field, value in entry_dict.items():
-                    # Parse nested models based on defined classes
-                    parse_nested_model(field, User if field == "user" else None)
-                    parse_nested_model(field, PriceDetail if field == "price_detail" else None)
-                    parse_nested_model(
-                        field, Instructor if field == "visible_instructors" else None
-                    )
-                    parse_nested_model(field, Locale if field == "locale" else None)
-                    parse_nested_model(field, Asset if field == "asset" else None)
-
-                    # Handle lists of nested models
-                    if isinstance(value, list) and any(isinstance(item, dict) for item in value):
-                        model_class_list = {
-                            "visible_instructors": Instructor,
-                        }.get(field)
-                        if model_class_list:
-                            parsed_data[field] = [
-                                model_class_list(**item) if item else item for item in value
-                            ]
-
-        return parsed_data
+            ModelT: The validated model instance.
+
+        Raises:
+            UdemyAPIError: If no model is given or registered for the entry's `_class`.
+            pydantic.ValidationError: If the entry does not validate against the model.
+        """
+        if model_class is None:
+            model_class = cls._entry_models.get(entry_dict.get("_class"))
+            if model_class is None:
+                raise UdemyAPIError(f"Unexpected entry type: {entry_dict.get('_class')}")
+        return _adapter(model_class).validate_python(entry_dict)
@@ -0,0 +1,480 @@
+"""Response caches used by the Udemy clients to avoid repeated API requests and parsing."""
+
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Tuple, Union
+
+import httpx
+
+
+class CacheStats:
+    """Thread-safe hit, miss and eviction counters of a cache backend."""
+
+    def __init__(self) -> None:
+        """Initializes all counters to zero."""
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def record(self, counter: str, count: int = 1) -> None:
+        """
+        Increments a counter.
+
+        Args:
+            counter (str): The counter to increment: hits, misses, evictions or expirations.
+            count (int, optional): The amount to add. Defaults to 1.
+        """
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + count)
+
+    def as_dict(self) -> Dict[str, int]:
+        """Returns a snapshot of the counters, e.g. for exporting to a metrics system."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+def _conditional_headers(etag: Optional[str], last_modified: Optional[str]) -> Dict[str, str]:
+    """Returns the conditional request headers that revalidate a response with these validators."""
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+class CachedResponse(NamedTuple):
+    """A cached response body and the validators it can be revalidated with."""
+
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Returns the conditional request headers that revalidate the response."""
+        return _conditional_headers(self.etag, self.last_modified)
+
+
+class CacheBackend(ABC):
+    """
+    Interface of a response cache backend.
+
+    Backends map a cache key (the endpoint URL with its normalized query parameters) to the raw
+    JSON body of a successful response. Implementations must be safe to call from multiple
+    threads and update `stats` on every lookup.
+    """
+
+    def __init__(self, ttl: Optional[float] = 300) -> None:
+        """
+        Initializes the cache backend.
+
+        Args:
+            ttl (float, optional): The default time to live of entries in seconds, or None to
+                keep entries until they are evicted. Defaults to 300.
+        """
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the cached body for `key`, or None if it is missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """Stores `value` under `key`, expiring after `ttl` seconds (defaults to self.ttl)."""
+
+    def set_with_validators(
+        self,
+        key: str,
+        value: bytes,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Stores `value` under `key` together with the ETag/Last-Modified validators of its
+        response, so the entry can be revalidated once it expires.
+
+        Backends that do not keep validators store the body only.
+        """
+        self.set(key, value, ttl)
+
+    def get_stale(self, key: str) -> Optional[CachedResponse]:
+        """
+        Returns an expired entry for `key` that can be revalidated, with its validators.
+
+        Backends that do not keep expired entries return None.
+        """
+        return None
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Removes the entry for `key` if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes every entry."""
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-process LRU cache with a per-entry TTL and an entry count and size budget.
+
+    Expired entries stored with validators are kept for revalidation until they are evicted.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = 300,
+    ) -> None:
+        """
+        Initializes the in-memory cache.
+
+        Args:
+            max_entries (int, optional): The maximum number of cached responses. Defaults to 1024.
+            max_bytes (int, optional): The maximum total size of cached bodies in bytes, or None
+                for no size limit. Defaults to None.
+            ttl (float, optional): The default time to live of entries in seconds, or None to
+                keep entries until they are evicted. Defaults to 300.
+
+        Raises:
+            ValueError: If max_entries is lower than 1.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[CachedResponse, Optional[float]]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of cached responses, including expired ones not yet purged."""
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Returns the total size of the cached bodies in bytes."""
+        return self._size
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the cached body for `key` and marks it most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.record("misses")
+                return None
+            cached, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                if not cached.etag and not cached.last_modified:
+                    self._remove(key)  # Cannot be revalidated
+                self.stats.record("expirations")
+                self.stats.record("misses")
+                return None
+            self._entries.move_to_end(key)
+            self.stats.record("hits")
+            return cached.body
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """Stores `value` under `key`, evicting least recently used entries over budget."""
+        self.set_with_validators(key, value, None, None, ttl)
+
+    def set_with_validators(
+        self,
+        key: str,
+        value: bytes,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Stores `value` and its validators under `key`, evicting entries over budget."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.max_bytes is not None and len(value) > self.max_bytes:
+                return  # Never fits; caching it would only flush everything else
+            self._entries[key] = (CachedResponse(value, etag, last_modified), expires_at)
+            self._size += len(value)
+            evicted = 0
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._size > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                evicted += 1
+            if evicted:
+                self.stats.record("evictions", evicted)
+
+    def get_stale(self, key: str) -> Optional[CachedResponse]:
+        """Returns the expired entry for `key` if it was stored with validators."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            cached, expires_at = entry
+            if expires_at is None or expires_at > time.monotonic():
+                return None
+            if not cached.etag and not cached.last_modified:
+                return None
+            return cached
+
+    def delete(self, key: str) -> None:
+        """Removes the entry for `key` if present."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: str) -> None:
+        """Removes `key` and updates the size budget; the lock must be held."""
+        cached, _ = self._entries.pop(key)
+        self._size -= len(cached.body)
+
+
+class SQLiteCache(CacheBackend):
+    """
+    Persistent cache storing raw response bodies in a SQLite database.
+
+    The database runs in WAL mode, so several processes (e.g. cron jobs and workers on one
+    host) can read concurrently while one writes, and cached responses survive restarts. Each
+    thread uses its own connection. Expired entries are skipped on lookup and removed in bulk
+    by prune(); until then, those stored with validators can be revalidated, also by a later
+    run.
+    """
+
+    def __init__(
+        self, path: Union[str, os.PathLike], ttl: Optional[float] = 86400, timeout: float = 5.0
+    ) -> None:
+        """
+        Initializes the SQLite cache, creating the database file and table if needed.
+
+        Args:
+            path (Union[str, os.PathLike]): The path of the database file.
+            ttl (float, optional): The default time to live of entries in seconds, or None to
+                keep entries until they are pruned. Defaults to 86400 (one day).
+            timeout (float, optional): How long to wait in seconds for a lock held by another
+                connection before failing. Defaults to 5.0.
+        """
+        super().__init__(ttl)
+        self.path = os.fspath(path)
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, "
+                "body BLOB NOT NULL, fetched_at REAL NOT NULL, expires_at REAL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)"
+            )
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(responses)")}
+            for column in ("etag", "last_modified"):
+                if column not in columns:  # Databases created before validators were stored
+                    connection.execute(f"ALTER TABLE responses ADD COLUMN {column} TEXT")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Returns the calling thread's connection, opening it in WAL mode on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def __len__(self) -> int:
+        """Returns the number of stored responses, including expired ones not yet pruned."""
+        return self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the stored body for `key`, or None if it is missing or expired."""
+        row = (
+            self._connection()
+            .execute("SELECT body, expires_at FROM responses WHERE key = ?", (key,))
+            .fetchone()
+        )
+        if row is None:
+            self.stats.record("misses")
+            return None
+        body, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            self.stats.record("expirations")
+            self.stats.record("misses")
+            return None
+        self.stats.record("hits")
+        return bytes(body)
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """Stores `value` under `key` together with its fetch time."""
+        self.set_with_validators(key, value, None, None, ttl)
+
+    def set_with_validators(
+        self,
+        key: str,
+        value: bytes,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Stores `value` under `key` together with its fetch time and validators."""
+        ttl = self.ttl if ttl is None else ttl
+        fetched_at = time.time()
+        expires_at = fetched_at + ttl if ttl is not None else None
+        with self._connection() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, body, fetched_at, expires_at, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), fetched_at, expires_at, etag, last_modified),
+            )
+
+    def get_stale(self, key: str) -> Optional[CachedResponse]:
+        """Returns the expired entry for `key` if it was stored with validators."""
+        row = (
+            self._connection()
+            .execute(
+                "SELECT body, etag, last_modified FROM responses WHERE key = ? "
+                "AND expires_at <= ? AND (etag IS NOT NULL OR last_modified IS NOT NULL)",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+        return CachedResponse(bytes(row[0]), row[1], row[2]) if row else None
+
+    def fetched_at(self, key: str) -> Optional[float]:
+        """Returns the Unix time at which the response for `key` was fetched, if stored."""
+        row = (
+            self._connection()
+            .execute("SELECT fetched_at FROM responses WHERE key = ?", (key,))
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    def delete(self, key: str) -> None:
+        """Removes the entry for `key` if present."""
+        with self._connection() as connection:
+            connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        with self._connection() as connection:
+            connection.execute("DELETE FROM responses")
+
+    def prune(self, older_than: Optional[float] = None) -> int:
+        """
+        Removes expired entries in bulk.
+
+        Args:
+            older_than (float, optional): Also removes entries fetched more than this many
+                seconds ago, regardless of their TTL. Defaults to None.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        now = time.time()
+        with self._connection() as connection:
+            cursor = connection.execute(
+                "DELETE FROM responses WHERE expires_at <= ? OR fetched_at < ?",
+                (now, now - older_than if older_than is not None else float("-inf")),
+            )
+        if cursor.rowcount:
+            self.stats.record("evictions", cursor.rowcount)
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Closes the database connections of every thread."""
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+class Validators(NamedTuple):
+    """The validators of a response and the result parsed from its body."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    result: Any
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Returns the conditional request headers that revalidate the response."""
+        return _conditional_headers(self.etag, self.last_modified)
+
+
+class ValidatorCache:
+    """
+    LRU store of response validators (ETag, Last-Modified) and their parsed results.
+
+    Used for conditional requests: when the API answers 304 Not Modified, the stored result is
+    reused without downloading, decoding or validating the body again. `stats.hits` counts 304
+    responses and `stats.misses` full responses.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """
+        Initializes the validator cache.
+
+        Args:
+            max_entries (int, optional): The maximum number of remembered responses.
+                Defaults to 1024.
+        """
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, Validators]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of remembered responses."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Validators]:
+        """Returns the validators remembered for `key` and marks them most recently used."""
+        with self._lock:
+            validators = self._entries.get(key)
+            if validators is not None:
+                self._entries.move_to_end(key)
+            return validators
+
+    def put(self, key: Hashable, response: httpx.Response, result: Any) -> None:
+        """
+        Remembers the validators of `response` together with the result parsed from it.
+
+        Responses without an ETag or Last-Modified header are ignored.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        with self._lock:
+            self._entries[key] = Validators(etag, last_modified, result)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.record("evictions")
@@ -0,0 +1,231 @@
+"""Per-endpoint circuit breaker failing requests fast while the API is degraded."""
+
+import itertools
+import re
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Deque, Dict, NamedTuple, Optional
+
+import httpx
+
+from ._exceptions import CircuitOpenError
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+class CircuitState(str, Enum):
+    """The states of an endpoint's circuit."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitStatus(NamedTuple):
+    """Snapshot of one endpoint's circuit, e.g. for a dashboard."""
+
+    state: CircuitState
+    requests: int
+    failures: int
+    failure_rate: float
+    rejected: int
+    opened: int
+    retry_after: float
+
+
+class _Circuit:
+    """The state and recent outcomes of one endpoint."""
+
+    __slots__ = (
+        "state",
+        "outcomes",
+        "opened_at",
+        "probes",
+        "probe_successes",
+        "generation",
+        "rejected",
+        "opened",
+    )
+
+    def __init__(self, window: int) -> None:
+        self.state = CircuitState.CLOSED
+        self.outcomes: Deque[bool] = deque(maxlen=window)  # True for failures
+        self.opened_at = 0.0
+        self.probes = 0
+        self.probe_successes = 0
+        self.generation = 0  # Probe token of the current half-open period
+        self.rejected = 0
+        self.opened = 0
+
+
+class CircuitBreaker:
+    """
+    Fails requests to an endpoint fast while its recent error rate is too high.
+
+    Each endpoint (the URL path with numeric IDs replaced, so every course shares the circuit
+    of e.g. /courses/{id}/reviews/) keeps the outcomes of its last `window` requests; 5xx
+    responses, connection errors and timeouts are failures. Once at least `min_requests`
+    outcomes are known and the failure share reaches `failure_rate`, the circuit opens: requests
+    raise CircuitOpenError at once instead of waiting for the timeout. After `open_seconds` the
+    circuit is half-open and lets up to `half_open_probes` requests through at a time; as many
+    successful probes close it again, while a failed probe opens it for another `open_seconds`.
+
+    The same breaker can be shared by threads, asyncio tasks and clients.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        min_requests: int = 10,
+        open_seconds: float = 30.0,
+        half_open_probes: int = 1,
+    ) -> None:
+        """
+        Initializes the circuit breaker with every circuit closed.
+
+        Args:
+            failure_rate (float, optional): The share of failed requests in the window that
+                opens the circuit, between 0 and 1. Defaults to 0.5.
+            window (int, optional): The number of recent requests per endpoint the rate is
+                computed over. Defaults to 20.
+            min_requests (int, optional): The number of outcomes needed before the circuit may
+                open. Defaults to 10.
+            open_seconds (float, optional): How long an open circuit rejects requests before
+                probing. Defaults to 30.0.
+            half_open_probes (int, optional): The number of probe requests in flight at a time,
+                and of successful probes that close the circuit. Defaults to 1.
+
+        Raises:
+            ValueError: If failure_rate is not between 0 and 1, window, min_requests or
+                half_open_probes is lower than 1, or min_requests exceeds window.
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError("Failure rate must be between 0 and 1")
+        if window < 1 or min_requests < 1 or half_open_probes < 1:
+            raise ValueError("Window, min_requests and half_open_probes must be at least 1")
+        if min_requests > window:
+            raise ValueError("min_requests cannot exceed window")
+        self.failure_rate = failure_rate
+        self.window = window
+        self.min_requests = min_requests
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+        self._generations = itertools.count(1)  # Unique across circuits and reset()
+
+    @staticmethod
+    def endpoint(url: str) -> str:
+        """Returns the endpoint of a request URL: its path with numeric IDs replaced."""
+        return _ID_SEGMENT.sub("/{id}", httpx.URL(url).path)
+
+    def acquire(self, endpoint: str) -> int:
+        """
+        Admits a request to `endpoint`, taking a probe slot if the circuit is half-open.
+
+        Args:
+            endpoint (str): The endpoint of the request, see endpoint().
+
+        Returns:
+            int: The probe token to pass to release(), identifying the half-open period the
+                request probes, or 0 if the request is not a probe.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with every probe slot taken.
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                circuit = self._circuits[endpoint] = _Circuit(self.window)
+            if circuit.state is CircuitState.CLOSED:
+                return 0
+            retry_after = circuit.opened_at + self.open_seconds - time.monotonic()
+            if circuit.state is CircuitState.OPEN and retry_after <= 0:
+                circuit.state = CircuitState.HALF_OPEN
+                circuit.probes = circuit.probe_successes = 0
+                circuit.generation = next(self._generations)
+            if circuit.state is CircuitState.HALF_OPEN and circuit.probes < self.half_open_probes:
+                circuit.probes += 1
+                return circuit.generation
+            circuit.rejected += 1
+        raise CircuitOpenError(endpoint, max(0.0, retry_after))
+
+    def release(self, endpoint: str, failed: Optional[bool], probe: int = 0) -> None:
+        """
+        Records the outcome of an admitted request.
+
+        Outcomes that no longer match the circuit's state, such as that of a request admitted
+        while the circuit was closed finishing after it opened, of a probe of an earlier
+        half-open period, or of a request admitted before reset(), are ignored.
+
+        Args:
+            endpoint (str): The endpoint passed to acquire().
+            failed (bool, optional): Whether the request failed, or None if it was abandoned
+                (e.g. cancelled) without an outcome.
+            probe (int, optional): What acquire() returned for the request.
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                return
+            if probe:
+                if circuit.state is not CircuitState.HALF_OPEN or probe != circuit.generation:
+                    return
+                circuit.probes -= 1
+                if failed:
+                    self._open(circuit)
+                elif failed is not None:
+                    circuit.probe_successes += 1
+                    if circuit.probe_successes >= self.half_open_probes:
+                        circuit.state = CircuitState.CLOSED
+                        circuit.outcomes.clear()
+            elif circuit.state is CircuitState.CLOSED and failed is not None:
+                circuit.outcomes.append(failed)
+                requests = len(circuit.outcomes)
+                if requests >= self.min_requests and sum(circuit.outcomes) >= (
+                    self.failure_rate * requests
+                ):
+                    self._open(circuit)
+
+    def state(self, endpoint: str) -> CircuitState:
+        """Returns the state of an endpoint's circuit; unknown endpoints are closed."""
+        status = self.status().get(endpoint)
+        return status.state if status is not None else CircuitState.CLOSED
+
+    def status(self) -> Dict[str, CircuitStatus]:
+        """Returns a snapshot of every endpoint's circuit, e.g. for a dashboard."""
+        now = time.monotonic()
+        with self._lock:
+            snapshot = {}
+            for endpoint, circuit in self._circuits.items():
+                state = circuit.state
+                retry_after = 0.0
+                if state is CircuitState.OPEN:
+                    retry_after = max(0.0, circuit.opened_at + self.open_seconds - now)
+                    if retry_after == 0:
+                        state = CircuitState.HALF_OPEN  # On the next request
+                requests, failures = len(circuit.outcomes), sum(circuit.outcomes)
+                snapshot[endpoint] = CircuitStatus(
+                    state,
+                    requests,
+                    failures,
+                    failures / requests if requests else 0.0,
+                    circuit.rejected,
+                    circuit.opened,
+                    retry_after,
+                )
+            return snapshot
+
+    def reset(self) -> None:
+        """Closes every circuit and forgets all outcomes."""
+        with self._lock:
+            self._circuits.clear()
+
+    def _open(self, circuit: _Circuit) -> None:
+        """Opens a circuit for open_seconds. Requires the lock."""
+        circuit.state = CircuitState.OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.opened += 1
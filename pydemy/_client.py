@@ -1,73 +1,268 @@
 """Interact with the Udemy API for courses, reviews, curriculum, and more."""
 
-from typing import List, Self, Union, cast
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Self,
+    Tuple,
+    Type,
+    Union,
+)
 
 import httpx
 
-from ._base_client import BaseClient
+from ._base_client import BaseClient, ModelT, ResultT
+from ._enrichment import EnrichmentPlan
 from ._exceptions import UdemyAPIError
+from ._results import CourseDetailsResult, CourseEnrichment, CurriculumSection
 from .models._chapter import Chapter
 from .models._course import Course
 from .models._course_review import CourseReview
+from .models._curriculum import CurriculumItem
 from .models._filters.course_filters import CourseFilter
 from .models._filters.review_filters import ReviewFilter
 from .models._lecture import Lecture
 from .models._quiz import Quiz
+from .models._records import CourseRecord, CourseReviewRecord
 
 
 class UdemyClient(BaseClient):
     """Synchronous client for interacting with the Udemy API."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initializes the synchronous Udemy client.
+
+        Accepts the same arguments as BaseClient. The pooled httpx.Client is opened lazily on
+        the first request (or when entering a with block) and reused by every endpoint method.
+        """
+        super().__init__(*args, **kwargs)
+        self._http_client_lock = threading.Lock()
+
     def __enter__(self) -> Self:
-        """Initializes the client for use within a with block."""
-        self._http_client = httpx.Client()
+        """Initializes the client for use within a with block, reusing a pool already open."""
+        self._get_http_client()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Cleans up resources when exiting the with block."""
-        if hasattr(self, "_http_client"):
-            self._http_client.close()
+        self.close()
+
+    def close(self) -> None:
+        """Closes the pooled HTTP client and its keep-alive connections."""
+        with self._http_client_lock:
+            if hasattr(self, "_http_client"):
+                self._http_client.close()
+
+    def _open_http_client(self) -> httpx.Client:
+        """Creates the pooled httpx.Client from the configured limits and HTTP/2 mode."""
+        return httpx.Client(limits=self._limits, http2=self._http2)
+
+    def _get_http_client(self) -> httpx.Client:
+        """Returns the pooled httpx.Client, opening it on first use or after close()."""
+        http_client = getattr(self, "_http_client", None)
+        if http_client is None or http_client.is_closed:
+            with self._http_client_lock:
+                http_client = getattr(self, "_http_client", None)
+                if http_client is None or http_client.is_closed:
+                    http_client = self._http_client = self._open_http_client()
+        return http_client
+
+    def _get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Sends a GET request through the pooled HTTP client, or serves it from the cache.
 
-    def get_courses(self, filters: CourseFilter = CourseFilter()) -> List[Course]:
+        Args:
+            url (str): The absolute URL of the API endpoint.
+            params (Dict[str, Any], optional): Query parameters for the request.
+            headers (Dict[str, str], optional): Extra request headers.
+
+        Returns:
+            The httpx.Response object of a successful (2xx) or 304 Not Modified request. A 304
+            revalidating an expired cache entry is answered with the cached body instead.
+
+        Raises:
+            httpx.HTTPStatusError: If the response status code indicates an error.
+            httpx.RequestError: If the request could not be sent.
         """
-        Retrieves a list of Udemy courses based on provided search parameters.
+        cache_key = stale = None
+        if self._cache is not None:
+            cache_key = self._cache_key(url, params)
+            content = self._cache.get(cache_key)
+            if content is not None:
+                return self._cached_response(url, params, content)
+            stale = self._stale_cache_entry(cache_key, headers)
+
+        response = self._send(url, params, headers or (stale.headers if stale else None))
+        if response.status_code == 304:
+            return self._revalidated(url, params, headers, stale, response)
+        response.raise_for_status()  # Raise exception for non-2xx status codes
+        if cache_key is not None:
+            self._cache.set_with_validators(
+                cache_key,
+                response.content,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+        return response
+
+    def _send(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Sends a GET request to the API, guarded by the circuit breaker, throttled by the rate
+        limiter and the concurrency limiter and retried according to the retry policy.
 
         Args:
-            filters (CourseFilter, optional): A namedtuple containing optional filters.
+            url (str): The absolute URL of the API endpoint.
+            params (Dict[str, Any], optional): Query parameters for the request.
+            headers (Dict[str, str], optional): Extra request headers.
 
         Returns:
-            A list of Course objects representing the retrieved courses.
+            The httpx.Response object of the final attempt, whatever its status code.
 
         Raises:
-            UdemyAPIError: If there's an error communicating with the API or the response status
-                code indicates an error.
+            httpx.RequestError: If the final attempt could not be sent.
+            CircuitOpenError: If the circuit breaker rejects an attempt.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            endpoint, probe = self._enter_circuit(url)
+            started = response = error = None
+            try:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire()
+                if self._concurrency_limiter is not None:
+                    self._concurrency_limiter.acquire()
+                started = time.perf_counter()
+                try:
+                    response = self._get_http_client().get(
+                        url=url,
+                        params=params,
+                        headers=headers,
+                        auth=self._auth,
+                        timeout=self._timeout,
+                    )
+                except httpx.RequestError as exc:
+                    error = exc
+            finally:
+                self._exit_attempt(endpoint, probe, started, response, error)
+
+            delay = self._retry_delay(url, attempt, started, response, error)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            if response is not None:
+                response.close()
+            time.sleep(delay)
+
+    def _fetch(
+        self, url: str, params: Optional[Dict[str, Any]], parse: Callable[[bytes], ResultT]
+    ) -> ResultT:
         """
+        Sends a GET request and parses the JSON response body, coalescing identical calls.
 
-        url = self._base_url + "courses/"
-        query_params = {
-            key: str(value) for key, value in filters.model_dump(exclude_unset=True).items()
-        }
+        With request coalescing enabled, threads issuing the same request while it is in flight
+        wait for the first one and share its parsed result (or error) instead of sending their
+        own request. If the first thread is interrupted (e.g. by KeyboardInterrupt), the others
+        raise concurrent.futures.CancelledError.
 
-        try:
-            response = httpx.get(
-                url=url, params=query_params, auth=self._auth, timeout=self._timeout
-            )
-            response.raise_for_status()  # Raise exception for non-2xx status codes
-            data = response.json()
+        Args:
+            url (str): The absolute URL of the API endpoint.
+            params (Dict[str, Any], optional): Query parameters for the request.
+            parse (Callable[[bytes], ResultT]): Converts the raw JSON body into the result.
 
-            # Extract course entries based on the response format
-            course_entries = cast(dict, data).get("results", [data])
-            if not isinstance(course_entries, list):
-                raise UdemyAPIError(f"Unexpected response format: {data}")
+        Returns:
+            ResultT: The parsed result.
+
+        Raises:
+            UdemyAPIError: If there's an error communicating with the API or the response
+                status code indicates an error.
+            CancelledError: If the coalesced request was interrupted in another thread.
+        """
+        if not self._coalesce_requests:
+            return self._fetch_once(url, params, parse)
+
+        key = (self._cache_key(url, params), parse)
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._in_flight[key] = Future()
+            else:
+                self._coalesced_requests += 1
+
+        if is_leader:
+            try:
+                future.set_result(self._fetch_once(url, params, parse))
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                future.set_exception(exc)
+            except BaseException:
+                future.cancel()  # KeyboardInterrupt etc. stay with the leader's thread
+                raise
+            finally:
+                with self._in_flight_lock:
+                    del self._in_flight[key]
+
+        result = future.result()
+        return list(result) if isinstance(result, list) else result
+
+    def _fetch_once(
+        self, url: str, params: Optional[Dict[str, Any]], parse: Callable[[bytes], ResultT]
+    ) -> ResultT:
+        """
+        Sends a GET request and parses the JSON response body.
 
-            courses = []
-            for course_entry in course_entries:
-                parsed_entry = self._parse_entry(course_entry)
-                course = Course(**parsed_entry)
-                courses.append(course)
+        With conditional requests enabled, the validators of the previous response to the same
+        request are sent along, and a 304 Not Modified reuses the result parsed from it without
+        decoding or validating anything.
 
-            return courses
+        Args:
+            url (str): The absolute URL of the API endpoint.
+            params (Dict[str, Any], optional): Query parameters for the request.
+            parse (Callable[[bytes], ResultT]): Converts the raw JSON body into the result.
+
+        Returns:
+            ResultT: The parsed result.
 
+        Raises:
+            UdemyAPIError: If there's an error communicating with the API or the response
+                status code indicates an error.
+        """
+        cache_key = validators = None
+        if self._validator_cache is not None:
+            # Keyed by parser too: a lean and a full request to one URL keep separate results
+            cache_key = (self._cache_key(url, params), parse)
+            validators = self._validator_cache.get(cache_key)
+
+        try:
+            response = self._get(
+                url, params=params, headers=validators.headers if validators else None
+            )
+            if validators is not None and response.status_code == 304:
+                self._validator_cache.stats.record("hits")
+                result = validators.result
+                return list(result) if isinstance(result, list) else result
+            result = parse(response.content)
         except httpx.HTTPStatusError as exc:
             raise UdemyAPIError(f"HTTP error {exc.response.status_code}: {exc}") from exc
         except httpx.RequestError as exc:
@@ -75,6 +270,123 @@ class UdemyClient(BaseClient):
         except ValueError as exc:
             raise UdemyAPIError(f"JSON parsing error: {exc}") from exc
 
+        if cache_key is not None:
+            self._validator_cache.stats.record("misses")
+            self._validator_cache.put(cache_key, response, result)
+        return result
+
+    def _get_page(
+        self, url: str, model_class: Type[ModelT], params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[ModelT], Optional[str]]:
+        """
+        Fetches one page of a paginated endpoint and validates its entries.
+
+        Args:
+            url (str): The URL of the page, either the endpoint or a next page link.
+            model_class (Type[ModelT]): The Pydantic model each entry is parsed into.
+            params (Dict[str, Any], optional): Query parameters for the request.
+
+        Returns:
+            Tuple[List[ModelT], Optional[str]]: The parsed models and the next page link.
+
+        Raises:
+            UdemyAPIError: If there's an error communicating with the API or the response
+                status code indicates an error.
+        """
+        return self._fetch(url, params, self._page_parser(model_class))
+
+    def _iter_pages(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        page: int,
+        page_size: Optional[int],
+        model_class: Type[ModelT],
+    ) -> Iterator[ModelT]:
+        """
+        Yields the models of every page of a paginated endpoint by following its next links.
+
+        The next page is fetched in a background thread while the current one is consumed, so
+        at most two pages are held in memory at a time.
+
+        Args:
+            url (str): The URL of the endpoint.
+            params (Dict[str, Any]): Query parameters of the first page.
+            page (int): The number of the first page.
+            page_size (int, optional): The number of entries per page.
+            model_class (Type[ModelT]): The Pydantic model each entry is parsed into.
+
+        Yields:
+            ModelT: The parsed models, one at a time and in API order.
+        """
+        prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pydemy-prefetch")
+        pending: Optional[Future] = prefetcher.submit(self._get_page, url, model_class, params)
+        try:
+            while pending is not None:
+                models, next_url = pending.result()
+                pending = None
+                if self._has_next_page(next_url, page, page_size):
+                    pending = prefetcher.submit(self._get_page, next_url, model_class)
+                page += 1
+                for model in models:
+                    yield model
+        finally:
+            prefetcher.shutdown(wait=False, cancel_futures=True)
+
+    def get_courses(
+        self, filters: CourseFilter = CourseFilter(), lean: bool = False
+    ) -> Union[List[Course], List[CourseRecord]]:
+        """
+        Retrieves a list of Udemy courses based on provided search parameters.
+
+        Args:
+            filters (CourseFilter, optional): A namedtuple containing optional filters.
+            lean (bool, optional): Whether to return slotted CourseRecord objects instead of
+                Course models, which take several times less memory. Defaults to False.
+
+        Returns:
+            A list of Course objects, or CourseRecord objects if lean, representing the
+            retrieved courses.
+
+        Raises:
+            UdemyAPIError: If there's an error communicating with the API or the response status
+                code indicates an error.
+        """
+        url = self.base_url + "courses/"
+        parse = self._parse_course_records if lean else self._parse_courses
+        return self._fetch(url, self._query_params(filters), parse)
+
+    def iter_courses(
+        self, filters: CourseFilter = CourseFilter(), lean: bool = False
+    ) -> Iterator[Union[Course, CourseRecord]]:
+        """
+        Iterates over every Udemy course matching the search parameters, page by page.
+
+        Starts at `filters.page` and follows the API's next links, prefetching the next page
+        while the current one is consumed. Iteration stops at the last page or before
+        page * page_size would exceed 10000.
+
+        Args:
+            filters (CourseFilter, optional): A namedtuple containing optional filters.
+            lean (bool, optional): Whether to return slotted CourseRecord objects instead of
+                Course models, which take several times less memory. Defaults to False.
+
+        Yields:
+            Course: The retrieved courses (CourseRecord objects if lean), one at a time.
+
+        Raises:
+            UdemyAPIError: If there's an error communicating with the API or the response status
+                code indicates an error.
+        """
+        url = self.base_url + "courses/"
+        yield from self._iter_pages(
+            url,
+            self._query_params(filters),
+            filters.page or 1,
+            filters.page_size,
+            CourseRecord if lean else Course,
+        )
+
     def get_course_details(self, course_id: int) -> Course:
         """
         Retrieves details of a specified course by its ID and returns a Course object.
@@ -89,73 +401,131 @@ class UdemyClient(BaseClient):
             UdemyAPIError: If there's an error communicating with the API or the response
                 status code indicates an error.
         """
-        url = self._base_url + f"courses/{course_id}/"
+        url = self.base_url + f"courses/{course_id}/"
+        return self._fetch(url, None, self._parse_course)
 
-        try:
-            response = httpx.get(url=url, auth=self._auth, timeout=self._timeout)
-            response.raise_for_status()  # Raise exception for non-2xx status codes
-            course_data = response.json()
+    def get_many_course_details(
+        self, course_ids: Iterable[int], concurrency: int = 8, ordered: bool = False
+    ) -> Iterator[CourseDetailsResult]:
+        """
+        Retrieves the details of many courses concurrently with bounded parallelism.
 
-            parsed_course_data = self._parse_entry(course_data)
-            course = Course(**parsed_course_data)
+        Requests run on a pool of `concurrency` threads sharing the client's connection pool.
+        IDs are consumed lazily from `course_ids`, so at most `concurrency` requests are in
+        flight and arbitrarily long ID streams use constant memory.
 
-            return course
+        Args:
+            course_ids (Iterable[int]): The IDs of the courses to retrieve details for.
+            concurrency (int, optional): The maximum number of requests in flight. Defaults to 8.
+            ordered (bool, optional): Whether to yield results in input order instead of
+                completion order. Defaults to False.
 
-        except httpx.HTTPStatusError as exc:
-            raise UdemyAPIError(f"HTTP error {exc.response.status_code}: {exc}") from exc
-        except httpx.RequestError as exc:
-            raise UdemyAPIError(f"Request error: {exc}") from exc
-        except ValueError as exc:
-            raise UdemyAPIError(f"JSON parsing error: {exc}") from exc
+        Yields:
+            CourseDetailsResult: One result per course ID holding either the Course object or
+                the UdemyAPIError raised while retrieving it.
+
+        Raises:
+            ValueError: If concurrency is lower than 1.
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+
+        def fetch(course_id: int) -> CourseDetailsResult:
+            try:
+                return CourseDetailsResult(course_id, course=self.get_course_details(course_id))
+            except UdemyAPIError as exc:
+                return CourseDetailsResult(course_id, error=exc)
+
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="pydemy-bulk")
+        in_flight: deque = deque()
+        try:
+            for course_id in course_ids:
+                if len(in_flight) >= concurrency:
+                    yield from self._drain_futures(in_flight, ordered)
+                in_flight.append(executor.submit(fetch, course_id))
+            while in_flight:
+                yield from self._drain_futures(in_flight, ordered)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _drain_futures(in_flight: deque, ordered: bool) -> Iterator[Any]:
+        """
+        Waits for in-flight futures and yields the results of the finished ones.
+
+        Args:
+            in_flight (deque): The futures in submission order; finished ones are removed.
+            ordered (bool): Whether to only yield the oldest future's result, keeping input order.
+
+        Yields:
+            Any: The results of the finished futures.
+        """
+        if ordered:
+            yield in_flight.popleft().result()
+            return
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in [future for future in in_flight if future in done]:
+            in_flight.remove(future)
+            yield future.result()
 
     def get_course_reviews(
-        self, course_id: int, filters: ReviewFilter = ReviewFilter()
-    ) -> List[CourseReview]:
+        self, course_id: int, filters: ReviewFilter = ReviewFilter(), lean: bool = False
+    ) -> Union[List[CourseReview], List[CourseReviewRecord]]:
         """
         Retrieves a list of reviews for a course using review filters.
 
         Args:
             course_id (int): The ID of the course to retrieve reviews for.
             filters (ReviewFilter, optional): A namedtuple containing optional filters.
+            lean (bool, optional): Whether to return slotted CourseReviewRecord objects instead
+                of CourseReview models, which take several times less memory.
+                Defaults to False.
 
         Returns:
-            A list of CourseReview objects representing the retrieved reviews.
+            A list of CourseReview objects, or CourseReviewRecord objects if lean,
+            representing the retrieved reviews.
 
         Raises:
             UdemyAPIError: If there's an error communicating with the API or the response
                 status code indicates an error.
         """
-        url = self._base_url + f"courses/{course_id}/reviews/"
-        query_params = {
-            key: str(value) for key, value in filters.model_dump(exclude_unset=True).items()
-        }
+        url = self.base_url + f"courses/{course_id}/reviews/"
+        parse = self._parse_review_records if lean else self._parse_reviews
+        return self._fetch(url, self._query_params(filters), parse)
 
-        try:
-            response = httpx.get(
-                url=url, params=query_params, auth=self._auth, timeout=self._timeout
-            )
-            response.raise_for_status()  # Raise exception for non-2xx status codes
-            data = response.json()
+    def iter_course_reviews(
+        self, course_id: int, filters: ReviewFilter = ReviewFilter(), lean: bool = False
+    ) -> Iterator[Union[CourseReview, CourseReviewRecord]]:
+        """
+        Iterates over every review of a course matching the review filters, page by page.
 
-            # Extract course entries based on the response format
-            review_entries = cast(dict, data).get("results", [data])
-            if not isinstance(review_entries, list):
-                raise UdemyAPIError(f"Unexpected response format: {data}")
+        Starts at `filters.page` and follows the API's next links, prefetching the next page
+        while the current one is consumed. Iteration stops at the last page or before
+        page * page_size would exceed 10000.
 
-            reviews = []
-            for review_entry in review_entries:
-                parsed_entry = self._parse_entry(review_entry)
-                review = CourseReview(**parsed_entry)
-                reviews.append(review)
+        Args:
+            course_id (int): The ID of the course to retrieve reviews for.
+            filters (ReviewFilter, optional): A namedtuple containing optional filters.
+            lean (bool, optional): Whether to return slotted CourseReviewRecord objects instead
+                of CourseReview models, which take several times less memory.
+                Defaults to False.
 
-            return reviews
+        Yields:
+            CourseReview: The retrieved reviews (CourseReviewRecord objects if lean), one at a
+                time.
 
-        except httpx.HTTPStatusError as exc:
-            raise UdemyAPIError(f"HTTP error {exc.response.status_code}: {exc}") from exc
-        except httpx.RequestError as exc:
-            raise UdemyAPIError(f"Request error: {exc}") from exc
-        except ValueError as exc:
-            raise UdemyAPIError(f"JSON parsing error: {exc}") from exc
+        Raises:
+            UdemyAPIError: If there's an error communicating with the API or the response
+                status code indicates an error.
+        """
+        url = self.base_url + f"courses/{course_id}/reviews/"
+        yield from self._iter_pages(
+            url,
+            self._query_params(filters),
+            filters.page or 1,
+            filters.page_size,
+            CourseReviewRecord if lean else CourseReview,
+        )
 
     def get_course_public_curriculum(
         self, course_id: int, page: int = 1, page_size: int = 10
@@ -180,37 +550,142 @@ class UdemyClient(BaseClient):
             UdemyAPIError: If there's an error communicating with the API or the response
                 status code indicates an error.
         """
-        url = self._base_url + f"courses/{course_id}/public-curriculum-items/"
+        url = self.base_url + f"courses/{course_id}/public-curriculum-items/"
         query_params = {"page": page, "page_size": page_size}
+        return self._fetch(url, query_params, self._parse_curriculum)
 
-        try:
-            response = httpx.get(
-                url=url, params=query_params, auth=self._auth, timeout=self._timeout
+    def iter_course_curriculum(
+        self, course_id: int, page: int = 1, page_size: int = 10
+    ) -> Iterator[Union[Chapter, Quiz, Lecture]]:
+        """
+        Iterates over the whole public curriculum of a course, page by page.
+
+        Each page is validated into Chapter, Quiz or Lecture objects in a single pass, selected
+        by the _class attribute; item types without a model are skipped. The next page is
+        prefetched while the current one is consumed.
+
+        Args:
+            course_id (int): The ID of the course to retrieve the public curriculum for.
+            page (int, optional): The page to start at. Defaults to 1.
+            page_size (int, optional): The number of items per page. Defaults to 10.
+
+        Yields:
+            Union[Chapter, Quiz, Lecture]: The curriculum items, one at a time and in order.
+
+        Raises:
+            UdemyAPIError: If there's an error communicating with the API or the response
+                status code indicates an error.
+        """
+        url = self.base_url + f"courses/{course_id}/public-curriculum-items/"
+        query_params = {"page": page, "page_size": page_size}
+        yield from self._iter_pages(url, query_params, page, page_size, CurriculumItem)
+
+    def get_full_curriculum(
+        self, course_id: int, page_size: int = 100, concurrency: int = 8
+    ) -> List[CurriculumSection]:
+        """
+        Retrieves the whole public curriculum of a course as a chapter tree.
+
+        The first page tells the total item count; the remaining pages are then fetched at once
+        on a pool of up to `concurrency` threads, so the curriculum takes about two round trips
+                instead of one per page. The items are then sorted into course order by their
+        sort_order, since pages may be served or arrive in any order.
+
+        Args:
+            course_id (int): The ID of the course to retrieve the public curriculum for.
+            page_size (int, optional): The number of items per page. Defaults to 100.
+            concurrency (int, optional): The maximum number of pages fetched at the same time.
+                Defaults to 8.
+
+        Returns:
+            List[CurriculumSection]: The chapters in order, each with its lectures and quizzes.
+
+        Raises:
+            UdemyAPIError: If there's an error communicating with the API or the response
+                status code indicates an error.
+            ValueError: If concurrency is lower than 1.
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        url = self.base_url + f"courses/{course_id}/public-curriculum-items/"
+
+        def fetch(
+            page: int,
+        ) -> Tuple[List[Union[Chapter, Quiz, Lecture]], Optional[str], Optional[int]]:
+            return self._fetch(
+                url, {"page": page, "page_size": page_size}, self._parse_curriculum_page
             )
-            response.raise_for_status()  # Raise exception for non-2xx status codes
-            data = response.json()
-
-            # Extract course entries based on the response format
-            curriculum_entries = cast(dict, data).get("results", [data])
-            if not isinstance(curriculum_entries, list):
-                raise UdemyAPIError(f"Unexpected response format: {data}")
-
-            curriculums = []
-            for entry in curriculum_entries:
-                if entry["_class"] in ["chapter", "quiz"]:
-                    curriculums.append(entry)  # Chapters and Quizs can be directly added
-                elif entry["_class"] == "lecture":
-                    parsed_entry = self._parse_entry(entry)
-                    curriculums.append(parsed_entry)
-                else:
-                    # Don't handle unexpected item types
-                    pass
-
-            return curriculums
 
-        except httpx.HTTPStatusError as exc:
-            raise UdemyAPIError(f"HTTP error {exc.response.status_code}: {exc}") from exc
-        except httpx.RequestError as exc:
-            raise UdemyAPIError(f"Request error: {exc}") from exc
-        except ValueError as exc:
-            raise UdemyAPIError(f"JSON parsing error: {exc}") from exc
+        items, next_url, count = fetch(1)
+        items = list(items)  # Parsed results may be shared through the caches
+        if count is None:  # Without a count, follow the next links one by one
+            if next_url:
+                items.extend(self.iter_course_curriculum(course_id, 2, page_size))
+            return self._curriculum_tree(items)
+
+        pages = self._remaining_pages(count, page_size)
+        if pages:
+            executor = ThreadPoolExecutor(
+                max_workers=min(concurrency, len(pages)), thread_name_prefix="pydemy-curriculum"
+            )
+            try:
+                for page_items, _, _ in executor.map(fetch, pages):
+                    items.extend(page_items)
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+        return self._curriculum_tree(items)
+
+    def enrich_courses(
+        self,
+        course_ids: Iterable[int],
+        concurrency: int = 8,
+        weights: Optional[Dict[str, int]] = None,
+        review_filters: ReviewFilter = ReviewFilter(),
+        page_size: int = 100,
+    ) -> Iterator[CourseEnrichment]:
+        """
+        Retrieves the details, first page of reviews and full curriculum of many courses.
+
+        Every request of every course is planned as one job graph (see EnrichmentPlan): the
+        curriculum's remaining pages join it once its first page reports the item count. Requests
+        share a budget of `concurrency` units, each taking its part's weight, and a course is
+        yielded as soon as all of its parts are done. IDs are consumed lazily, at most
+        `concurrency` courses at a time.
+
+        Args:
+            course_ids (Iterable[int]): The IDs of the courses to enrich.
+            concurrency (int, optional): The budget units of the requests in flight.
+                Defaults to 8.
+            weights (Dict[str, int], optional): Budget units per request of the "details",
+                "reviews" and "curriculum" parts. Defaults to 1, 1 and 2.
+            review_filters (ReviewFilter, optional): The filters of the review page.
+            page_size (int, optional): The number of items per curriculum page. Defaults to 100.
+
+        Yields:
+            CourseEnrichment: One record per course ID, in completion order, holding the parts
+                retrieved and the UdemyAPIError of each part that failed.
+
+        Raises:
+            ValueError: If concurrency or a weight is lower than 1, or a weight names an
+                unknown part.
+        """
+        plan = EnrichmentPlan(self, course_ids, concurrency, weights, review_filters, page_size)
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="pydemy-enrich")
+        in_flight: Dict[Future, Any] = {}
+        try:
+            while True:
+                for job in plan.start():
+                    future = executor.submit(self._fetch, job.url, job.params, job.parse)
+                    in_flight[future] = job
+                if not in_flight:
+                    return
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = in_flight.pop(future)
+                    try:
+                        finished = plan.finish(job, future.result())
+                    except UdemyAPIError as exc:
+                        finished = plan.finish(job, error=exc)
+                    yield from finished
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,318 @@
+"""Columnar containers that batch reviews and courses into contiguous arrays for analytics."""
+
+import math
+from array import array
+from datetime import datetime, timedelta, timezone
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Tuple, Union
+
+from ._exceptions import UdemyAPIError
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _numpy() -> Any:
+    """
+    Imports NumPy, which is only needed to export columns.
+
+    Raises:
+        UdemyAPIError: If NumPy is not installed.
+    """
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise UdemyAPIError("NumPy export requires numpy: pip install pydemy[numpy]") from exc
+    return numpy
+
+
+def _epoch_us(value: datetime) -> int:
+    """Returns microseconds since the Unix epoch; naive datetimes are taken as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+class StringColumn:
+    """
+    Strings packed Arrow-style into one UTF-8 buffer plus an int64 offsets array.
+
+    String i is `data[offsets[i]:offsets[i + 1]]`, so a column of millions of strings is two
+    allocations instead of millions of str objects.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty column."""
+        self.data = bytearray()
+        self.offsets = array("q", [0])
+
+    def __len__(self) -> int:
+        """Returns the number of strings."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        """Decodes and returns the string at `index`."""
+        if index < 0:
+            index += len(self)
+        return self.data[self.offsets[index] : self.offsets[index + 1]].decode()
+
+    def __iter__(self) -> Iterator[str]:
+        """Yields the decoded strings in order."""
+        data, offsets = self.data, self.offsets
+        for index in range(len(self)):
+            yield data[offsets[index] : offsets[index + 1]].decode()
+
+    def extend(self, values: Iterable[str]) -> None:
+        """Appends `values` to the buffer; nothing is appended if any value is not a str."""
+        self._extend_encoded([value.encode() for value in values])
+
+    def _extend_encoded(self, values: List[bytes]) -> None:
+        """Appends UTF-8 encoded values to the buffer, or nothing if a buffer is exported."""
+        length, end = len(self), len(self.data)
+        offsets = array("q")
+        for value in values:
+            end += len(value)
+            offsets.append(end)
+        self.offsets.extend(offsets)
+        try:
+            self.data += b"".join(values)
+        except BufferError:
+            del self.offsets[length + 1 :]
+            raise
+
+    def _truncate(self, length: int) -> None:
+        """Drops the strings after the first `length`."""
+        del self.data[self.offsets[length] :]
+        del self.offsets[length + 1 :]
+
+    def to_numpy(self) -> Any:
+        """
+        Exports the buffers as NumPy arrays without copying.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: The uint8 data and the int64 offsets.
+
+        Raises:
+            UdemyAPIError: If NumPy is not installed.
+        """
+        numpy = _numpy()
+        return (
+            numpy.frombuffer(self.data, dtype=numpy.uint8),
+            numpy.frombuffer(self.offsets, dtype=numpy.int64),
+        )
+
+
+class DictionaryColumn:
+    """
+    Dictionary-encoded strings: each distinct value is stored once in `categories` and rows
+    hold int32 codes into it, which suits low-cardinality values such as user names or locales.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty column."""
+        self.codes = array("i")
+        self.categories: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Returns the number of rows."""
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> str:
+        """Returns the value at row `index`."""
+        return self.categories[self.codes[index]]
+
+    def __iter__(self) -> Iterator[str]:
+        """Yields the values in row order."""
+        categories = self.categories
+        return (categories[code] for code in self.codes)
+
+    def extend(self, values: Iterable[str]) -> None:
+        """Appends `values`, adding unseen ones to the categories once the codes are stored."""
+        index, categories = self._index, self.categories
+        added: Dict[str, int] = {}
+        codes = array("i")
+        for value in values:
+            code = index.get(value)
+            if code is None:
+                code = added.setdefault(value, len(categories) + len(added))
+            codes.append(code)
+        self.codes.extend(codes)
+        index.update(added)
+        categories.extend(added)
+
+    def _truncate(self, length: int) -> None:
+        """Drops the rows after the first `length` and the categories only they used."""
+        del self.codes[length:]
+        used = max(self.codes, default=-1) + 1  # Categories are added in order of first use
+        for value in self.categories[used:]:
+            del self._index[value]
+        del self.categories[used:]
+
+    def to_numpy(self) -> Any:
+        """
+        Exports the codes as a NumPy array without copying.
+
+        Returns:
+            numpy.ndarray: The int32 codes into `categories`.
+
+        Raises:
+            UdemyAPIError: If NumPy is not installed.
+        """
+        numpy = _numpy()
+        return numpy.frombuffer(self.codes, dtype=numpy.int32)
+
+
+Column = Union[array, StringColumn, DictionaryColumn]
+
+# Column kind -> (array typecode, NumPy dtype, value converter); None for non-array kinds
+_ARRAY_KINDS: Dict[str, Tuple[str, str, Callable[[Any], Any]]] = {
+    "int64": ("q", "int64", int),
+    "float64": ("d", "float64", float),
+    "bool": ("b", "bool", int),
+    "datetime": ("q", "datetime64[us]", _epoch_us),
+}
+
+
+class ColumnTable:
+    """
+    Base class of columnar result containers.
+
+    Subclasses declare `schema`, a tuple of (column name, kind, getter) where kind is one of
+    int64, float64, bool, datetime (int64 microseconds since the epoch), string (packed) or
+    dictionary (dictionary-encoded), and the getter reads the value from a model or record.
+
+    Pages are appended with extend(), so results can be collected page by page without keeping
+    the models around. to_numpy() exposes the numeric columns as NumPy views of the same
+    memory; while such views are alive the table cannot grow, since the arrays cannot be
+    resized while they export their buffers.
+    """
+
+    schema: ClassVar[Tuple[Tuple[str, str, Callable[[Any], Any]], ...]]
+
+    def __init__(self, rows: Iterable[Any] = ()) -> None:
+        """
+        Initializes the table, optionally with a first batch of rows.
+
+        Args:
+            rows (Iterable[Any], optional): Models or lean records to append.
+        """
+        self.columns: Dict[str, Column] = {}
+        for name, kind, _ in self.schema:
+            if kind in _ARRAY_KINDS:
+                self.columns[name] = array(_ARRAY_KINDS[kind][0])
+            elif kind == "string":
+                self.columns[name] = StringColumn()
+            else:
+                self.columns[name] = DictionaryColumn()
+        self.extend(rows)
+
+    def __len__(self) -> int:
+        """Returns the number of rows."""
+        return len(self.columns[self.schema[0][0]])
+
+    def __getitem__(self, name: str) -> Column:
+        """Returns the column called `name`."""
+        return self.columns[name]
+
+    def extend(self, rows: Iterable[Any]) -> None:
+        """
+        Appends rows, typically one page of results at a time.
+
+        The whole batch is read before any column is touched, so a getter failing on a row
+        leaves the table unchanged rather than with columns of different lengths. If a column
+        cannot grow because a NumPy view of it is alive, the columns already extended are
+        truncated back before the BufferError is raised.
+
+        Args:
+            rows (Iterable[Any]): Models or lean records to append.
+
+        Raises:
+            BufferError: If a column is exported, e.g. by a view from to_numpy().
+        """
+        rows = rows if isinstance(rows, (list, tuple)) else list(rows)
+        batch = []
+        for name, kind, getter in self.schema:
+            if kind in _ARRAY_KINDS:
+                typecode, _, convert = _ARRAY_KINDS[kind]
+                batch.append((name, array(typecode, [convert(getter(row)) for row in rows])))
+            elif kind == "string":
+                batch.append((name, [getter(row).encode() for row in rows]))
+            else:
+                batch.append((name, [getter(row) for row in rows]))
+        length = len(self)
+        extended: List[Column] = []
+        try:
+            for name, values in batch:
+                column = self.columns[name]
+                if isinstance(column, StringColumn):
+                    column._extend_encoded(values)
+                else:
+                    column.extend(values)
+                extended.append(column)
+        except BufferError:
+            for column in extended:
+                if isinstance(column, array):
+                    del column[length:]
+                else:
+                    column._truncate(length)
+            raise
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Exports the columns as NumPy arrays.
+
+        Numeric and datetime columns become zero-copy views; dictionary columns export their
+        int32 codes (the values are in the column's `categories`) and string columns their
+        data and offsets buffers, also without copying.
+
+        Returns:
+            Dict[str, Any]: The arrays by column name.
+
+        Raises:
+            UdemyAPIError: If NumPy is not installed.
+        """
+        numpy = _numpy()
+        arrays = {}
+        for name, kind, _ in self.schema:
+            column = self.columns[name]
+            if kind in _ARRAY_KINDS:
+                arrays[name] = numpy.frombuffer(column, dtype=_ARRAY_KINDS[kind][1])
+            else:
+                arrays[name] = column.to_numpy()
+        return arrays
+
+
+def _price_amount(course: Any) -> float:
+    """Returns the course's price amount, or NaN for courses without price details."""
+    return course.price_detail.amount if course.price_detail is not None else math.nan
+
+
+class ReviewColumns(ColumnTable):
+    """Columnar container of CourseReview models or CourseReviewRecord records."""
+
+    schema = (
+        ("id", "int64", attrgetter("id")),
+        ("rating", "float64", attrgetter("rating")),
+        ("created", "datetime", attrgetter("created")),
+        ("modified", "datetime", attrgetter("modified")),
+        ("user_modified", "datetime", attrgetter("user_modified")),
+        ("content", "string", attrgetter("content")),
+        ("user_name", "dictionary", attrgetter("user.name")),
+        ("user_display_name", "dictionary", attrgetter("user.display_name")),
+    )
+
+
+class CourseColumns(ColumnTable):
+    """Columnar container of Course models or CourseRecord records."""
+
+    schema = (
+        ("id", "int64", attrgetter("id")),
+        ("is_paid", "bool", attrgetter("is_paid")),
+        ("price_amount", "float64", _price_amount),
+        ("is_practice_test_course", "bool", attrgetter("is_practice_test_course")),
+        ("title", "string", attrgetter("title")),
+        ("published_title", "string", attrgetter("published_title")),
+        ("locale", "dictionary", attrgetter("locale.locale")),
+        ("instructor_name", "dictionary", lambda course: course.instructor_name or ""),
+    )
@@ -0,0 +1,270 @@
+"""Adaptive (AIMD) limit on the number of requests in flight, driven by latency and errors."""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+
+class LimitChange(NamedTuple):
+    """One adjustment of an AdaptiveLimiter's limit and the window statistics behind it."""
+
+    at: float
+    limit: int
+    reason: str
+    latency: Optional[float]
+    error_rate: float
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """Returns the nearest-rank `q` percentile (0 to 1) of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+class AdaptiveLimiter:
+    """
+    Limits the requests in flight, growing the limit additively while the API keeps up and
+    shrinking it multiplicatively (AIMD) when it does not.
+
+    Every completed request reports its latency and status code. After each window of
+    `window` completions the limiter compares the window's error rate (5xx responses,
+    connection errors and timeouts) with `error_threshold` and its `latency_percentile` latency
+    with `latency_target`; either one exceeded multiplies the limit by `decrease`. Otherwise,
+    if the window had the limit's worth of requests in flight, the limit grows by `increase`.
+    A 429 response shrinks the limit at once. Signals from requests sent before the last decrease
+    are ignored, so one burst of failures shrinks the limit only once.
+
+    Without a `latency_target`, the target is `latency_tolerance` times the lowest median
+    latency seen in any window, i.e. how fast the API answers when it is not loaded.
+
+    The same limiter can be shared by threads (acquire) and asyncio tasks (acquire_async).
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: int = 1,
+        decrease: float = 0.5,
+        window: int = 20,
+        latency_target: Optional[float] = None,
+        latency_percentile: float = 0.9,
+        latency_tolerance: float = 2.0,
+        error_threshold: float = 0.1,
+        history_size: int = 100,
+    ) -> None:
+        """
+        Initializes the limiter.
+
+        Args:
+            initial_limit (int, optional): The starting number of requests in flight.
+                Defaults to 8.
+            min_limit (int, optional): The lowest limit. Defaults to 1.
+            max_limit (int, optional): The highest limit. Defaults to 64.
+            increase (int, optional): The amount added after a healthy window. Defaults to 1.
+            decrease (float, optional): The factor applied on congestion. Defaults to 0.5.
+            window (int, optional): The number of completed requests per evaluation.
+                Defaults to 20.
+            latency_target (float, optional): The highest acceptable latency percentile in
+                seconds. Defaults to None (derived from the fastest observed window).
+            latency_percentile (float, optional): The latency percentile compared with the
+                target, between 0 and 1. Defaults to 0.9.
+            latency_tolerance (float, optional): How many times the lowest median latency
+                the derived target allows. Defaults to 2.0.
+            error_threshold (float, optional): The highest acceptable share of failed requests
+                per window. Defaults to 0.1.
+            history_size (int, optional): The number of limit changes kept in `history`.
+                Defaults to 100.
+
+        Raises:
+            ValueError: If the limits are not 1 <= min_limit <= initial_limit <= max_limit, or
+                increase, decrease, window or latency_percentile are out of range.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if increase < 1:
+            raise ValueError("Increase must be at least 1")
+        if not 0 < decrease < 1:
+            raise ValueError("Decrease must be between 0 and 1")
+        if window < 1:
+            raise ValueError("Window must be at least 1")
+        if not 0 < latency_percentile <= 1:
+            raise ValueError("Latency percentile must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.window = window
+        self.latency_target = latency_target
+        self.latency_percentile = latency_percentile
+        self.latency_tolerance = latency_tolerance
+        self.error_threshold = error_threshold
+        self.history: Deque[LimitChange] = deque(maxlen=history_size)
+        self.completed = 0
+        self.errors = 0
+        self.throttled = 0
+
+        self._lock = threading.Lock()
+        self._limit = initial_limit
+        self._in_flight = 0
+        self._waiters: Deque[Tuple[Optional[asyncio.AbstractEventLoop], Any]] = deque()
+        self._latencies: List[float] = []
+        self._window_errors = 0
+        self._window_peak = 0
+        self._decreased_at = float("-inf")  # time.monotonic() of the last decrease
+        self._baseline: Optional[float] = None
+
+    @property
+    def limit(self) -> int:
+        """Returns the current number of requests allowed in flight."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Returns the number of requests in flight."""
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """Blocks the calling thread until a request may be sent."""
+        with self._lock:
+            if self._try_take():
+                return
+            event = threading.Event()
+            self._waiters.append((None, event))
+        event.wait()
+
+    async def acquire_async(self) -> None:
+        """Suspends the calling task until a request may be sent."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._try_take():
+                return
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:  # Granted while being cancelled: hand the slot on
+                    self._in_flight -= 1
+                    self._wake()
+            raise
+
+    def release(self, latency: float, status_code: Optional[int]) -> None:
+        """
+        Frees the slot of a finished request and adjusts the limit from its outcome.
+
+        Args:
+            latency (float): The time the request took in seconds.
+            status_code (int, optional): The response status code, or None if the request
+                failed without a response (connection error or timeout).
+        """
+        with self._lock:
+            self._in_flight -= 1
+            self.completed += 1
+            self._latencies.append(latency)
+            sent_at = time.monotonic() - latency
+            if status_code == 429:
+                self.throttled += 1
+                if sent_at >= self._decreased_at:
+                    self._decrease("throttled", None, 0.0)
+            elif status_code is None or status_code >= 500:
+                self.errors += 1
+                self._window_errors += 1
+            if len(self._latencies) >= self.window:
+                self._evaluate(sent_at >= self._decreased_at)
+            self._wake()
+
+    def cancel(self) -> None:
+        """Frees the slot of a request abandoned before completing, without recording it."""
+        with self._lock:
+            self._in_flight -= 1
+            self._wake()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns a snapshot of the limit and counters, e.g. for exporting to a metrics system."""
+        with self._lock:
+            latency = _percentile(self._latencies, 0.5) if self._latencies else None
+            return {
+                "limit": self._limit,
+                "in_flight": self._in_flight,
+                "waiting": len(self._waiters),
+                "completed": self.completed,
+                "errors": self.errors,
+                "throttled": self.throttled,
+                "window_median_latency": latency,
+                "baseline_latency": self._baseline,
+            }
+
+    def _try_take(self) -> bool:
+        """Takes a slot if one is free and nobody waits for it. Requires the lock."""
+        if self._waiters or self._in_flight >= self._limit:
+            return False
+        self._in_flight += 1
+        self._window_peak = max(self._window_peak, self._in_flight)
+        return True
+
+    def _wake(self) -> None:
+        """Hands the free slots to waiters in arrival order. Requires the lock."""
+        while self._waiters and self._in_flight < self._limit:
+            loop, waiter = self._waiters.popleft()
+            self._in_flight += 1
+            self._window_peak = max(self._window_peak, self._in_flight)
+            if loop is None:
+                waiter.set()
+            else:
+                loop.call_soon_threadsafe(_grant, waiter)
+
+    def _evaluate(self, may_decrease: bool) -> None:
+        """
+        Adjusts the limit from the statistics of a full window. Requires the lock.
+
+        Args:
+            may_decrease (bool): Whether the request completing the window was sent after the
+                last decrease, so congestion it saw is news.
+        """
+        latencies, errors = self._latencies, self._window_errors
+        self._latencies, self._window_errors = [], 0
+        peak, self._window_peak = self._window_peak, self._in_flight
+        median = _percentile(latencies, 0.5)
+        if self._baseline is None or median < self._baseline:
+            self._baseline = median
+        latency = _percentile(latencies, self.latency_percentile)
+        error_rate = errors / len(latencies)
+        target = self.latency_target
+        if target is None:
+            target = self._baseline * self.latency_tolerance
+
+        if error_rate > self.error_threshold or latency > target:
+            if may_decrease:
+                reason = "errors" if error_rate > self.error_threshold else "latency"
+                self._decrease(reason, latency, error_rate)
+        elif peak >= self._limit and self._limit < self.max_limit:
+            limit = min(self.max_limit, self._limit + self.increase)
+            self._change(limit, "increase", latency, error_rate)
+
+    def _decrease(self, reason: str, latency: Optional[float], error_rate: float) -> None:
+        """Shrinks the limit by the `decrease` factor and restarts the signal cutoff."""
+        self._decreased_at = time.monotonic()
+        limit = max(self.min_limit, int(self._limit * self.decrease))
+        if limit != self._limit:
+            self._change(limit, reason, latency, error_rate)
+
+    def _change(
+        self, limit: int, reason: str, latency: Optional[float], error_rate: float
+    ) -> None:
+        """Sets the limit and records the change in the history."""
+        self._limit = limit
+        self.history.append(LimitChange(time.time(), limit, reason, latency, error_rate))
+
+
+def _grant(future: asyncio.Future) -> None:
+    """Wakes an asyncio waiter unless it was cancelled meanwhile."""
+    if not future.done():
+        future.set_result(None)
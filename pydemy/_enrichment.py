@@ -0,0 +1,211 @@
+"""Job graph of the requests enriching many courses, scheduled on a weighted concurrency budget."""
+
+import heapq
+import itertools
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from ._base_client import BaseClient
+from ._exceptions import UdemyAPIError
+from ._results import CourseEnrichment
+from .models._filters.review_filters import ReviewFilter
+
+# Budget units a request of each part takes; a curriculum page of up to 100 items costs the
+# API about as much as two course or review requests
+DEFAULT_WEIGHTS: Dict[str, int] = {"details": 1, "reviews": 1, "curriculum": 2}
+
+
+class _Job(NamedTuple):
+    """One request of the job graph: a part of a course, or one page of its curriculum."""
+
+    order: int
+    part: str
+    page: int
+    url: str
+    params: Optional[Dict[str, Any]]
+    parse: Callable[[bytes], Any]
+    weight: int
+
+
+class _CourseParts:
+    """The parts of one admitted course received so far."""
+
+    __slots__ = ("course_id", "pending", "course", "reviews", "pages", "errors")
+
+    def __init__(self, course_id: int) -> None:
+        self.course_id = course_id
+        self.pending = 0
+        self.course = None
+        self.reviews = None
+        self.pages: Dict[int, List[Any]] = {}
+        self.errors: Dict[str, UdemyAPIError] = {}
+
+
+class EnrichmentPlan:
+    """
+    Plans the requests enriching a stream of course IDs and tracks their progress.
+
+    Every course needs its details, its first page of reviews and its curriculum; the curriculum's
+    remaining pages only become known once its first page reports the item count, and are added
+    to the graph then. Requests take as many units of the `concurrency` budget as their part's
+    weight, and are started in the order their courses were admitted, so a course's follow-up
+    pages go ahead of the next courses' first requests and courses complete as early as possible.
+    At most `concurrency` courses are open at a time, so course IDs are consumed lazily.
+
+    The plan does no I/O and is not thread-safe: a client drives it from one thread or event
+    loop by sending the jobs returned by start() and reporting each outcome to finish().
+    """
+
+    def __init__(
+        self,
+        client: BaseClient,
+        course_ids: Iterable[int],
+        concurrency: int,
+        weights: Optional[Dict[str, int]] = None,
+        review_filters: ReviewFilter = ReviewFilter(),
+        page_size: int = 100,
+    ) -> None:
+        """
+        Initializes the plan.
+
+        Args:
+            client (BaseClient): The client whose endpoints and parsers the jobs use.
+            course_ids (Iterable[int]): The IDs of the courses to enrich.
+            concurrency (int): The budget units of the requests in flight at any time.
+            weights (Dict[str, int], optional): Budget units per request of the "details",
+                "reviews" and "curriculum" parts, overriding DEFAULT_WEIGHTS. Weights above
+                `concurrency` are capped to it.
+            review_filters (ReviewFilter, optional): The filters of the review page.
+            page_size (int, optional): The number of items per curriculum page.
+
+        Raises:
+            ValueError: If concurrency or a weight is lower than 1, or a weight names an
+                unknown part.
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        unknown = set(weights) - set(DEFAULT_WEIGHTS)
+        if unknown:
+            raise ValueError(f"Unknown enrichment parts: {', '.join(sorted(unknown))}")
+        if min(weights.values()) < 1:
+            raise ValueError("Weights must be at least 1")
+
+        self._client = client
+        self._course_ids = iter(course_ids)
+        self._weights = {part: min(weight, concurrency) for part, weight in weights.items()}
+        self._available = self._max_open = concurrency
+        self._review_params = client._query_params(review_filters)
+        self._page_size = page_size
+        self._open: Dict[int, _CourseParts] = {}
+        self._ready: List[Tuple[int, int, _Job]] = []  # Heap by admission order, then sequence
+        self._sequence = itertools.count()
+        self._admitted = itertools.count()
+        self._exhausted = False
+
+    def start(self) -> List[_Job]:
+        """
+        Admits courses while fewer than `concurrency` are open, then takes the next jobs in
+        order for as long as the budget has room for them.
+
+        Returns:
+            List[_Job]: The jobs to send now; empty once every course has been enriched.
+        """
+        while not self._exhausted and len(self._open) < self._max_open:
+            course_id = next(self._course_ids, None)
+            if course_id is None:
+                self._exhausted = True
+            else:
+                self._admit(course_id)
+
+        jobs = []
+        while self._ready and self._ready[0][2].weight <= self._available:
+            job = heapq.heappop(self._ready)[2]
+            self._available -= job.weight
+            jobs.append(job)
+        return jobs
+
+    def finish(
+        self, job: _Job, result: Any = None, error: Optional[UdemyAPIError] = None
+    ) -> List[CourseEnrichment]:
+        """
+        Records the outcome of a job, adding the curriculum pages it reveals to the graph.
+
+        Args:
+            job (_Job): A job returned by start().
+            result (Any, optional): The parsed response of a successful job.
+            error (UdemyAPIError, optional): The error of a failed job.
+
+        Returns:
+            List[CourseEnrichment]: The job's course if all its parts are now done.
+        """
+        self._available += job.weight
+        parts = self._open[job.order]
+        parts.pending -= 1
+        if error is not None:
+            parts.errors.setdefault(job.part, error)
+        elif job.part == "details":
+            parts.course = result
+        elif job.part == "reviews":
+            parts.reviews = result
+        else:
+            items, next_url, count = result
+            parts.pages[job.page] = items
+            if count is None:  # Without a count, follow the next links one page at a time
+                if self._client._has_next_page(next_url, job.page, self._page_size):
+                    self._add_page(job.order, parts, job.page + 1)
+            elif job.page == 1:
+                for page in self._client._remaining_pages(count, self._page_size):
+                    self._add_page(job.order, parts, page)
+
+        if parts.pending:
+            return []
+        del self._open[job.order]
+        curriculum = None
+        if "curriculum" not in parts.errors:
+            items = [item for page in sorted(parts.pages) for item in parts.pages[page]]
+            curriculum = self._client._curriculum_tree(items)
+        return [
+            CourseEnrichment(
+                parts.course_id, parts.course, parts.reviews, curriculum, parts.errors
+            )
+        ]
+
+    def _admit(self, course_id: int) -> None:
+        """Opens a course and adds its details, review page and first curriculum page jobs."""
+        order = next(self._admitted)
+        parts = self._open[order] = _CourseParts(course_id)
+        url = self._client.base_url + f"courses/{course_id}/"
+        self._add(order, parts, "details", 1, url, None, self._client._parse_course)
+        self._add(
+            order,
+            parts,
+            "reviews",
+            1,
+            url + "reviews/",
+            self._review_params,
+            self._client._parse_reviews,
+        )
+        self._add_page(order, parts, 1)
+
+    def _add_page(self, order: int, parts: _CourseParts, page: int) -> None:
+        """Adds the job of one curriculum page of a course."""
+        url = self._client.base_url + f"courses/{parts.course_id}/public-curriculum-items/"
+        params = {"page": page, "page_size": self._page_size}
+        self._add(
+            order, parts, "curriculum", page, url, params, self._client._parse_curriculum_page
+        )
+
+    def _add(
+        self,
+        order: int,
+        parts: _CourseParts,
+        part: str,
+        page: int,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        parse: Callable[[bytes], Any],
+    ) -> None:
+        """Adds a job to the ready queue and counts it as pending for its course."""
+        parts.pending += 1
+        job = _Job(order, part, page, url, params, parse, self._weights[part])
+        heapq.heappush(self._ready, (order, next(self._sequence), job))
@@ -1,7 +1,23 @@
-"""Custom exception class for errors related to the Udemy API."""
+"""Custom exception classes for errors related to the Udemy API."""
 
 
 class UdemyAPIError(Exception):
     """Custom exception class raised for errors related to the Udemy API."""
 
     pass  # pylint: disable=unnecessary-pass
+
+
+class CircuitOpenError(UdemyAPIError):
+    """Raised without sending a request while the circuit of its endpoint is open."""
+
+    def __init__(self, endpoint: str, retry_after: float) -> None:
+        """
+        Initializes the error.
+
+        Args:
+            endpoint (str): The endpoint whose circuit rejected the request.
+            retry_after (float): The seconds until the circuit lets a probe request through.
+        """
+        super().__init__(f"Circuit open for {endpoint}; retry in {retry_after:.1f}s")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
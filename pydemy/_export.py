@@ -0,0 +1,358 @@
+"""Streaming JSON Lines export of models and records, with optional gzip compression."""
+
+import asyncio
+import os
+import zlib
+from typing import IO, Any, AsyncIterable, Iterable, List, Optional, Union
+
+from pydantic_core import PydanticSerializationError, to_json
+
+ExportTarget = Union[str, os.PathLike, IO[bytes]]
+
+_GZIP_WBITS = 31  # zlib window bits that produce a gzip container
+
+
+def _dump_json(obj: Any) -> bytes:
+    """
+    Serializes a Pydantic model or dataclass with its compiled serializer, and anything else
+    (plain values, result tuples holding models, datetimes) with pydantic_core.
+
+    Raises:
+        TypeError: If `obj` holds a value that has no JSON representation.
+    """
+    serializer = getattr(obj, "__pydantic_serializer__", None)
+    if serializer is not None:
+        return serializer.to_json(obj)
+    try:
+        return to_json(obj)
+    except PydanticSerializationError as exc:
+        raise TypeError(f"Cannot export {type(obj).__name__} as JSON: {exc}") from exc
+
+
+def _compresses(target: ExportTarget, compress: Optional[bool]) -> bool:
+    """Returns whether to gzip: as requested, else if `target` is a path ending in .gz."""
+    if compress is not None:
+        return compress
+    return isinstance(target, (str, os.PathLike)) and os.fspath(target).endswith(".gz")
+
+
+class _ChunkEncoder:
+    """
+    Turns objects into JSON lines and cuts the (optionally compressed) stream into chunks of
+    exactly `chunk_size` bytes, so writes have a fixed size and at most one partial chunk is
+    buffered.
+    """
+
+    def __init__(self, compress: bool, chunk_size: int, compresslevel: int) -> None:
+        """Initializes the encoder; see JSONLWriter for the arguments."""
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._compressor = (
+            zlib.compressobj(compresslevel, zlib.DEFLATED, _GZIP_WBITS) if compress else None
+        )
+
+    def encode(self, obj: Any) -> List[bytes]:
+        """Appends `obj` as one JSON line and returns the chunks that are now full."""
+        line = _dump_json(obj) + b"\n"
+        if self._compressor is not None:
+            line = self._compressor.compress(line)
+        self._buffer += line
+        return self._cut(len(self._buffer) - len(self._buffer) % self.chunk_size)
+
+    def finish(self) -> List[bytes]:
+        """Ends the stream and returns the remaining chunks, the last one possibly shorter."""
+        if self._compressor is not None:
+            self._buffer += self._compressor.flush()
+            self._compressor = None
+        return self._cut(len(self._buffer))
+
+    def _cut(self, size: int) -> List[bytes]:
+        """Removes the first `size` bytes of the buffer and returns them in chunks."""
+        if not size:
+            return []
+        with memoryview(self._buffer) as view:
+            chunks = [
+                bytes(view[start : start + self.chunk_size])
+                for start in range(0, size, self.chunk_size)
+            ]
+        del self._buffer[:size]
+        return chunks
+
+
+class JSONLWriter:
+    """
+    Writes models, lean records or plain JSON values as JSON Lines in fixed-size chunks.
+
+    Only one partial chunk is held in memory, so the memory used stays constant however many
+    objects are written, as long as they come from an iterator such as iter_course_reviews.
+    Use as a context manager, or call close() to write the final chunk.
+    """
+
+    def __init__(
+        self,
+        target: ExportTarget,
+        compress: Optional[bool] = None,
+        chunk_size: int = 64 * 1024,
+        compresslevel: int = 6,
+    ) -> None:
+        """
+        Initializes the writer, opening `target` if it is a path.
+
+        Args:
+            target (Union[str, os.PathLike, IO[bytes]]): The path of the file to create, or a
+                binary file-like object, which is left open on close.
+            compress (bool, optional): Whether to gzip the output. Defaults to None (only for
+                paths ending in .gz).
+            chunk_size (int, optional): The size of each write in bytes. Defaults to 64 KiB.
+            compresslevel (int, optional): The gzip compression level. Defaults to 6.
+
+        Raises:
+            ValueError: If chunk_size is lower than 1.
+        """
+        self._encoder = _ChunkEncoder(_compresses(target, compress), chunk_size, compresslevel)
+        self._owns_file = isinstance(target, (str, os.PathLike))
+        self._file: IO[bytes] = open(target, "wb") if self._owns_file else target
+        self.count = 0
+
+    def __enter__(self) -> "JSONLWriter":
+        """Returns the writer."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Writes the final chunk and closes the file if the writer opened it."""
+        self.close()
+
+    def write(self, obj: Any) -> None:
+        """
+        Writes one object as a JSON line.
+
+        Raises:
+            TypeError: If `obj` holds a value that has no JSON representation.
+        """
+        for chunk in self._encoder.encode(obj):
+            self._file.write(chunk)
+        self.count += 1
+
+    def write_many(self, objs: Iterable[Any]) -> int:
+        """
+        Writes every object of an iterable, consuming it lazily.
+
+        Args:
+            objs (Iterable[Any]): The objects to write, e.g. a client's iter_* method.
+
+        Returns:
+            int: The number of objects written.
+        """
+        count = self.count
+        for obj in objs:
+            self.write(obj)
+        return self.count - count
+
+    def close(self) -> None:
+        """Writes the final chunk and closes the file if the writer opened it."""
+        if self._file is None:
+            return
+        for chunk in self._encoder.finish():
+            self._file.write(chunk)
+        self._file.flush()
+        if self._owns_file:
+            self._file.close()
+        self._file = None
+
+
+class AsyncJSONLWriter:
+    """
+    Asynchronous JSONLWriter for exporting from AsyncUdemyClient.
+
+    Writes never block the event loop: chunks for files are queued and written by a worker in
+    a thread, and asyncio stream writers are drained after every chunk. Both give backpressure:
+    write() suspends once `max_pending` chunks wait in the queue or the stream's buffer is full,
+    so a fast producer cannot outrun a slow disk or socket.
+    """
+
+    def __init__(
+        self,
+        target: Union[ExportTarget, asyncio.StreamWriter],
+        compress: Optional[bool] = None,
+        chunk_size: int = 64 * 1024,
+        compresslevel: int = 6,
+        max_pending: int = 4,
+    ) -> None:
+        """
+        Initializes the writer. The file of a path is opened on entering the context.
+
+        Args:
+            target (Union[str, os.PathLike, IO[bytes], asyncio.StreamWriter]): The path of the
+                file to create, a binary file-like object, or an object with asyncio
+                StreamWriter's write() and drain(). Objects are left open on close.
+            compress (bool, optional): Whether to gzip the output. Defaults to None (only for
+                paths ending in .gz).
+            chunk_size (int, optional): The size of each write in bytes. Defaults to 64 KiB.
+            compresslevel (int, optional): The gzip compression level. Defaults to 6.
+            max_pending (int, optional): The number of chunks that may wait to be written to a
+                file before write() suspends. Defaults to 4.
+
+        Raises:
+            ValueError: If chunk_size or max_pending is lower than 1.
+        """
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self._encoder = _ChunkEncoder(_compresses(target, compress), chunk_size, compresslevel)
+        self._target = target
+        self._stream = target if hasattr(target, "drain") else None
+        self._max_pending = max_pending
+        self._file: Optional[IO[bytes]] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self.count = 0
+
+    async def __aenter__(self) -> "AsyncJSONLWriter":
+        """Opens the file if needed and starts the writing worker."""
+        await self._start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Writes the final chunk and stops the worker."""
+        await self.aclose()
+
+    async def _start(self) -> None:
+        """Opens the file of a path target and starts the worker, once."""
+        if self._stream is not None or self._worker is not None:
+            return
+        if isinstance(self._target, (str, os.PathLike)):
+            self._file = await asyncio.to_thread(open, self._target, "wb")
+        else:
+            self._file = self._target
+        self._queue = asyncio.Queue(self._max_pending)
+        self._worker = asyncio.create_task(self._write_chunks())
+
+    async def _write_chunks(self) -> None:
+        """Writes queued chunks in a thread until the end marker; keeps draining on errors."""
+        while (chunk := await self._queue.get()) is not None:
+            if self._error is None:
+                try:
+                    await asyncio.to_thread(self._file.write, chunk)
+                except Exception as exc:  # pylint: disable=broad-except
+                    self._error = exc  # Raised by the next write() or aclose()
+
+    async def _put(self, chunks: List[bytes]) -> None:
+        """Hands chunks to the stream or the worker, suspending while they are backed up."""
+        for chunk in chunks:
+            if self._error is not None:
+                raise self._error
+            if self._stream is not None:
+                self._stream.write(chunk)
+                await self._stream.drain()
+            else:
+                await self._queue.put(chunk)
+
+    async def write(self, obj: Any) -> None:
+        """
+        Writes one object as a JSON line.
+
+        Raises:
+            TypeError: If `obj` holds a value that has no JSON representation.
+        """
+        await self._start()
+        await self._put(self._encoder.encode(obj))
+        self.count += 1
+
+    async def write_many(self, objs: Union[Iterable[Any], AsyncIterable[Any]]) -> int:
+        """
+        Writes every object of an (async) iterable, consuming it lazily.
+
+        Args:
+            objs (Union[Iterable[Any], AsyncIterable[Any]]): The objects to write, e.g. an
+                AsyncUdemyClient iter_* method.
+
+        Returns:
+            int: The number of objects written.
+        """
+        count = self.count
+        if hasattr(objs, "__aiter__"):
+            async for obj in objs:
+                await self.write(obj)
+        else:
+            for obj in objs:
+                await self.write(obj)
+        return self.count - count
+
+    async def aclose(self) -> None:
+        """
+        Writes the final chunk, waits for pending writes and closes the file if the writer
+        opened it.
+
+        Raises:
+            Exception: The first error raised while writing to the target.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        await self._start()
+        try:
+            await self._put(self._encoder.finish())
+        finally:
+            if self._worker is not None:
+                await self._queue.put(None)
+                await self._worker
+                if self._file is not self._target:
+                    await asyncio.to_thread(self._file.close)
+                elif self._error is None:
+                    await asyncio.to_thread(self._file.flush)
+        if self._error is not None:
+            raise self._error
+
+
+def export_jsonl(
+    objs: Iterable[Any],
+    target: ExportTarget,
+    compress: Optional[bool] = None,
+    chunk_size: int = 64 * 1024,
+) -> int:
+    """
+    Streams objects, e.g. from a client's iter_* method, into a JSON Lines file.
+
+    Args:
+        objs (Iterable[Any]): The models, lean records or JSON values to export.
+        target (Union[str, os.PathLike, IO[bytes]]): The path or binary file-like object.
+        compress (bool, optional): Whether to gzip the output. Defaults to None (only for
+            paths ending in .gz).
+        chunk_size (int, optional): The size of each write in bytes. Defaults to 64 KiB.
+
+    Returns:
+        int: The number of exported objects.
+    """
+    with JSONLWriter(target, compress, chunk_size) as writer:
+        return writer.write_many(objs)
+
+
+async def export_jsonl_async(
+    objs: Union[Iterable[Any], AsyncIterable[Any]],
+    target: Union[ExportTarget, asyncio.StreamWriter],
+    compress: Optional[bool] = None,
+    chunk_size: int = 64 * 1024,
+    max_pending: int = 4,
+) -> int:
+    """
+    Streams objects, e.g. from an AsyncUdemyClient iter_* method, into a JSON Lines file or
+    stream without blocking the event loop.
+
+    Args:
+        objs (Union[Iterable[Any], AsyncIterable[Any]]): The objects to export.
+        target (Union[str, os.PathLike, IO[bytes], asyncio.StreamWriter]): The path, binary
+            file-like object or stream writer.
+        compress (bool, optional): Whether to gzip the output. Defaults to None (only for
+            paths ending in .gz).
+        chunk_size (int, optional): The size of each write in bytes. Defaults to 64 KiB.
+        max_pending (int, optional): The number of chunks that may wait to be written to a
+            file before the export suspends. Defaults to 4.
+
+    Returns:
+        int: The number of exported objects.
+    """
+    async with AsyncJSONLWriter(target, compress, chunk_size, max_pending=max_pending) as writer:
+        return await writer.write_many(objs)
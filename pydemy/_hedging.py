@@ -0,0 +1,193 @@
+"""Hedged requests: duplicating slow requests to cut tail latency."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, TypeVar
+
+from ._concurrency import _percentile
+
+T = TypeVar("T")
+
+
+class HedgingPolicy:
+    """
+    Sends a duplicate (hedge) of a request that is slower than usual and uses whichever of the
+    two answers first, cancelling the other.
+
+    The hedging delay of an endpoint is the `percentile` latency of its last `window` requests
+    (at least `min_delay`), so only about the slowest (1 - percentile) share of requests is
+    duplicated. Until `min_samples` latencies of an endpoint are known, `initial_delay` is used,
+    or no request is hedged if it is None.
+
+    The extra load is capped by a budget: every request earns `max_extra_load` hedges, up to
+    `burst` saved hedges, and every hedge spends one. Without budget left a slow request is
+    simply awaited, so hedging cannot double the load on an API that is slow for everyone.
+
+    The same policy can be shared by asyncio tasks and clients.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        max_extra_load: float = 0.05,
+        burst: float = 10.0,
+        window: int = 200,
+        min_samples: int = 20,
+        min_delay: float = 0.001,
+        initial_delay: Optional[float] = None,
+    ) -> None:
+        """
+        Initializes the policy with an empty budget.
+
+        Args:
+            percentile (float, optional): The latency percentile of an endpoint after which a
+                request is hedged, between 0 and 1. Defaults to 0.95.
+            max_extra_load (float, optional): The hedges allowed per request, i.e. the highest
+                share of extra requests. Defaults to 0.05.
+            burst (float, optional): The number of unused hedges that can be saved up.
+                Defaults to 10.0.
+            window (int, optional): The number of recent latencies per endpoint the delay is
+                computed from. Defaults to 200.
+            min_samples (int, optional): The number of latencies needed before the delay is
+                computed. Defaults to 20.
+            min_delay (float, optional): The shortest hedging delay in seconds. Defaults to
+                0.001.
+            initial_delay (float, optional): The hedging delay in seconds until `min_samples`
+                latencies are known. Defaults to None (no hedging until then).
+
+        Raises:
+            ValueError: If percentile is not between 0 and 1, max_extra_load is not between 0
+                and 1, burst is lower than 1, or window or min_samples is out of range.
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("Percentile must be between 0 and 1")
+        if not 0 < max_extra_load <= 1:
+            raise ValueError("Max extra load must be between 0 and 1")
+        if burst < 1:
+            raise ValueError("Burst must be at least 1")
+        if not 1 <= min_samples <= window:
+            raise ValueError("min_samples must be between 1 and window")
+        self.percentile = percentile
+        self.max_extra_load = max_extra_load
+        self.burst = burst
+        self.window = window
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.requests = 0
+        self.hedges_issued = 0
+        self.hedges_won = 0
+
+        self._lock = threading.Lock()
+        self._budget = 0.0
+        self._latencies: Dict[str, Deque[float]] = {}
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """
+        Returns how long a request to `endpoint` may take before it is hedged.
+
+        Args:
+            endpoint (str): The endpoint of the request, see CircuitBreaker.endpoint().
+
+        Returns:
+            float: The delay in seconds, or None if requests to the endpoint are not hedged yet.
+        """
+        with self._lock:
+            latencies: List[float] = list(self._latencies.get(endpoint, ()))
+        if len(latencies) < self.min_samples:
+            return self.initial_delay
+        return max(self.min_delay, _percentile(latencies, self.percentile))
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """Records the latency in seconds of a request to `endpoint` that answered."""
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = deque(maxlen=self.window)
+            latencies.append(latency)
+
+    async def run(
+        self,
+        endpoint: str,
+        send: Callable[[], Awaitable[T]],
+        hedge: Optional[Callable[[], Awaitable[T]]] = None,
+    ) -> T:
+        """
+        Awaits `send()`, hedging it with a second call if it does not answer within the delay.
+
+        The first call to succeed wins and the other one is cancelled and awaited. If the first
+        one to finish raises an exception, the other one is still awaited. A primary call
+        cancelled because its hedge won is recorded with the time it had taken so far: a lower
+        bound of its latency, which keeps the delay from ignoring the slow requests that were
+        hedged.
+
+        Args:
+            endpoint (str): The endpoint of the request, see CircuitBreaker.endpoint().
+            send (Callable[[], Awaitable[T]]): Sends the request.
+            hedge (Callable[[], Awaitable[T]], optional): Sends the hedge, e.g. through the
+                same rate and concurrency limits as other requests. Defaults to `send`.
+
+        Returns:
+            T: The result of the winning call.
+
+        Raises:
+            Exception: The exception of the first call if every call failed.
+        """
+        with self._lock:
+            self.requests += 1
+            self._budget = min(self.burst, self._budget + self.max_extra_load)
+        delay = self.delay(endpoint)
+        primary = asyncio.ensure_future(send())
+        started = time.perf_counter()
+        tasks = [primary]
+        try:
+            if delay is not None:
+                await asyncio.wait(tasks, timeout=delay)
+                if not primary.done() and self._take_hedge():
+                    tasks.append(asyncio.ensure_future((hedge or send)()))
+                    hedge_started = time.perf_counter()
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if primary in done and primary.exception() is None:
+                    self.record(endpoint, time.perf_counter() - started)
+                    return primary.result()
+                if len(tasks) > 1 and tasks[1] in done and tasks[1].exception() is None:
+                    now = time.perf_counter()
+                    self.record(endpoint, now - hedge_started)
+                    if not primary.done():
+                        self.record(endpoint, now - started)  # Censored by the cancellation
+                    with self._lock:
+                        self.hedges_won += 1
+                    return tasks[1].result()
+            return primary.result()  # Every call failed; raises the primary's exception
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let the losers unwind, e.g. free their limiter slots, before the caller goes on
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns a snapshot of the counters and delays, e.g. for exporting to metrics."""
+        with self._lock:
+            endpoints = list(self._latencies)
+            metrics: Dict[str, Any] = {
+                "requests": self.requests,
+                "hedges_issued": self.hedges_issued,
+                "hedges_won": self.hedges_won,
+                "extra_load": self.hedges_issued / self.requests if self.requests else 0.0,
+                "budget": self._budget,
+            }
+        metrics["delays"] = {endpoint: self.delay(endpoint) for endpoint in endpoints}
+        return metrics
+
+    def _take_hedge(self) -> bool:
+        """Spends one hedge of the budget if there is one left."""
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            self.hedges_issued += 1
+            return True
@@ -0,0 +1,228 @@
+"""Local full-text index of fetched courses, answering course searches without the API."""
+
+import os
+import sqlite3
+import threading
+from typing import Any, Iterable, List, Optional, Tuple, Union
+
+from ._base_client import _adapter
+from .models._course import Course
+from .models._filters.course_filters import CourseFilter, Ordering, Price
+from .models._records import CourseRecord
+
+# CourseFilter fields the index can answer; filtering on anything else needs the API
+_SUPPORTED_FILTERS = frozenset({"page", "page_size", "search", "price", "language", "ordering"})
+
+_ORDER_BY = {
+    Ordering.PRICE_LOW_TO_HIGH: "COALESCE(courses.price_amount, 0), courses.id",
+    Ordering.PRICE_HIGH_TO_LOW: "COALESCE(courses.price_amount, 0) DESC, courses.id",
+}
+
+
+def _match_query(search: str) -> str:
+    """Quotes every word of `search` as an FTS5 string, so all words must match."""
+    return " ".join('"' + word.replace('"', '""') + '"' for word in search.split())
+
+
+class CourseIndex:
+    """
+    SQLite FTS5 index of courses, for serving searches locally.
+
+    Courses fetched with get_courses or iter_courses are upserted incrementally; search()
+    then answers CourseFilter queries with full-text matching over title, headline and
+    instructor_name and filters on price, price amount and locale. The index lives in memory
+    by default, or in a database file that survives restarts. Only the SQLite copy of each
+    course is kept, so memory use does not grow with the index; results are decoded from it
+    as new Course objects on every call.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike] = ":memory:") -> None:
+        """
+        Initializes the index, creating its tables if needed.
+
+        Args:
+            path (Union[str, os.PathLike], optional): The database file, or ":memory:" for an
+                index that lives only in this process. Defaults to ":memory:".
+        """
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection as connection:
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS courses (
+                    id INTEGER PRIMARY KEY, title TEXT NOT NULL, headline TEXT,
+                    instructor_name TEXT, is_paid INTEGER NOT NULL, price_amount REAL,
+                    locale TEXT NOT NULL, body BLOB NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS courses_locale ON courses (locale);
+                CREATE VIRTUAL TABLE IF NOT EXISTS courses_fts USING fts5(
+                    title, headline, instructor_name, content='courses', content_rowid='id'
+                );
+                CREATE TRIGGER IF NOT EXISTS courses_ai AFTER INSERT ON courses BEGIN
+                    INSERT INTO courses_fts (rowid, title, headline, instructor_name)
+                    VALUES (new.id, new.title, new.headline, new.instructor_name);
+                END;
+                CREATE TRIGGER IF NOT EXISTS courses_ad AFTER DELETE ON courses BEGIN
+                    INSERT INTO courses_fts (courses_fts, rowid, title, headline, instructor_name)
+                    VALUES ('delete', old.id, old.title, old.headline, old.instructor_name);
+                END;
+                CREATE TRIGGER IF NOT EXISTS courses_au AFTER UPDATE ON courses BEGIN
+                    INSERT INTO courses_fts (courses_fts, rowid, title, headline, instructor_name)
+                    VALUES ('delete', old.id, old.title, old.headline, old.instructor_name);
+                    INSERT INTO courses_fts (rowid, title, headline, instructor_name)
+                    VALUES (new.id, new.title, new.headline, new.instructor_name);
+                END;
+                """)
+
+    def __len__(self) -> int:
+        """Returns the number of indexed courses."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM courses").fetchone()[0]
+
+    def upsert(self, courses: Iterable[Union[Course, CourseRecord]]) -> int:
+        """
+        Adds courses to the index, replacing earlier versions with the same ID.
+
+        Args:
+            courses (Iterable[Union[Course, CourseRecord]]): The courses to index, e.g. a page
+                from get_courses or a client's iter_courses.
+
+        Returns:
+            int: The number of upserted courses.
+        """
+        models = [
+            course.to_model() if isinstance(course, CourseRecord) else course for course in courses
+        ]
+        rows = [
+            (
+                course.id,
+                course.title,
+                course.headline,
+                course.instructor_name,
+                course.is_paid,
+                course.price_detail.amount if course.price_detail is not None else None,
+                course.locale.locale,
+                course.model_dump_json().encode(),
+            )
+            for course in models
+        ]
+        with self._lock, self._connection as connection:
+            connection.executemany(
+                "INSERT INTO courses (id, title, headline, instructor_name, is_paid, "
+                "price_amount, locale, body) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET title = excluded.title, "
+                "headline = excluded.headline, instructor_name = excluded.instructor_name, "
+                "is_paid = excluded.is_paid, price_amount = excluded.price_amount, "
+                "locale = excluded.locale, body = excluded.body",
+                rows,
+            )
+        return len(rows)
+
+    def delete(self, course_id: int) -> None:
+        """Removes the course with `course_id` if it is indexed."""
+        with self._lock, self._connection as connection:
+            connection.execute("DELETE FROM courses WHERE id = ?", (course_id,))
+
+    def get(self, course_id: int) -> Optional[Course]:
+        """Returns the indexed course with `course_id`, or None."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT id, body FROM courses WHERE id = ?", (course_id,)
+            ).fetchone()
+        return self._load([row])[0] if row else None
+
+    def search(
+        self,
+        filters: CourseFilter = CourseFilter(),
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        locale: Optional[str] = None,
+    ) -> List[Course]:
+        """
+        Answers a course search from the index.
+
+        Like get_courses, only the explicitly set fields of `filters` apply: search (every word
+        must match title, headline or instructor_name; results are ranked by relevance),
+        price, language (the locale's language, e.g. "en" for "en_US"), ordering (relevance
+        or price) and page / page_size.
+
+        Args:
+            filters (CourseFilter, optional): A namedtuple containing optional filters.
+            min_price (float, optional): The lowest price amount; courses without a price
+                count as 0.
+            max_price (float, optional): The highest price amount.
+            locale (str, optional): The exact locale, e.g. "en_US".
+
+        Returns:
+            A list of Course objects representing the matching courses.
+
+        Raises:
+            ValueError: If `filters` sets a field or ordering the index cannot answer, such as
+                category or highest-rated; those searches need the API.
+        """
+        unsupported = filters.model_fields_set - _SUPPORTED_FILTERS
+        if unsupported:
+            raise ValueError(f"Cannot search the index by {', '.join(sorted(unsupported))}")
+        sql, params = self._query(filters, min_price, max_price, locale)
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+        return self._load(rows)
+
+    @staticmethod
+    def _query(
+        filters: CourseFilter,
+        min_price: Optional[float],
+        max_price: Optional[float],
+        locale: Optional[str],
+    ) -> Tuple[str, List[Any]]:
+        """Builds the SQL query and parameters of a search."""
+        fields = filters.model_fields_set
+        ordering = filters.ordering if "ordering" in fields else None
+        search = filters.search.strip() if "search" in fields else ""
+        if ordering not in (None, Ordering.RELEVANCE, *_ORDER_BY):
+            raise ValueError(f"Cannot order the index by {ordering.value}")
+
+        joins, where, params = "", [], []
+        if search:
+            joins = "JOIN courses_fts ON courses_fts.rowid = courses.id"
+            where.append("courses_fts MATCH ?")
+            params.append(_match_query(search))
+        if "price" in fields and filters.price is not None:
+            where.append("courses.is_paid = ?")
+            params.append(filters.price is Price.PRICE_PAID)
+        if "language" in fields and filters.language:
+            where.append("(courses.locale = ? OR courses.locale LIKE ? ESCAPE '\\')")
+            params.extend((filters.language, filters.language + "\\_%"))
+        if locale is not None:
+            where.append("courses.locale = ?")
+            params.append(locale)
+        if min_price is not None:
+            where.append("COALESCE(courses.price_amount, 0) >= ?")
+            params.append(min_price)
+        if max_price is not None:
+            where.append("COALESCE(courses.price_amount, 0) <= ?")
+            params.append(max_price)
+
+        if ordering in _ORDER_BY:
+            order_by = _ORDER_BY[ordering]
+        else:
+            order_by = "bm25(courses_fts), courses.id" if search else "courses.id"
+        page_size = filters.page_size or 10
+        params.extend((page_size, ((filters.page or 1) - 1) * page_size))
+        sql = (
+            f"SELECT courses.id, courses.body FROM courses {joins} "
+            f"{'WHERE ' + ' AND '.join(where) if where else ''} "
+            f"ORDER BY {order_by} LIMIT ? OFFSET ?"
+        )
+        return sql, params
+
+    @staticmethod
+    def _load(rows: List[Tuple[int, bytes]]) -> List[Course]:
+        """Returns the courses of result rows, decoded from their stored JSON."""
+        adapter = _adapter(Course)
+        return [adapter.validate_json(body) for _, body in rows]
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._connection.close()
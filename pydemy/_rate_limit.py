@@ -0,0 +1,192 @@
+"""Client-side token-bucket rate limiters for staying within Udemy API quotas."""
+
+import asyncio
+import os
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+
+class RateLimiter(ABC):
+    """
+    Base class of token-bucket rate limiters.
+
+    The bucket holds up to `burst` tokens and refills at `rate` tokens per second; every
+    request takes one token. Limiters work by reservation: taking a token never blocks while
+    holding a lock, it returns how long the caller must wait for its token. The same limiter can
+    therefore be shared by threads (acquire) and asyncio tasks (acquire_async).
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        Initializes the rate limiter.
+
+        Args:
+            rate (float): The sustained number of requests per second.
+            burst (int, optional): The maximum number of requests that may be sent at once
+                after an idle period. Defaults to 1.
+
+        Raises:
+            ValueError: If rate is not positive or burst is lower than 1.
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        if burst < 1:
+            raise ValueError("Burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._stats_lock = threading.Lock()
+        self.acquired = 0
+        self.throttled_seconds = 0.0
+
+    @abstractmethod
+    def _reserve(self) -> float:
+        """Takes one token and returns the number of seconds to wait before using it."""
+
+    def _record(self, delay: float) -> None:
+        """Updates the acquired request and throttled time counters."""
+        with self._stats_lock:
+            self.acquired += 1
+            self.throttled_seconds += delay
+
+    def _refill(self, tokens: float, updated_at: float, now: float) -> Tuple[float, float]:
+        """Returns the token count after taking one token at `now` and the new timestamp."""
+        tokens = min(self.burst, tokens + (now - updated_at) * self.rate)
+        return tokens - 1, now
+
+    def acquire(self) -> float:
+        """
+        Blocks the calling thread until a request may be sent.
+
+        Returns:
+            float: The number of seconds the call was throttled.
+        """
+        delay = self._reserve()
+        self._record(delay)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self) -> float:
+        """
+        Suspends the calling task until a request may be sent.
+
+        Returns:
+            float: The number of seconds the call was throttled.
+        """
+        delay = await self._reserve_async()
+        self._record(delay)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    async def _reserve_async(self) -> float:
+        """Takes one token without blocking the event loop; see _reserve()."""
+        return self._reserve()
+
+
+class TokenBucket(RateLimiter):
+    """In-process token bucket shared by the threads and tasks of one process."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        Initializes the token bucket with a full burst.
+
+        Args:
+            rate (float): The sustained number of requests per second.
+            burst (int, optional): The maximum number of requests that may be sent at once
+                after an idle period. Defaults to 1.
+        """
+        super().__init__(rate, burst)
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Takes one token and returns the number of seconds to wait before using it."""
+        with self._lock:
+            self._tokens, self._updated_at = self._refill(
+                self._tokens, self._updated_at, time.monotonic()
+            )
+            return max(0.0, -self._tokens / self.rate)
+
+
+class FileTokenBucket(RateLimiter):
+    """
+    Token bucket whose state lives in a lock-protected file, shared by processes on one host.
+
+    Every process pointing at the same file draws from a single quota, so a pool of workers can
+    run right at the API limit. Timestamps use the wall clock, which all processes share.
+    """
+
+    _state = struct.Struct("dd")  # tokens, updated_at
+
+    def __init__(self, path: Union[str, os.PathLike], rate: float, burst: int = 1) -> None:
+        """
+        Initializes the shared token bucket. The state file is created with a full burst on
+        first use.
+
+        Args:
+            path (Union[str, os.PathLike]): The path of the state file shared by the processes.
+            rate (float): The sustained number of requests per second across all processes.
+            burst (int, optional): The maximum number of requests that may be sent at once
+                after an idle period. Defaults to 1.
+        """
+        super().__init__(rate, burst)
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()  # Queues local threads before they contend for the file
+
+    def _reserve(self) -> float:
+        """Takes one token from the shared file and returns the seconds to wait before use."""
+        descriptor = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        with self._lock, open(descriptor, "r+b") as state_file:
+            self._lock_file(state_file)
+            try:
+                state_file.seek(0)
+                data = state_file.read(self._state.size)
+                now = time.time()
+                if len(data) == self._state.size:
+                    tokens, updated_at = self._state.unpack(data)
+                else:
+                    tokens, updated_at = float(self.burst), now
+                tokens, updated_at = self._refill(tokens, updated_at, now)
+                state_file.seek(0)
+                state_file.truncate()
+                state_file.write(self._state.pack(tokens, updated_at))
+                state_file.flush()
+            finally:
+                self._unlock_file(state_file)
+        return max(0.0, -tokens / self.rate)
+
+    async def _reserve_async(self) -> float:
+        """
+        Takes one token from the shared file in a worker thread, since locking the file blocks
+        while another process holds it.
+        """
+        return await asyncio.to_thread(self._reserve)
+
+    @staticmethod
+    def _lock_file(state_file) -> None:
+        """Takes an exclusive lock on the state file, blocking until it is available."""
+        if fcntl is not None:
+            fcntl.flock(state_file.fileno(), fcntl.LOCK_EX)
+        else:  # pragma: no cover - Windows
+            state_file.seek(0)
+            msvcrt.locking(state_file.fileno(), msvcrt.LK_LOCK, 1)
+
+    @staticmethod
+    def _unlock_file(state_file) -> None:
+        """Releases the lock on the state file."""
+        if fcntl is not None:
+            fcntl.flock(state_file.fileno(), fcntl.LOCK_UN)
+        else:  # pragma: no cover - Windows
+            state_file.seek(0)
+            msvcrt.locking(state_file.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,56 @@
+"""Result containers returned by the clients' bulk methods."""
+
+from typing import Dict, List, NamedTuple, Optional, Union
+
+from ._exceptions import UdemyAPIError
+from .models._chapter import Chapter
+from .models._course import Course
+from .models._course_review import CourseReview
+from .models._lecture import Lecture
+from .models._quiz import Quiz
+
+
+class CourseDetailsResult(NamedTuple):
+    """
+    Outcome of fetching the details of one course in a bulk request.
+
+    Exactly one of `course` and `error` is set, so a failing ID is reported without aborting
+    the rest of the batch.
+    """
+
+    course_id: int
+    course: Optional[Course] = None
+    error: Optional[UdemyAPIError] = None
+
+    @property
+    def ok(self) -> bool:
+        """Returns whether the course details were retrieved successfully."""
+        return self.error is None
+
+
+class CurriculumSection(NamedTuple):
+    """A chapter of a course's curriculum with its lectures and quizzes, in course order."""
+
+    chapter: Optional[Chapter]
+    items: List[Union[Lecture, Quiz]]
+
+
+class CourseEnrichment(NamedTuple):
+    """
+    The details, first review page and full curriculum of one course from enrich_courses.
+
+    A part that could not be retrieved is None and its UdemyAPIError is kept in `errors` under
+    the part's name ("details", "reviews" or "curriculum"), so one failing request does not
+    discard the other parts of the course.
+    """
+
+    course_id: int
+    course: Optional[Course]
+    reviews: Optional[List[CourseReview]]
+    curriculum: Optional[List[CurriculumSection]]
+    errors: Dict[str, UdemyAPIError]
+
+    @property
+    def ok(self) -> bool:
+        """Returns whether every part of the course was retrieved successfully."""
+        return not self.errors
@@ -0,0 +1,153 @@
+"""Retry policy with exponential backoff for transient Udemy API failures."""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Collection, NamedTuple, Optional
+
+import httpx
+
+
+class RetryAttempt(NamedTuple):
+    """Timing and outcome of one attempt at sending a request, passed to retry hooks."""
+
+    method: str
+    url: str
+    attempt: int
+    elapsed: float
+    status_code: Optional[int]
+    error: Optional[Exception]
+    delay: Optional[float]
+
+    @property
+    def will_retry(self) -> bool:
+        """Returns whether another attempt follows this one."""
+        return self.delay is not None
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+
+    Connection errors, timeouts and responses with a retryable status code are retried up to
+    `max_attempts` times in total, waiting an exponentially growing, jittered backoff between
+    attempts. For 429 and 503 responses the server's Retry-After header takes precedence. Only
+    idempotent methods are retried, since repeating them cannot duplicate side effects.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Collection[int] = (429, 500, 502, 503, 504),
+        retry_methods: Collection[str] = ("GET", "HEAD", "OPTIONS"),
+        respect_retry_after: bool = True,
+        max_retry_after: float = 60.0,
+        on_attempt: Optional[Callable[[RetryAttempt], None]] = None,
+    ) -> None:
+        """
+        Initializes the retry policy.
+
+        Args:
+            max_attempts (int, optional): The maximum number of attempts, including the first
+                one. Defaults to 3.
+            backoff_factor (float, optional): The backoff before the second attempt in seconds;
+                it doubles for each further attempt. Defaults to 0.5.
+            max_backoff (float, optional): The upper bound of the backoff in seconds.
+                Defaults to 30.0.
+            jitter (bool, optional): Whether to pick a random backoff between zero and the
+                exponential value ("full jitter") so clients do not retry in lockstep.
+                Defaults to True.
+            retry_statuses (Collection[int], optional): The response status codes that are
+                retried. Defaults to 429, 500, 502, 503 and 504.
+            retry_methods (Collection[str], optional): The idempotent HTTP methods that may be
+                retried. Defaults to GET, HEAD and OPTIONS.
+            respect_retry_after (bool, optional): Whether to wait as long as the Retry-After
+                header of a 429 or 503 response asks. Defaults to True.
+            max_retry_after (float, optional): The longest Retry-After wait in seconds that is
+                honored; longer waits fail immediately instead. Defaults to 60.0.
+            on_attempt (Callable[[RetryAttempt], None], optional): A hook called after every
+                attempt with its timing and outcome, e.g. for latency metrics.
+
+        Raises:
+            ValueError: If max_attempts is lower than 1.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.on_attempt = on_attempt
+
+    def backoff(self, attempt: int) -> float:
+        """Returns the wait in seconds after the given failed attempt (1-based)."""
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    @staticmethod
+    def retry_after(response: httpx.Response) -> Optional[float]:
+        """
+        Parses the Retry-After header of a response.
+
+        Args:
+            response (httpx.Response): The response to inspect.
+
+        Returns:
+            float, optional: The requested wait in seconds, or None if the header is missing
+                or malformed. Both delay-seconds and HTTP-date values are supported.
+        """
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def next_delay(
+        self,
+        method: str,
+        attempt: int,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """
+        Decides whether a finished attempt is retried.
+
+        Args:
+            method (str): The HTTP method of the request.
+            attempt (int): The number of the finished attempt (1-based).
+            response (httpx.Response, optional): The response, if one was received.
+            error (Exception, optional): The transport error, if the request failed.
+
+        Returns:
+            float, optional: The wait in seconds before the next attempt, or None if the
+                outcome is final.
+        """
+        if attempt >= self.max_attempts or method.upper() not in self.retry_methods:
+            return None
+        if error is not None:
+            return self.backoff(attempt) if isinstance(error, httpx.TransportError) else None
+        if response is None or response.status_code not in self.retry_statuses:
+            return None
+        if self.respect_retry_after and response.status_code in (429, 503):
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after else None
+        return self.backoff(attempt)
+
+    def notify(self, attempt: RetryAttempt) -> None:
+        """Passes the outcome of an attempt to the on_attempt hook, if any."""
+        if self.on_attempt is not None:
+            self.on_attempt(attempt)
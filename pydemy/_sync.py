@@ -0,0 +1,297 @@
+"""Resumable, incremental crawl of the course catalogue with persistent checkpoints."""
+
+import os
+import sqlite3
+import time
+from collections import deque
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from ._client import UdemyClient
+from ._exceptions import UdemyAPIError
+from .models._course import Course
+from .models._course_category import CourseCategory
+from .models._course_subcategory import CourseSubcategory
+from .models._filters.course_filters import CourseFilter, Ordering
+
+_RESULT_WINDOW = 10000  # The API serves no page past page * page_size = 10000
+
+
+class SyncPartition(NamedTuple):
+    """A slice of the catalogue walked on its own, small enough for the API's result window."""
+
+    category: str
+    subcategory: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        """Returns the partition's key in the checkpoint database."""
+        return f"{self.category}|{self.subcategory or ''}"
+
+    def filters(self, base: CourseFilter) -> CourseFilter:
+        """
+        Returns `base` narrowed to the partition.
+
+        Raises:
+            ValidationError: If the category or subcategory is not a known one.
+        """
+        category = CourseCategory(
+            sort_order=0, title=self.category, title_cleaned=_cleaned(self.category)
+        )
+        update = {"category": category}
+        if self.subcategory:
+            update["subcategory"] = CourseSubcategory(
+                category=category,
+                sort_order=0,
+                title=self.subcategory,
+                title_cleaned=_cleaned(self.subcategory),
+            )
+        return CourseFilter.model_validate({**base.model_dump(exclude_unset=True), **update})
+
+    def split(self) -> List["SyncPartition"]:
+        """
+        Returns the partitions of the category's subcategories.
+
+        CourseSubcategory.POSSIBLE_SUBCATEGORIES does not record the parent categories, so
+        every subcategory is paired with the category; pairs that do not exist cost one empty
+        page per run.
+        """
+        subcategories = CourseSubcategory.model_fields["POSSIBLE_SUBCATEGORIES"].default
+        return [SyncPartition(self.category, subcategory) for subcategory in subcategories]
+
+
+def _cleaned(title: str) -> str:
+    """Returns the URL form of a category or subcategory title."""
+    return title.lower().replace(" ", "-")
+
+
+class SyncStats(NamedTuple):
+    """Outcome of one CatalogSync.run call."""
+
+    run_id: int
+    resumed: bool
+    partitions: int
+    pages: int
+    new_courses: int
+    complete: bool
+
+
+def default_partitions() -> List[SyncPartition]:
+    """Returns one partition per entry of CourseCategory.POSSIBLE_CATEGORIES."""
+    categories = CourseCategory.model_fields["POSSIBLE_CATEGORIES"].default
+    return [SyncPartition(category) for category in categories]
+
+
+class CatalogSync:
+    """
+    Walks the course pages of every partition of the catalogue, checkpointing after each page.
+
+    Partitions are walked newest course first with UdemyClient.get_courses. The checkpoint
+    (each partition's last fetched page number, and the IDs of every course seen) is stored in
+    a SQLite database and committed with each page, so a crashed or interrupted run resumes
+    where it stopped instead of starting over. Once a partition has been walked completely,
+    later runs only fetch its pages up to the first page containing an already known course:
+    new courses come first in newest order, so the rest of the partition is unchanged and
+    nightly runs cost a delta instead of a full crawl.
+
+    The API serves at most 10000 courses per query. A category partition filling that window
+    is split into subcategory partitions (see SyncPartition.split), which are walked in its
+    place from then on; a subcategory partition filling it raises UdemyAPIError instead of
+    being recorded as complete.
+
+    Pages are handed to `on_page` before their checkpoint is committed, so a page is delivered
+    at least once; consumers such as CourseIndex.upsert are idempotent.
+    """
+
+    def __init__(
+        self,
+        client: UdemyClient,
+        path: Union[str, os.PathLike],
+        on_page: Callable[[SyncPartition, List[Course]], None],
+        partitions: Optional[Iterable[SyncPartition]] = None,
+        filters: CourseFilter = CourseFilter(page_size=100),
+        lean: bool = False,
+    ) -> None:
+        """
+        Initializes the sync and creates its checkpoint tables if needed.
+
+        Args:
+            client (UdemyClient): The client fetching the pages.
+            path (Union[str, os.PathLike]): The checkpoint database file.
+            on_page (Callable[[SyncPartition, List[Course]], None]): Receives the courses of
+                every fetched page, e.g. to upsert them into a CourseIndex.
+            partitions (Iterable[SyncPartition], optional): The slices of the catalogue to walk.
+                Defaults to default_partitions(), one per category.
+            filters (CourseFilter, optional): Further filters applied to every partition; its
+                page, ordering, category and subcategory are replaced. Defaults to pages of 100
+                courses.
+            lean (bool, optional): Whether to pass CourseRecord objects to on_page instead of
+                Course models. Defaults to False.
+        """
+        self.client = client
+        self.path = os.fspath(path)
+        self.on_page = on_page
+        self.partitions = list(partitions) if partitions is not None else default_partitions()
+        self.page_size = filters.page_size or 10
+        self.lean = lean
+        self._filters = filters.model_copy(
+            update={"page_size": self.page_size, "ordering": Ordering.NEWEST}
+        )
+        self._connection = sqlite3.connect(self.path)
+        with self._connection as connection:
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS sync_runs (
+                    id INTEGER PRIMARY KEY, started_at REAL NOT NULL, finished_at REAL
+                );
+                CREATE TABLE IF NOT EXISTS sync_partitions (
+                    key TEXT PRIMARY KEY, run_id INTEGER NOT NULL, page INTEGER NOT NULL,
+                    delta INTEGER NOT NULL, complete INTEGER NOT NULL,
+                    synced INTEGER NOT NULL DEFAULT 0, split INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE TABLE IF NOT EXISTS sync_courses (
+                    partition_key TEXT NOT NULL, course_id INTEGER NOT NULL,
+                    run_id INTEGER NOT NULL, PRIMARY KEY (partition_key, course_id)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS sync_courses_course_id ON sync_courses (course_id);
+                """)
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(sync_partitions)")}
+            if "split" not in columns:  # Databases created before partitions were split
+                connection.execute(
+                    "ALTER TABLE sync_partitions ADD COLUMN split INTEGER NOT NULL DEFAULT 0"
+                )
+
+    def run(self, max_pages: Optional[int] = None) -> SyncStats:
+        """
+        Runs the sync, resuming the previous run if it did not finish.
+
+        Args:
+            max_pages (int, optional): Stops after this many pages, leaving the run to be
+                resumed by the next call. Defaults to None (until every partition is done).
+
+        Returns:
+            SyncStats: The run's ID, whether it was resumed, and what it fetched.
+
+        Raises:
+            UdemyAPIError: If a page cannot be fetched, or a subcategory partition holds more
+                courses than the API's result window. The pages before it stay checkpointed.
+        """
+        run_id, resumed = self._start_run()
+        pages = new_courses = partitions = 0
+        queue = deque(self.partitions)
+        while queue:
+            partition = queue.popleft()
+            state = self._connection.execute(
+                "SELECT run_id, page, delta, complete, synced, split FROM sync_partitions "
+                "WHERE key = ?",
+                (partition.key,),
+            ).fetchone()
+            if state is not None and state[5]:
+                queue.extendleft(reversed(partition.split()))
+                continue
+            if state is not None and state[0] == run_id:
+                _, page, delta, complete, _, _ = state
+                if complete:
+                    continue
+            else:
+                page, delta = 0, bool(state and state[4])
+            partitions += 1
+            filters = partition.filters(self._filters)
+
+            while True:
+                if max_pages is not None and pages >= max_pages:
+                    return SyncStats(run_id, resumed, partitions, pages, new_courses, False)
+                if (page + 1) * self.page_size > _RESULT_WINDOW:
+                    raise UdemyAPIError(
+                        f"Partition {partition.key} holds more than {_RESULT_WINDOW} courses, "
+                        "the most the API serves; narrow it with filters"
+                    )
+                page += 1
+                filters = filters.model_copy(update={"page": page})
+                courses = self.client.get_courses(filters, lean=self.lean)
+                pages += 1
+                if courses:
+                    self.on_page(partition, courses)
+                new, complete, split = self._checkpoint(run_id, partition, page, delta, courses)
+                new_courses += new
+                if split:
+                    queue.extendleft(reversed(partition.split()))
+                if complete or split:
+                    break
+
+        with self._connection as connection:
+            connection.execute(
+                "UPDATE sync_runs SET finished_at = ? WHERE id = ?", (time.time(), run_id)
+            )
+        return SyncStats(run_id, resumed, partitions, pages, new_courses, True)
+
+    def _start_run(self) -> Tuple[int, bool]:
+        """Returns the ID of the unfinished run to resume, or of a new run, and if resumed."""
+        row = self._connection.execute(
+            "SELECT id, finished_at FROM sync_runs ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+        if row is not None and row[1] is None:
+            return row[0], True
+        with self._connection as connection:
+            cursor = connection.execute(
+                "INSERT INTO sync_runs (started_at) VALUES (?)", (time.time(),)
+            )
+        return cursor.lastrowid, False
+
+    def _checkpoint(
+        self,
+        run_id: int,
+        partition: SyncPartition,
+        page: int,
+        delta: bool,
+        courses: List[Course],
+    ) -> Tuple[int, bool, bool]:
+        """
+        Records a fetched page in one transaction.
+
+        Returns:
+            Tuple[int, bool, bool]: The number of courses not seen before in any partition,
+                whether the partition is done (the page was not full, or its delta reached a
+                course known to the partition), and whether a category partition was split
+                because the page was the last of the API's result window.
+        """
+        ids = sorted({course.id for course in courses})
+        with self._connection as connection:
+            known = connection.execute(
+                "SELECT COUNT(DISTINCT course_id) FROM sync_courses WHERE course_id IN "
+                f"({', '.join('?' * len(ids))})",
+                ids,
+            ).fetchone()[0]
+            before = connection.total_changes
+            connection.executemany(
+                "INSERT OR IGNORE INTO sync_courses (partition_key, course_id, run_id) "
+                "VALUES (?, ?, ?)",
+                [(partition.key, course.id, run_id) for course in courses],
+            )
+            new = connection.total_changes - before
+            complete = (delta and new < len(courses)) or len(courses) < self.page_size
+            split = (
+                not complete
+                and partition.subcategory is None
+                and (page + 1) * self.page_size > _RESULT_WINDOW
+            )
+            connection.execute(
+                "INSERT INTO sync_partitions (key, run_id, page, delta, complete, synced, split) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+                "run_id = excluded.run_id, page = excluded.page, delta = excluded.delta, "
+                "complete = excluded.complete, synced = synced OR excluded.synced, "
+                "split = excluded.split",
+                (partition.key, run_id, page, delta, complete, complete, split),
+            )
+        return len(ids) - known, complete, split
+
+    def known_courses(self, partition: Optional[SyncPartition] = None) -> int:
+        """Returns the number of distinct courses seen, overall or in one partition."""
+        if partition is None:
+            sql, params = "SELECT COUNT(DISTINCT course_id) FROM sync_courses", ()
+        else:
+            sql = "SELECT COUNT(*) FROM sync_courses WHERE partition_key = ?"
+            params = (partition.key,)
+        return self._connection.execute(sql, params).fetchone()[0]
+
+    def close(self) -> None:
+        """Closes the checkpoint database."""
+        self._connection.close()
@@ -17,6 +17,8 @@ __all__ = [
     "Lecture",
     # Quiz model
     "Quiz",
+    # Union of curriculum item models
+    "CurriculumItem",
     # User model
     "User",
     # Additional filter classes
@@ -24,6 +26,16 @@ __all__ = [
     "InstructionalLevel",
     "Ordering",
     "Duration",
+    # Lean records
+    "Record",
+    "CourseRecord",
+    "CourseReviewRecord",
+    "InstructorRecord",
+    "LocaleRecord",
+    "PriceDetailRecord",
+    "UserRecord",
+    # Serialization helpers
+    "dump_many_json",
 ]
 
 from ._chapter import Chapter
@@ -31,6 +43,7 @@ from ._course import Course, Instructor, Locale, PriceDetail
 from ._course_category import CourseCategory
 from ._course_review import CourseReview
 from ._course_subcategory import CourseSubcategory
+from ._curriculum import CurriculumItem
 from ._filters.course_filters import (
     CourseFilter,
     Duration,
@@ -40,5 +53,15 @@ from ._filters.course_filters import (
 )
 from ._filters.review_filters import ReviewFilter
 from ._lecture import Asset, Lecture
+from ._mixins.serializers import dump_many_json
 from ._quiz import Quiz
+from ._records import (
+    CourseRecord,
+    CourseReviewRecord,
+    InstructorRecord,
+    LocaleRecord,
+    PriceDetailRecord,
+    Record,
+    UserRecord,
+)
 from ._user import User
@@ -1,8 +1,10 @@
 """Pydantic model representing a Chapter object as inferred from the Udemy API response."""
 
-from datetime import datetime
+from typing import Literal
 
-from ._mixins.serializers import DateTimeSerializer
+from pydantic import Field
+
+from ._mixins.serializers import DateTimeSerializer, IsoDatetime
 
 
 class Chapter(DateTimeSerializer):
@@ -13,8 +15,11 @@ class Chapter(DateTimeSerializer):
     documented by Udemy.
     """
 
+    # The API's `_class` tag, used to pick the model of mixed curriculum entries
+    class_: Literal["chapter"] = Field("chapter", alias="_class", exclude=True, repr=False)
+
     id: int
-    created: datetime
+    created: IsoDatetime
     sort_order: int
     title: str
     description: str
@@ -1,8 +1,6 @@
 """Pydantic model representing a Udemy Course Review with a nested User model."""
 
-from datetime import datetime
-
-from ._mixins.serializers import DateTimeSerializer
+from ._mixins.serializers import DateTimeSerializer, IsoDatetime
 from ._user import User
 
 
@@ -12,7 +10,7 @@ class CourseReview(DateTimeSerializer):
     id: int
     content: str
     rating: float
-    created: datetime
-    modified: datetime
-    user_modified: datetime
+    created: IsoDatetime
+    modified: IsoDatetime
+    user_modified: IsoDatetime
     user: User
@@ -0,0 +1,12 @@
+"""Discriminated union of the item types found in a course's public curriculum."""
+
+from typing import Annotated, Union
+
+from pydantic import Field
+
+from ._chapter import Chapter
+from ._lecture import Lecture
+from ._quiz import Quiz
+
+# A chapter, lecture or quiz, selected by the `_class` key of the API entry in one pass
+CurriculumItem = Annotated[Union[Chapter, Lecture, Quiz], Field(discriminator="class_")]
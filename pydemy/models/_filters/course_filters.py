@@ -1,13 +1,23 @@
 """Pydantic models and enums for filtering course search results on Udemy API."""
 
 from enum import Enum
-from typing import Optional, Self
+from typing import Optional, Self, Union
 
-from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
 
 from .._course_category import CourseCategory
 from .._course_subcategory import CourseSubcategory
 
+# Pydantic keeps the lists as field defaults, not as class attributes
+_POSSIBLE_CATEGORIES = CourseCategory.model_fields["POSSIBLE_CATEGORIES"].default
+_POSSIBLE_SUBCATEGORIES = CourseSubcategory.model_fields["POSSIBLE_SUBCATEGORIES"].default
+
 
 class Price(Enum):
     """Enumeration representing the possible price options for courses."""
@@ -95,12 +105,12 @@ class CourseFilter(BaseModel):
         Returns:
             (CourseCategory, optional): The validated category.
         """
-        if category and category.title not in CourseCategory.POSSIBLE_CATEGORIES:
+        if category and category.title not in _POSSIBLE_CATEGORIES:
             error_messgae = (
                 "Invalid course category selected. Please refer to the Udemy documentation "
                 "for available categories: https://www.udemy.com/developers/affiliate/models/course-category/"  # pylint: disable=line-too-long
             )
-            raise ValidationError(error_messgae)
+            raise ValueError(error_messgae)
         return category
 
     @model_validator(mode="after")
@@ -117,11 +127,20 @@ class CourseFilter(BaseModel):
 
         if subcategory:
             if not category:
-                raise ValidationError("Please select a parent category for subcategory.")
-            if category.title.capitalize() not in CourseSubcategory.POSSIBLE_SUBCATEGORIES:
+                raise ValueError("Please select a parent category for subcategory.")
+            if subcategory.title not in _POSSIBLE_SUBCATEGORIES:
                 error_messgae = (
                     "Invalid course subcategory selected. Please refer to the Udemy documentation "
                     "for available categories: https://www.udemy.com/developers/affiliate/models/course-subcategory/"  # pylint: disable=line-too-long
                 )
-                raise ValidationError(error_messgae)
+                raise ValueError(error_messgae)
+            if subcategory.category.title != category.title:
+                raise ValueError("The subcategory belongs to a different parent category.")
         return self
+
+    @field_serializer("category", "subcategory", when_used="json")
+    def serialize_title(
+        self, value: Optional[Union[CourseCategory, CourseSubcategory]]
+    ) -> Optional[str]:
+        """Serializes the category and subcategory as their titles in JSON query parameters."""
+        return value.title if value else None
@@ -1,9 +1,10 @@
 """Pydantic models representing a Lecture and nested Asset object."""
 
-from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
-from ._mixins.serializers import DateTimeSerializer
+from pydantic import Field
+
+from ._mixins.serializers import DateTimeSerializer, IsoDatetime
 
 
 class Asset(DateTimeSerializer):
@@ -18,7 +19,7 @@ class Asset(DateTimeSerializer):
     id: int
     asset_type: str
     title: str
-    created: datetime
+    created: IsoDatetime
 
 
 class Lecture(DateTimeSerializer):
@@ -29,9 +30,12 @@ class Lecture(DateTimeSerializer):
     explicitly documented by Udemy.
     """
 
+    # The API's `_class` tag, used to pick the model of mixed curriculum entries
+    class_: Literal["lecture"] = Field("lecture", alias="_class", exclude=True, repr=False)
+
     id: int
     title: str
-    created: datetime
+    created: IsoDatetime
     description: str
     title_cleaned: str
     is_published: bool
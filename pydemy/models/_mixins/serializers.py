@@ -1,26 +1,36 @@
-"""Mixins for model serialization."""
+"""Mixins and helpers for model serialization."""
 
 from datetime import datetime
-from typing import Any, Dict
+from typing import Annotated, Any, Iterable, List
 
-from pydantic import BaseModel, model_serializer
+from pydantic import BaseModel, PlainSerializer, TypeAdapter
+
+# A datetime serialized to an ISO 8601 string in both dump modes; pydantic-core calls the
+# C-level datetime.isoformat directly, so serialization never leaves the compiled path
+IsoDatetime = Annotated[datetime, PlainSerializer(datetime.isoformat, return_type=str)]
+
+_models_adapter = TypeAdapter(List[Any])  # Serializes each item with its own model schema
 
 
 class DateTimeSerializer(BaseModel):
-    """Mixin class for serializing datetime fields to ISO 8601 format."""
-
-    @model_serializer()
-    def serialize_datetimes(self) -> Dict[str, Any]:
-        """
-        Serializes the model to a dictionary.
-
-        Converts datetime fields to ISO 8601 format for JSON compatibility.
-        """
-        model_dict = {}
-        for field_name, _ in self.model_fields.items():
-            field_value = getattr(self, field_name)
-            if isinstance(field_value, datetime):
-                model_dict[field_name] = field_value.isoformat()
-            else:
-                model_dict[field_name] = field_value
-        return model_dict
+    """
+    Mixin class for models whose datetime fields serialize to ISO 8601 format.
+
+    Subclasses annotate their datetime fields as IsoDatetime, so model_dump() and
+    model_dump_json() run entirely in pydantic-core's compiled serializer, including nested
+    models and include/exclude options.
+    """
+
+
+def dump_many_json(models: Iterable[BaseModel]) -> bytes:
+    """
+    Serializes models into a single JSON array in one pass, without building a dict per model.
+
+    Args:
+        models (Iterable[BaseModel]): The models to serialize; they may be of different types,
+            e.g. the items of a curriculum.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON array.
+    """
+    return _models_adapter.dump_json(models if isinstance(models, list) else list(models))
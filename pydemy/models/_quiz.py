@@ -1,8 +1,9 @@
 """Pydantic model representing a Quiz object as inferred from the Udemy API response."""
 
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class Quiz(BaseModel):
@@ -13,6 +14,9 @@ class Quiz(BaseModel):
     documented by Udemy.
     """
 
+    # The API's `_class` tag, used to pick the model of mixed curriculum entries
+    class_: Literal["quiz"] = Field("quiz", alias="_class", exclude=True, repr=False)
+
     id: int
     title: str
     type: str
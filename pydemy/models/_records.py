@@ -0,0 +1,133 @@
+"""
+Lightweight, slotted record counterparts of the Course and CourseReview models for keeping
+large result sets in memory.
+"""
+
+from typing import Any, ClassVar, Dict, List, Optional, Type
+
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
+
+from ._course import Course, Instructor, Locale, PriceDetail
+from ._course_review import CourseReview
+from ._mixins.serializers import IsoDatetime
+from ._user import User
+
+_RECORD_CONFIG = ConfigDict(extra="ignore")
+
+
+class Record:
+    """
+    Base class of lean records.
+
+    Records are frozen dataclasses with `__slots__`: they have the same field names as their
+    model but no per-instance `__dict__` or pydantic bookkeeping, which makes them several
+    times smaller. Their fields are still validated by pydantic-core when they are parsed.
+    """
+
+    __slots__ = ()
+    model_class: ClassVar[Type[BaseModel]]
+
+    def to_model(self) -> Any:
+        """
+        Converts the record, including its nested records, into the full Pydantic model.
+
+        Returns:
+            The model instance of `model_class`.
+        """
+        return self.model_class.model_validate(self, from_attributes=True)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True, config=_RECORD_CONFIG)
+class UserRecord(Record):
+    """Lean record of a User."""
+
+    model_class: ClassVar[Type[BaseModel]] = User
+
+    title: str
+    name: str
+    display_name: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True, config=_RECORD_CONFIG)
+class InstructorRecord(UserRecord):
+    """Lean record of an Instructor."""
+
+    model_class: ClassVar[Type[BaseModel]] = Instructor
+
+    job_title: Optional[str] = None
+    image_50x50: Optional[str] = None
+    image_100x100: Optional[str] = None
+    initials: str
+    url: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True, config=_RECORD_CONFIG)
+class PriceDetailRecord(Record):
+    """Lean record of a course's PriceDetail."""
+
+    model_class: ClassVar[Type[BaseModel]] = PriceDetail
+
+    amount: float
+    currency: str
+    price_string: str
+    currency_symbol: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True, config=_RECORD_CONFIG)
+class LocaleRecord(Record):
+    """Lean record of a course's Locale."""
+
+    model_class: ClassVar[Type[BaseModel]] = Locale
+
+    locale: str
+    title: str
+    english_title: str
+    simple_english_title: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True, config=_RECORD_CONFIG)
+class CourseRecord(Record):
+    """Lean record of a Course."""
+
+    model_class: ClassVar[Type[BaseModel]] = Course
+
+    id: int
+    title: str
+    url: str
+    is_paid: bool
+    price: Optional[str]
+    price_detail: Optional[PriceDetailRecord]
+    price_serve_tracking_id: Optional[str]
+    visible_instructors: List[InstructorRecord]
+    image_125_H: str
+    image_240x135: str
+    is_practice_test_course: bool
+    image_480x270: str
+    published_title: str
+    tracking_id: str = ""
+    locale: LocaleRecord
+    predictive_score: Optional[float] = None
+    relevancy_score: Optional[float] = None
+    input_features: Optional[Dict[str, Any]] = None
+    lecture_search_result: Optional[Dict[str, Any]] = None
+    curriculum_lectures: Optional[List[Dict[str, Any]]] = Field(default_factory=list)
+    order_in_results: Optional[int] = None
+    curriculum_items: Optional[List[Dict[str, Any]]] = Field(default_factory=list)
+    headline: Optional[str] = None
+    instructor_name: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True, config=_RECORD_CONFIG)
+class CourseReviewRecord(Record):
+    """Lean record of a CourseReview."""
+
+    model_class: ClassVar[Type[BaseModel]] = CourseReview
+
+    id: int
+    content: str
+    rating: float
+    created: IsoDatetime
+    modified: IsoDatetime
+    user_modified: IsoDatetime
+    user: UserRecord
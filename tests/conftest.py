@@ -7,6 +7,22 @@ import pytest
 from pydemy import AsyncUdemyClient, UdemyClient
 
 
+class FakeClock:
+    """Controllable replacement for time.monotonic / time.time."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def fake_clock():
+    """Fixture providing a clock that only advances when a test moves `now`."""
+    return FakeClock()
+
+
 @pytest.fixture
 def client_credentials():
     """Fixture providing test client credentials."""
@@ -85,33 +101,147 @@ def mock_review_response():
 
 
 @pytest.fixture
-def mock_curriculum_response():
+def mock_curriculum_response(curriculum_payload):
     """Fixture providing mock curriculum API response."""
+    return {"results": curriculum_payload}
+
+
+@pytest.fixture
+def course_payload():
+    """Fixture providing a complete course entry that validates against the Course model."""
     return {
-        "results": [
-            {
-                "_class": "chapter",
-                "id": 1,
-                "title": "Introduction",
-                "description": "Course introduction",
-            },
-            {
-                "_class": "lecture",
-                "id": 2,
-                "title": "Getting Started",
-                "asset": {"_class": "asset", "id": 123, "title": "Introduction Video"},
-            },
+        "_class": "course",
+        "id": 12345,
+        "title": "Test Python Course",
+        "url": "/course/test-python-course/",
+        "is_paid": True,
+        "price": "$19.99",
+        "price_detail": {
+            "amount": 19.99,
+            "currency": "USD",
+            "price_string": "$19.99",
+            "currency_symbol": "$",
+        },
+        "price_serve_tracking_id": "tracking-id",
+        "visible_instructors": [
             {
-                "_class": "quiz",
-                "id": 3,
-                "title": "Knowledge Check",
-                "duration": 300,
-                "pass_percent": 80.0,
-            },
-        ]
+                "_class": "user",
+                "title": "John Doe",
+                "name": "John",
+                "display_name": "John Doe",
+                "job_title": "Developer",
+                "image_50x50": "https://example.com/50.jpg",
+                "image_100x100": "https://example.com/100.jpg",
+                "initials": "JD",
+                "url": "/user/john-doe/",
+            }
+        ],
+        "image_125_H": "https://example.com/125.jpg",
+        "image_240x135": "https://example.com/240.jpg",
+        "is_practice_test_course": False,
+        "image_480x270": "https://example.com/480.jpg",
+        "published_title": "test-python-course",
+        "tracking_id": "",
+        "locale": {
+            "_class": "locale",
+            "locale": "en_US",
+            "title": "English (US)",
+            "english_title": "English (US)",
+            "simple_english_title": "English",
+        },
+        "headline": "Learn Python from scratch",
+        "instructor_name": "John Doe",
+    }
+
+
+@pytest.fixture
+def review_payload():
+    """Fixture providing a complete review entry that validates against the CourseReview model."""
+    return {
+        "_class": "course_review",
+        "id": 987,
+        "content": "Great course!",
+        "rating": 5.0,
+        "created": "2023-01-01T00:00:00Z",
+        "modified": "2023-01-02T00:00:00Z",
+        "user_modified": "2023-01-02T00:00:00Z",
+        "user": {
+            "_class": "user",
+            "title": "Jane Smith",
+            "name": "Jane",
+            "display_name": "Jane Smith",
+        },
     }
 
 
+@pytest.fixture
+def curriculum_payload():
+    """Fixture providing complete chapter, lecture and quiz entries of a curriculum page."""
+    return [
+        {
+            "_class": "chapter",
+            "id": 1,
+            "created": "2023-01-01T00:00:00Z",
+            "sort_order": 3,
+            "title": "Introduction",
+            "description": "Course introduction",
+            "is_published": True,
+        },
+        {
+            "_class": "lecture",
+            "id": 2,
+            "title": "Getting Started",
+            "created": "2023-01-01T00:00:00Z",
+            "description": "First steps",
+            "title_cleaned": "getting-started",
+            "is_published": True,
+            "is_downloadable": False,
+            "is_free": True,
+            "asset": {
+                "_class": "asset",
+                "id": 123,
+                "asset_type": "Video",
+                "title": "intro.mp4",
+                "created": "2023-01-01T00:00:00Z",
+            },
+            "sort_order": 2,
+            "can_be_previewed": True,
+        },
+        {
+            "_class": "quiz",
+            "id": 3,
+            "title": "Knowledge Check",
+            "type": "simple-quiz",
+            "created": "2023-01-01T00:00:00Z",
+            "description": "Check your knowledge",
+            "title_cleaned": "knowledge-check",
+            "is_published": True,
+            "sort_order": 1,
+            "object_index": 1,
+            "is_draft": False,
+            "version": 1,
+            "duration": 300,
+            "pass_percent": 80.0,
+        },
+    ]
+
+
+@pytest.fixture
+def curriculum_page(curriculum_payload):
+    """
+    Fixture building page `page` of a curriculum served as `pages` pages: the chapter of
+    curriculum_payload with ID `page`, and sort_order values counting down through the course.
+    """
+
+    def build(page, pages):
+        offset = (pages - page) * len(curriculum_payload)
+        items = [dict(item, sort_order=item["sort_order"] + offset) for item in curriculum_payload]
+        items[0]["id"] = page
+        return items
+
+    return build
+
+
 @pytest.fixture
 def mock_http_error_response():
     """Fixture providing mock HTTP error response."""
@@ -135,8 +265,8 @@ def async_client(client_credentials):
 
 @pytest.fixture
 def mock_httpx_get():
-    """Fixture for mocking httpx.get."""
-    with patch("httpx.get") as mock_get:
+    """Fixture for mocking the pooled httpx.Client.get."""
+    with patch("httpx.Client.get") as mock_get:
         yield mock_get
 
 
@@ -145,7 +275,7 @@ def mock_httpx_async_client():
     """Fixture for mocking httpx.AsyncClient."""
     with patch("httpx.AsyncClient") as mock_client:
         mock_instance = Mock()
-        mock_client.return_value.__aenter__.return_value = mock_instance
+        mock_client.return_value = mock_instance
         yield mock_instance
 
 
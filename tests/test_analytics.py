@@ -0,0 +1,101 @@
+"""Tests for the incremental review statistics."""
+
+import math
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from pydemy import ReviewColumns, ReviewStats, TrendPoint
+from pydemy.models import CourseReview
+
+
+def _reviews(payload, ratings, created):
+    """Returns CourseReview models with the given ratings, all created at `created`."""
+    return [
+        CourseReview.model_validate(dict(payload, id=index, rating=rating, created=created))
+        for index, rating in enumerate(ratings)
+    ]
+
+
+class TestReviewStats:
+    """Test cases for ReviewStats."""
+
+    def test_histogram_mean_and_percentiles(self, review_payload):
+        """Test the rating distribution statistics of one batch."""
+        stats = ReviewStats().update(
+            _reviews(review_payload, [5.0, 4.5, 4.0, 5.0, 1.0], "2024-01-01T00:00:00Z")
+        )
+        assert len(stats) == 5
+        assert stats.histogram() == {1.0: 1, 4.0: 1, 4.5: 1, 5.0: 2}
+        assert stats.mean() == pytest.approx(3.9)
+        assert stats.percentiles((0, 20, 50, 100)) == {0: 1.0, 20: 1.0, 50: 4.5, 100: 5.0}
+
+    def test_incremental_updates_match_one_batch(self, review_payload):
+        """Test that page-by-page updates and ReviewColumns give the same statistics."""
+        first = _reviews(review_payload, [5.0, 3.0], "2024-01-01T00:00:00Z")
+        second = _reviews(review_payload, [4.0, 2.5], "2024-02-01T00:00:00Z")
+        paged = ReviewStats().update(first).update(ReviewColumns(second))
+        batch = ReviewStats().update(first + second)
+        assert paged.histogram() == batch.histogram()
+        assert paged.trend() == batch.trend()
+
+    def test_trend_and_recent_mean(self, review_payload):
+        """Test that reviews are bucketed by creation time."""
+        stats = ReviewStats(bucket=timedelta(days=1))
+        stats.update(_reviews(review_payload, [2.0, 3.0], "2024-01-01T08:00:00Z"))
+        stats.update(_reviews(review_payload, [5.0], "2024-01-03T12:00:00Z"))
+
+        assert stats.trend() == [
+            TrendPoint(datetime(2024, 1, 1, tzinfo=timezone.utc), 2, 2.5),
+            TrendPoint(datetime(2024, 1, 3, tzinfo=timezone.utc), 1, 5.0),
+        ]
+        since = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        assert stats.mean(since=since) == 5.0
+        assert stats.histogram(since=since) == {5.0: 1}
+        assert len(stats.trend(since=since)) == 1
+
+    def test_weighted_mean(self, review_payload):
+        """Test that older reviews count less, by half per half-life."""
+        stats = ReviewStats(bucket=timedelta(days=1))
+        stats.update(_reviews(review_payload, [1.0], "2024-01-01T00:00:00Z"))
+        stats.update(_reviews(review_payload, [4.0], "2024-01-11T00:00:00Z"))
+        # The old review weighs 0.5: (0.5 * 1 + 1 * 4) / 1.5
+        assert stats.weighted_mean(timedelta(days=10)) == pytest.approx(3.0)
+        assert stats.mean() == 2.5
+
+    def test_merge(self, review_payload):
+        """Test that statistics built separately can be combined."""
+        left = ReviewStats().update(_reviews(review_payload, [5.0], "2024-01-01T00:00:00Z"))
+        right = ReviewStats().update(_reviews(review_payload, [3.0], "2024-01-01T00:00:00Z"))
+        assert left.merge(right).histogram() == {3.0: 1, 5.0: 1}
+        with pytest.raises(ValueError):
+            left.merge(ReviewStats(bucket=timedelta(days=1)))
+
+    def test_empty(self):
+        """Test that statistics of no reviews are NaN or empty."""
+        stats = ReviewStats()
+        assert math.isnan(stats.mean())
+        assert math.isnan(stats.weighted_mean(timedelta(days=30)))
+        assert math.isnan(stats.percentiles((50,))[50])
+        assert stats.histogram() == {}
+        assert stats.trend() == []
+
+    def test_invalid_arguments(self):
+        """Test that invalid buckets and percentiles are rejected."""
+        with pytest.raises(ValueError):
+            ReviewStats(bucket=timedelta(0))
+        with pytest.raises(ValueError):
+            ReviewStats().percentiles((101,))
+
+    def test_from_client_pages(self, sync_client, review_payload):
+        """Test that lean records streamed from the client can be counted directly."""
+        sync_client._http_client = httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200, json={"next": None, "results": [review_payload] * 4}
+                )
+            )
+        )
+        stats = ReviewStats().update(sync_client.iter_course_reviews(12345, lean=True))
+        assert stats.histogram() == {5.0: 4}
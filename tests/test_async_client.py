@@ -1,12 +1,23 @@
 """Tests for the asynchronous AsyncUdemyClient."""
 
+import asyncio
+import json
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 import httpx
 
-from pydemy import AsyncUdemyClient
+from pydemy import AsyncUdemyClient, RetryPolicy
 from pydemy._exceptions import UdemyAPIError
-from pydemy.models import CourseFilter, ReviewFilter
+from pydemy.models import (
+    Chapter,
+    CourseFilter,
+    CourseRecord,
+    CourseReviewRecord,
+    Lecture,
+    Quiz,
+    ReviewFilter,
+)
 
 
 class TestAsyncUdemyClient:
@@ -49,10 +60,10 @@ class TestAsyncUdemyClient:
         """Test successful async course retrieval."""
         mock_client_instance = AsyncMock()
         mock_response = AsyncMock()
-        mock_response.json.return_value = mock_course_response
+        mock_response.content = json.dumps(mock_course_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_client_instance.get.return_value = mock_response
-        mock_async_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_async_client_class.return_value = mock_client_instance
 
         courses = await async_client.get_courses()
         
@@ -67,10 +78,10 @@ class TestAsyncUdemyClient:
         """Test async course retrieval with filters."""
         mock_client_instance = AsyncMock()
         mock_response = AsyncMock()
-        mock_response.json.return_value = mock_course_response
+        mock_response.content = json.dumps(mock_course_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_client_instance.get.return_value = mock_response
-        mock_async_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_async_client_class.return_value = mock_client_instance
 
         filters = CourseFilter(**sample_course_filter_data)
         courses = await async_client.get_courses(filters)
@@ -88,7 +99,7 @@ class TestAsyncUdemyClient:
         """Test HTTP error handling in async get_courses."""
         mock_client_instance = AsyncMock()
         mock_client_instance.get.side_effect = httpx.HTTPStatusError("404 Not Found", request=Mock(), response=Mock(status_code=404))
-        mock_async_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_async_client_class.return_value = mock_client_instance
         
         with pytest.raises(UdemyAPIError, match="HTTP error 404"):
             await async_client.get_courses()
@@ -99,7 +110,7 @@ class TestAsyncUdemyClient:
         """Test request error handling in async get_courses."""
         mock_client_instance = AsyncMock()
         mock_client_instance.get.side_effect = httpx.RequestError("Connection error")
-        mock_async_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_async_client_class.return_value = mock_client_instance
         
         with pytest.raises(UdemyAPIError, match="Request error"):
             await async_client.get_courses()
@@ -110,10 +121,10 @@ class TestAsyncUdemyClient:
         """Test JSON parsing error handling in async get_courses."""
         mock_client_instance = AsyncMock()
         mock_response = AsyncMock()
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response.content = b"Invalid JSON"
         mock_response.raise_for_status.return_value = None
         mock_client_instance.get.return_value = mock_response
-        mock_async_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_async_client_class.return_value = mock_client_instance
         
         with pytest.raises(UdemyAPIError, match="JSON parsing error"):
             await async_client.get_courses()
@@ -124,10 +135,10 @@ class TestAsyncUdemyClient:
         """Test successful async course details retrieval."""
         mock_client_instance = AsyncMock()
         mock_response = AsyncMock()
-        mock_response.json.return_value = mock_course_detail_response
+        mock_response.content = json.dumps(mock_course_detail_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_client_instance.get.return_value = mock_response
-        mock_async_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_async_client_class.return_value = mock_client_instance
 
         course = await async_client.get_course_details(12345)
         
@@ -141,10 +152,10 @@ class TestAsyncUdemyClient:
         """Test successful async course reviews retrieval."""
         mock_client_instance = AsyncMock()
         mock_response = AsyncMock()
-        mock_response.json.return_value = mock_review_response
+        mock_response.content = json.dumps(mock_review_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_client_instance.get.return_value = mock_response
-        mock_async_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_async_client_class.return_value = mock_client_instance
 
         reviews = await async_client.get_course_reviews(12345)
         
@@ -159,10 +170,10 @@ class TestAsyncUdemyClient:
         """Test async course reviews retrieval with filters."""
         mock_client_instance = AsyncMock()
         mock_response = AsyncMock()
-        mock_response.json.return_value = mock_review_response
+        mock_response.content = json.dumps(mock_review_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_client_instance.get.return_value = mock_response
-        mock_async_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_async_client_class.return_value = mock_client_instance
 
         filters = ReviewFilter(**sample_review_filter_data)
         reviews = await async_client.get_course_reviews(12345, filters)
@@ -180,10 +191,10 @@ class TestAsyncUdemyClient:
         """Test successful async curriculum retrieval."""
         mock_client_instance = AsyncMock()
         mock_response = AsyncMock()
-        mock_response.json.return_value = mock_curriculum_response
+        mock_response.content = json.dumps(mock_curriculum_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_client_instance.get.return_value = mock_response
-        mock_async_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_async_client_class.return_value = mock_client_instance
 
         curriculum = await async_client.get_course_public_curriculum(12345)
         
@@ -196,10 +207,10 @@ class TestAsyncUdemyClient:
         """Test async curriculum retrieval with pagination parameters."""
         mock_client_instance = AsyncMock()
         mock_response = AsyncMock()
-        mock_response.json.return_value = mock_curriculum_response
+        mock_response.content = json.dumps(mock_curriculum_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_client_instance.get.return_value = mock_response
-        mock_async_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_async_client_class.return_value = mock_client_instance
 
         curriculum = await async_client.get_course_public_curriculum(12345, page=2, page_size=20)
         
@@ -214,89 +225,57 @@ class TestAsyncUdemyClient:
 
     @pytest.mark.asyncio
     @patch('httpx.AsyncClient')
-    async def test_get_course_public_curriculum_parsing_chapter(self, mock_async_client_class, async_client):
+    async def test_get_course_public_curriculum_parsing_chapter(self, mock_async_client_class, async_client, curriculum_payload):
         """Test async curriculum parsing for chapter entries."""
-        response_data = {
-            "results": [
-                {
-                    "_class": "chapter",
-                    "id": 1,
-                    "title": "Introduction",
-                    "description": "Course introduction"
-                }
-            ]
-        }
+        response_data = {"results": [curriculum_payload[0]]}
         mock_client_instance = AsyncMock()
         mock_response = AsyncMock()
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_client_instance.get.return_value = mock_response
-        mock_async_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_async_client_class.return_value = mock_client_instance
 
         curriculum = await async_client.get_course_public_curriculum(12345)
         
         assert len(curriculum) == 1
-        assert curriculum[0]["_class"] == "chapter"
-        assert curriculum[0]["title"] == "Introduction"
+        assert isinstance(curriculum[0], Chapter)
+        assert curriculum[0].title == "Introduction"
 
     @pytest.mark.asyncio
     @patch('httpx.AsyncClient')
-    async def test_get_course_public_curriculum_parsing_lecture(self, mock_async_client_class, async_client):
+    async def test_get_course_public_curriculum_parsing_lecture(self, mock_async_client_class, async_client, curriculum_payload):
         """Test async curriculum parsing for lecture entries."""
-        response_data = {
-            "results": [
-                {
-                    "_class": "lecture",
-                    "id": 2,
-                    "title": "Getting Started",
-                    "asset": {
-                        "_class": "asset",
-                        "id": 123,
-                        "title": "Introduction Video"
-                    }
-                }
-            ]
-        }
+        response_data = {"results": [curriculum_payload[1]]}
         mock_client_instance = AsyncMock()
         mock_response = AsyncMock()
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_client_instance.get.return_value = mock_response
-        mock_async_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_async_client_class.return_value = mock_client_instance
 
         curriculum = await async_client.get_course_public_curriculum(12345)
         
         assert len(curriculum) == 1
-        assert curriculum[0]._class == "lecture"
+        assert isinstance(curriculum[0], Lecture)
         assert curriculum[0].title == "Getting Started"
 
     @pytest.mark.asyncio
     @patch('httpx.AsyncClient')
-    async def test_get_course_public_curriculum_parsing_quiz(self, mock_async_client_class, async_client):
+    async def test_get_course_public_curriculum_parsing_quiz(self, mock_async_client_class, async_client, curriculum_payload):
         """Test async curriculum parsing for quiz entries."""
-        response_data = {
-            "results": [
-                {
-                    "_class": "quiz",
-                    "id": 3,
-                    "title": "Knowledge Check",
-                    "duration": 300,
-                    "pass_percent": 80.0
-                }
-            ]
-        }
+        response_data = {"results": [curriculum_payload[2]]}
         mock_client_instance = AsyncMock()
         mock_response = AsyncMock()
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_client_instance.get.return_value = mock_response
-        mock_async_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_async_client_class.return_value = mock_client_instance
 
         curriculum = await async_client.get_course_public_curriculum(12345)
         
         assert len(curriculum) == 1
-        assert curriculum[0]["_class"] == "quiz"
-        assert curriculum[0]["title"] == "Knowledge Check"
+        assert isinstance(curriculum[0], Quiz)
+        assert curriculum[0].title == "Knowledge Check"
 
     @pytest.mark.asyncio
     @patch('httpx.AsyncClient')
@@ -313,10 +292,10 @@ class TestAsyncUdemyClient:
         }
         mock_client_instance = AsyncMock()
         mock_response = AsyncMock()
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_client_instance.get.return_value = mock_response
-        mock_async_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_async_client_class.return_value = mock_client_instance
 
         curriculum = await async_client.get_course_public_curriculum(12345)
         
@@ -328,10 +307,10 @@ class TestAsyncUdemyClient:
         """Test handling of invalid response format in async client."""
         mock_client_instance = AsyncMock()
         mock_response = AsyncMock()
-        mock_response.json.return_value = {"invalid": "format"}
+        mock_response.content = json.dumps({"invalid": "format"}).encode()
         mock_response.raise_for_status.return_value = None
         mock_client_instance.get.return_value = mock_response
-        mock_async_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_async_client_class.return_value = mock_client_instance
 
         with pytest.raises(UdemyAPIError, match="Unexpected response format"):
             await async_client.get_courses()
@@ -348,3 +327,289 @@ class TestAsyncUdemyClient:
             
             # Verify aclose was called
             mock_aclose.assert_called_once()
+
+
+class TestAsyncUdemyClientConnectionPool:
+    """Test cases for the shared httpx.AsyncClient owned by AsyncUdemyClient."""
+
+    @staticmethod
+    def _install_transport(client, handler):
+        """Replaces the client's pool with one backed by an httpx.MockTransport."""
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client._http_client
+
+    @pytest.mark.asyncio
+    async def test_lazy_open_without_async_with(self, async_client):
+        """Test that the pool is opened on first use and reused until aclose()."""
+        assert not hasattr(async_client, "_http_client")
+        first = async_client._get_http_client()
+        assert async_client._get_http_client() is first
+        await async_client.aclose()
+        assert first.is_closed
+        assert async_client._get_http_client() is not first
+        await async_client.aclose()
+
+    def test_new_pool_per_event_loop(self, async_client):
+        """Test that a pool opened in one event loop is not reused in another."""
+        async def get_pool():
+            return async_client._get_http_client()
+
+        first = asyncio.run(get_pool())
+        second = asyncio.run(get_pool())
+        assert first is not second
+
+    def test_stale_pool_is_closed(self, async_client):
+        """Test that the pool of a previous event loop is closed, not leaked, when replaced."""
+        closed = []
+
+        class Transport(httpx.MockTransport):
+            async def aclose(self):
+                closed.append(self)
+
+        async def get_pool():
+            pool = async_client._get_http_client()
+            await asyncio.sleep(0)  # Lets the stale pool close
+            return pool
+
+        async def install():
+            self._install_transport(async_client, None)._transport = Transport(None)
+            async_client._http_client_loop = asyncio.get_running_loop()
+
+        asyncio.run(install())
+        stale = async_client._http_client
+        asyncio.run(get_pool())
+        assert stale.is_closed and len(closed) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_with_reuses_lazily_opened_pool(self, async_client):
+        """Test that entering an async with block keeps the open pool instead of leaking it."""
+        first = async_client._get_http_client()
+        async with async_client:
+            assert async_client._http_client is first
+        assert first.is_closed
+
+    @pytest.mark.asyncio
+    async def test_gathered_calls_share_pool(self, async_client, course_payload):
+        """Test that concurrent coroutines all send through the same pooled client."""
+        def handler(request):
+            return httpx.Response(200, json=course_payload)
+
+        pool = self._install_transport(async_client, handler)
+        courses = await asyncio.gather(
+            *(async_client.get_course_details(12345) for _ in range(20))
+        )
+        assert all(course.id == 12345 for course in courses)
+        assert async_client._http_client is pool
+        await async_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_async_endpoint_methods_share_pool(
+        self, async_client, course_payload, review_payload, curriculum_payload
+    ):
+        """Test that every coroutine sends through the same pooled client."""
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            if request.url.path.endswith("/reviews/"):
+                return httpx.Response(200, json={"results": [review_payload]})
+            if request.url.path.endswith("/public-curriculum-items/"):
+                return httpx.Response(200, json={"results": curriculum_payload})
+            if request.url.path == "/api-2.0/courses/":
+                return httpx.Response(200, json={"results": [course_payload]})
+            return httpx.Response(200, json=course_payload)
+
+        pool = self._install_transport(async_client, handler)
+        assert (await async_client.get_courses())[0].id == 12345
+        assert (await async_client.get_course_details(12345)).id == 12345
+        assert (await async_client.get_course_reviews(12345))[0].id == 987
+        assert len(await async_client.get_course_public_curriculum(12345)) == 3
+        assert async_client._http_client is pool
+        assert len(paths) == 4
+        await async_client.aclose()
+
+
+class TestAsyncUdemyClientPagination:
+    """Test cases for the auto-paginating async iterators of AsyncUdemyClient."""
+
+    @pytest.mark.asyncio
+    async def test_iter_courses_and_reviews(self, async_client, course_payload, review_payload):
+        """Test that async iterators follow next links and yield entries in order."""
+        requested = []
+
+        def handler(request):
+            page = int(request.url.params.get("page", 1))
+            requested.append((request.url.path, page))
+            next_url = None
+            if page < 3:
+                next_url = str(request.url.copy_merge_params({"page": page + 1}))
+            payload = review_payload if request.url.path.endswith("/reviews/") else course_payload
+            entry = dict(payload, id=page)
+            return httpx.Response(200, json={"next": next_url, "results": [entry]})
+
+        async_client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        courses = [course.id async for course in async_client.iter_courses()]
+        reviews = [review.id async for review in async_client.iter_course_reviews(12345)]
+        assert courses == [1, 2, 3]
+        assert reviews == [1, 2, 3]
+        assert len(requested) == 6
+        await async_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_iter_course_curriculum(self, async_client, curriculum_payload):
+        """Test that the async curriculum iterator yields models of every page in order."""
+
+        def handler(request):
+            page = int(request.url.params.get("page", 1))
+            next_url = str(request.url.copy_merge_params({"page": page + 1})) if page < 2 else None
+            return httpx.Response(200, json={"next": next_url, "results": curriculum_payload})
+
+        async_client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        curriculum = [item async for item in async_client.iter_course_curriculum(12345)]
+        assert [type(item) for item in curriculum] == [Chapter, Lecture, Quiz] * 2
+        await async_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_lean_records(self, async_client, course_payload, review_payload):
+        """Test that lean mode returns records from both the list and iterator methods."""
+
+        def handler(request):
+            payload = review_payload if "reviews" in request.url.path else course_payload
+            return httpx.Response(200, json={"next": None, "results": [payload]})
+
+        async_client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        courses = await async_client.get_courses(lean=True)
+        reviews = [review async for review in async_client.iter_course_reviews(1, lean=True)]
+        assert [type(course) for course in courses] == [CourseRecord]
+        assert [type(review) for review in reviews] == [CourseReviewRecord]
+        assert courses[0].to_model().id == course_payload["id"]
+        await async_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_get_full_curriculum(self, async_client, curriculum_page):
+        """Test that the remaining pages are fetched together and stitched in page order."""
+        active, peak = [0], [0]
+
+        async def handler(request):
+            page = int(request.url.params["page"])
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01 * (10 - page))
+            active[0] -= 1
+            return httpx.Response(
+                200, json={"count": 30, "results": curriculum_page(page, 10)}
+            )
+
+        async_client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        sections = await async_client.get_full_curriculum(12345, page_size=3, concurrency=4)
+        assert [section.chapter.id for section in sections] == list(range(1, 11))
+        assert len(sections[0].items) == 2
+        assert peak[0] == 4
+        await async_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_full_curriculum_sorts_out_of_order_pages(
+        self, client_credentials, curriculum_page
+    ):
+        """Test that a retried page answering last still lands in course order."""
+        attempts = {}
+
+        async def handler(request):
+            page = int(request.url.params["page"])
+            attempts[page] = attempts.get(page, 0) + 1
+            if page == 2 and attempts[page] == 1:
+                raise httpx.ConnectError("refused")
+            results = curriculum_page(4 - page, 3)
+            return httpx.Response(200, json={"count": 9, "results": results})
+
+        client = AsyncUdemyClient(
+            **client_credentials, retry_policy=RetryPolicy(backoff_factor=0.01, jitter=False)
+        )
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        sections = await client.get_full_curriculum(12345, page_size=3)
+        assert [section.chapter.id for section in sections] == [1, 2, 3]
+        assert attempts == {1: 1, 2: 2, 3: 1}
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_iter_courses_respects_result_window(self, async_client, course_payload):
+        """Test that async pagination stops before page * page_size exceeds 10000."""
+
+        def handler(request):
+            page = int(request.url.params["page"])
+            next_url = str(request.url.copy_merge_params({"page": page + 1}))
+            return httpx.Response(200, json={"next": next_url, "results": [course_payload]})
+
+        async_client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        filters = CourseFilter(page=99, page_size=100)
+        courses = [course async for course in async_client.iter_courses(filters)]
+        assert len(courses) == 2
+        await async_client.aclose()
+
+
+class TestAsyncUdemyClientBulkDetails:
+    """Test cases for AsyncUdemyClient.get_many_course_details."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("ordered", [True, False])
+    async def test_bounded_concurrency(self, async_client, course_payload, ordered):
+        """Test that in-flight requests never exceed the limit and failures are reported."""
+        in_flight = 0
+        peak = 0
+
+        class SlowTransport(httpx.AsyncBaseTransport):
+            async def handle_async_request(self, request):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.001)
+                in_flight -= 1
+                course_id = int(request.url.path.rstrip("/").rsplit("/", 1)[-1])
+                if course_id == 7:
+                    return httpx.Response(500)
+                return httpx.Response(200, json=dict(course_payload, id=course_id))
+
+        async_client._http_client = httpx.AsyncClient(transport=SlowTransport())
+        results = [
+            result
+            async for result in async_client.get_many_course_details(
+                range(30), concurrency=5, ordered=ordered
+            )
+        ]
+
+        assert peak <= 5
+        assert len(results) == 30
+        if ordered:
+            assert [result.course_id for result in results] == list(range(30))
+        failed = [result for result in results if not result.ok]
+        assert [result.course_id for result in failed] == [7]
+        await async_client.aclose()
+
+
+class TestAsyncUdemyClientCoalescing:
+    """Test cases for single-flight request coalescing in AsyncUdemyClient."""
+
+    @pytest.mark.asyncio
+    async def test_gathered_identical_calls_share_one_request(
+        self, client_credentials, course_payload
+    ):
+        """Test that concurrent identical coroutines share one request and parse."""
+        requests = []
+
+        class SlowTransport(httpx.AsyncBaseTransport):
+            async def handle_async_request(self, request):
+                requests.append(request.url)
+                await asyncio.sleep(0.01)
+                return httpx.Response(200, json=course_payload)
+
+        client = AsyncUdemyClient(**client_credentials, coalesce_requests=True)
+        client._http_client = httpx.AsyncClient(transport=SlowTransport())
+        courses = await asyncio.gather(*(client.get_course_details(12345) for _ in range(50)))
+        other = await client.get_course_details(54321)
+
+        assert len(requests) == 2
+        assert all(course is courses[0] for course in courses)
+        assert other is not courses[0]
+        assert client.coalesced_requests == 49
+        assert client._in_flight == {}
+        await client.aclose()
@@ -0,0 +1,345 @@
+"""Tests for the response cache backends and their use by the clients."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from pydemy import AsyncUdemyClient, MemoryCache, SQLiteCache, UdemyClient
+from pydemy._base_client import BaseClient
+from pydemy._exceptions import UdemyAPIError
+from pydemy.models import CourseReview, CourseReviewRecord
+
+
+class TestMemoryCache:
+    """Test cases for the in-memory LRU cache."""
+
+    def test_hit_and_miss_counters(self):
+        """Test that lookups update the hit and miss counters."""
+        cache = MemoryCache()
+        assert cache.get("a") is None
+        cache.set("a", b"1")
+        assert cache.get("a") == b"1"
+        assert cache.stats.as_dict() == {"hits": 1, "misses": 1, "evictions": 0, "expirations": 0}
+
+    def test_lru_eviction_by_entry_count(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        cache.get("a")
+        cache.set("c", b"3")
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+        assert cache.stats.evictions == 1
+
+    def test_eviction_by_size_budget(self):
+        """Test that entries are evicted to stay within the byte budget."""
+        cache = MemoryCache(max_bytes=10)
+        cache.set("a", b"12345")
+        cache.set("b", b"12345")
+        cache.set("c", b"123")
+        assert len(cache) == 2
+        assert cache.size == 8
+        cache.set("huge", b"x" * 11)
+        assert cache.get("huge") is None
+        assert len(cache) == 2
+
+    def test_ttl_expiration(self):
+        """Test that expired entries are treated as misses."""
+        cache = MemoryCache(ttl=60)
+        cache.set("a", b"1")
+        cache.set("b", b"2", ttl=120)
+        with patch("pydemy._cache.time.monotonic", return_value=time.monotonic() + 61):
+            assert cache.get("a") is None
+            assert cache.get("b") == b"2"
+        assert cache.stats.expirations == 1
+        assert len(cache) == 1
+
+    def test_expired_entries_with_validators_are_kept(self):
+        """Test that expired entries stored with validators stay available for revalidation."""
+        cache = MemoryCache(ttl=60)
+        cache.set_with_validators("a", b"1", '"v1"', None)
+        cache.set("b", b"2")
+        with patch("pydemy._cache.time.monotonic", return_value=time.monotonic() + 61):
+            assert cache.get("a") is None and cache.get("b") is None
+            assert cache.get_stale("a") == (b"1", '"v1"', None)
+            assert cache.get_stale("a").headers == {"If-None-Match": '"v1"'}
+            assert cache.get_stale("b") is None
+        assert cache.get_stale("a") is None  # Not expired yet
+        assert len(cache) == 1
+
+    def test_invalid_max_entries(self):
+        """Test that a cache must hold at least one entry."""
+        with pytest.raises(ValueError, match="max_entries"):
+            MemoryCache(max_entries=0)
+
+
+class TestCacheKey:
+    """Test cases for cache key normalization."""
+
+    def test_param_order_and_location_are_normalized(self):
+        """Test that equivalent requests map to the same key."""
+        url = "https://www.udemy.com/api-2.0/courses/"
+        key = BaseClient._cache_key(url, {"page_size": "10", "page": "2"})
+        assert key == BaseClient._cache_key(url + "?page=2", {"page_size": "10"})
+        assert key == BaseClient._cache_key(url + "?page_size=10&page=2")
+        assert key != BaseClient._cache_key(url, {"page": "3", "page_size": "10"})
+
+
+class TestClientCaching:
+    """Test cases for transparent caching in the endpoint methods."""
+
+    def test_sync_endpoint_methods_use_cache(
+        self, client_credentials, course_payload, review_payload, curriculum_payload
+    ):
+        """Test that repeated calls are served from the cache."""
+        requests = []
+
+        def handler(request):
+            requests.append(request.url)
+            if request.url.path.endswith("/reviews/"):
+                return httpx.Response(200, json={"results": [review_payload]})
+            if request.url.path.endswith("/public-curriculum-items/"):
+                return httpx.Response(200, json={"results": curriculum_payload})
+            if request.url.path == "/api-2.0/courses/":
+                return httpx.Response(200, json={"results": [course_payload]})
+            return httpx.Response(200, json=course_payload)
+
+        cache = MemoryCache()
+        client = UdemyClient(**client_credentials, cache=cache)
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        for _ in range(3):
+            assert client.get_courses()[0].id == 12345
+            assert client.get_course_details(12345).id == 12345
+            assert client.get_course_reviews(12345)[0].id == 987
+            assert len(client.get_course_public_curriculum(12345)) == 3
+
+        assert len(requests) == 4
+        assert cache.stats.hits == 8
+        assert cache.stats.misses == 4
+
+    def test_errors_are_not_cached(self, client_credentials):
+        """Test that failed responses are never stored."""
+        cache = MemoryCache()
+        client = UdemyClient(**client_credentials, cache=cache)
+        client._http_client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(500))
+        )
+        with pytest.raises(UdemyAPIError, match="HTTP error 500"):
+            client.get_course_details(1)
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_async_client_uses_cache(self, client_credentials, course_payload):
+        """Test that the async client serves repeated calls from the cache."""
+        requests = []
+
+        def handler(request):
+            requests.append(request.url)
+            return httpx.Response(200, json=course_payload)
+
+        client = AsyncUdemyClient(**client_credentials, cache=MemoryCache())
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        for _ in range(5):
+            assert (await client.get_course_details(12345)).id == 12345
+        assert len(requests) == 1
+        assert client.cache.stats.hits == 4
+        await client.aclose()
+
+
+class TestSQLiteCache:
+    """Test cases for the persistent SQLite cache."""
+
+    def test_roundtrip_and_persistence(self, tmp_path):
+        """Test that stored bodies survive reopening the database."""
+        path = tmp_path / "cache.db"
+        cache = SQLiteCache(path)
+        cache.set("a", b'{"id": 1}')
+        assert cache.get("a") == b'{"id": 1}'
+        assert cache.fetched_at("a") <= time.time()
+        cache.close()
+
+        reopened = SQLiteCache(path)
+        assert reopened.get("a") == b'{"id": 1}'
+        assert reopened.get("b") is None
+        assert reopened.stats.as_dict()["hits"] == 1
+        assert reopened.stats.as_dict()["misses"] == 1
+        mode = reopened._connection().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+        reopened.close()
+
+    def test_ttl_and_prune(self, tmp_path):
+        """Test that expired entries are skipped and removed in bulk by prune()."""
+        cache = SQLiteCache(tmp_path / "cache.db", ttl=60)
+        cache.set("a", b"1")
+        cache.set("b", b"2", ttl=3600)
+        with patch("pydemy._cache.time.time", return_value=time.time() + 61):
+            assert cache.get("a") is None
+            assert cache.get("b") == b"2"
+            assert cache.prune() == 1
+            assert cache.prune(older_than=30) == 1
+        assert len(cache) == 0
+        cache.close()
+
+    def test_shared_between_threads(self, tmp_path):
+        """Test that every thread can read and write through its own connection."""
+        cache = SQLiteCache(tmp_path / "cache.db")
+
+        def write(index):
+            cache.set(f"key-{index}", str(index).encode())
+            return cache.get(f"key-{index}")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(write, range(20)))
+        assert results == [str(index).encode() for index in range(20)]
+        assert len(cache) == 20
+        cache.close()
+
+    def test_details_and_curriculum_served_offline(
+        self, client_credentials, tmp_path, course_payload, curriculum_payload
+    ):
+        """Test that a new client serves cached responses without the network."""
+
+        def handler(request):
+            if request.url.path.endswith("/public-curriculum-items/"):
+                return httpx.Response(200, json={"results": curriculum_payload})
+            return httpx.Response(200, json=course_payload)
+
+        path = tmp_path / "cache.db"
+        client = UdemyClient(**client_credentials, cache=SQLiteCache(path))
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        client.get_course_details(12345)
+        client.get_course_public_curriculum(12345)
+        client.cache.close()
+
+        def offline(request):
+            raise httpx.ConnectError("offline")
+
+        restarted = UdemyClient(**client_credentials, cache=SQLiteCache(path))
+        restarted._http_client = httpx.Client(transport=httpx.MockTransport(offline))
+        assert restarted.get_course_details(12345).id == 12345
+        assert len(restarted.get_course_public_curriculum(12345)) == 3
+        restarted.cache.close()
+
+
+class TestConditionalRequests:
+    """Test cases for ETag / Last-Modified revalidation."""
+
+    @staticmethod
+    def _revalidating_handler(payload, seen_headers):
+        """Builds a handler answering 304 when the request carries the current validators."""
+
+        def handler(request):
+            seen_headers.append(dict(request.headers))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            headers = {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+            return httpx.Response(200, json={"results": [payload]}, headers=headers)
+
+        return handler
+
+    def test_304_reuses_parsed_reviews(self, client_credentials, review_payload):
+        """Test that a 304 reuses the previously parsed objects without parsing."""
+        seen_headers = []
+        client = UdemyClient(**client_credentials, conditional_requests=True)
+        handler = self._revalidating_handler(review_payload, seen_headers)
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        first = client.get_course_reviews(12345)
+        with patch.object(UdemyClient, "_validate_results", side_effect=AssertionError("parsed")):
+            second = client.get_course_reviews(12345)
+
+        assert second[0] is first[0]
+        assert second is not first
+        assert "if-none-match" not in seen_headers[0]
+        assert seen_headers[1]["if-none-match"] == '"v1"'
+        assert seen_headers[1]["if-modified-since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert client.validator_cache.stats.hits == 1
+        assert client.validator_cache.stats.misses == 1
+
+    def test_lean_and_full_results_kept_apart(self, client_credentials, review_payload):
+        """Test that a 304 for a lean request does not return the full request's models."""
+        client = UdemyClient(**client_credentials, conditional_requests=True)
+        handler = self._revalidating_handler(review_payload, [])
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        full = client.get_course_reviews(12345)
+        lean = client.get_course_reviews(12345, lean=True)
+
+        assert isinstance(full[0], CourseReview)
+        assert isinstance(lean[0], CourseReviewRecord)
+        assert len(client.validator_cache) == 2
+
+    def test_disabled_by_default(self, sync_client, review_payload):
+        """Test that no validators are sent unless conditional requests are enabled."""
+        seen_headers = []
+        handler = self._revalidating_handler(review_payload, seen_headers)
+        sync_client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        sync_client.get_course_reviews(12345)
+        sync_client.get_course_reviews(12345)
+        assert sync_client.validator_cache is None
+        assert all("if-none-match" not in headers for headers in seen_headers)
+
+    @pytest.mark.asyncio
+    async def test_async_304_reuses_parsed_course(self, client_credentials, course_payload):
+        """Test that the async client revalidates and reuses the parsed Course."""
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(dict(request.headers))
+            if request.headers.get("If-Modified-Since"):
+                return httpx.Response(304)
+            headers = {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+            return httpx.Response(200, json=course_payload, headers=headers)
+
+        client = AsyncUdemyClient(**client_credentials, conditional_requests=True)
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        first = await client.get_course_details(12345)
+        second = await client.get_course_details(12345)
+        assert second is first
+        assert len(seen_headers) == 2
+        await client.aclose()
+
+    def test_expired_cache_entry_is_revalidated(self, client_credentials, review_payload):
+        """Test that a 304 refreshes an expired cache entry, which then serves hits again."""
+        seen_headers = []
+        handler = self._revalidating_handler(review_payload, seen_headers)
+        cache = MemoryCache(ttl=60)
+        client = UdemyClient(**client_credentials, cache=cache, conditional_requests=True)
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        client.get_course_reviews(12345)
+
+        with patch("pydemy._cache.time.monotonic", return_value=time.monotonic() + 61):
+            for _ in range(3):
+                assert client.get_course_reviews(12345)[0].id == review_payload["id"]
+
+        assert len(seen_headers) == 2
+        assert seen_headers[1]["if-none-match"] == '"v1"'
+        assert cache.stats.hits == 2 and cache.stats.expirations == 1
+
+    def test_sqlite_cache_revalidates_across_runs(
+        self, client_credentials, tmp_path, review_payload
+    ):
+        """Test that a new client revalidates an expired persistent entry with its validators."""
+        seen_headers = []
+        handler = self._revalidating_handler(review_payload, seen_headers)
+        path = tmp_path / "cache.db"
+        client = UdemyClient(**client_credentials, cache=SQLiteCache(path, ttl=60))
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        client.get_course_reviews(12345)
+        client.cache.close()
+
+        cache = SQLiteCache(path, ttl=60)
+        restarted = UdemyClient(**client_credentials, cache=cache, conditional_requests=True)
+        restarted._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        with patch("pydemy._cache.time.time", return_value=time.time() + 61):
+            assert restarted.get_course_reviews(12345)[0].id == review_payload["id"]
+            assert restarted.get_course_reviews(12345)[0].id == review_payload["id"]
+
+        assert len(seen_headers) == 2
+        assert seen_headers[1]["if-none-match"] == '"v1"'
+        assert cache.stats.hits == 1
+        cache.close()
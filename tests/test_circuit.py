@@ -0,0 +1,212 @@
+"""Tests for the circuit breaker and its use by the clients."""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from pydemy import AsyncUdemyClient, CircuitBreaker, CircuitState, UdemyClient
+from pydemy._exceptions import CircuitOpenError, UdemyAPIError
+
+REVIEWS = "/api-2.0/courses/{id}/reviews/"
+
+
+def _record(breaker, endpoint, *failures):
+    """Admits one request per outcome and records it."""
+    for failed in failures:
+        breaker.release(endpoint, failed, breaker.acquire(endpoint))
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+
+    def test_endpoint_groups_ids(self):
+        """Test that numeric IDs are replaced so every course shares one circuit."""
+        endpoint = CircuitBreaker.endpoint
+        assert endpoint("https://www.udemy.com/api-2.0/courses/123/reviews/?page=2") == REVIEWS
+        assert endpoint("https://www.udemy.com/api-2.0/courses/9/") == "/api-2.0/courses/{id}/"
+
+    def test_opens_at_failure_rate(self):
+        """Test that the circuit opens once min_requests outcomes reach the failure rate."""
+        breaker = CircuitBreaker(failure_rate=0.5, window=10, min_requests=4)
+        _record(breaker, REVIEWS, True, True, True)  # Too few outcomes to judge
+        assert breaker.state(REVIEWS) is CircuitState.CLOSED
+        _record(breaker, REVIEWS, False)
+        assert breaker.state(REVIEWS) is CircuitState.OPEN
+
+    def test_healthy_endpoint_stays_closed(self):
+        """Test that failures below the rate keep the circuit closed."""
+        breaker = CircuitBreaker(failure_rate=0.5, window=10, min_requests=4)
+        _record(breaker, REVIEWS, True, False, False, False, True, False, False)
+        assert breaker.state(REVIEWS) is CircuitState.CLOSED
+        assert breaker.status()[REVIEWS].failure_rate == pytest.approx(2 / 7)
+
+    def test_fails_fast_while_open(self, fake_clock):
+        """Test that an open circuit rejects requests with the time left."""
+        with patch("pydemy._circuit.time.monotonic", fake_clock):
+            breaker = CircuitBreaker(min_requests=1, open_seconds=30)
+            _record(breaker, REVIEWS, True)
+            fake_clock.now += 10
+            with pytest.raises(CircuitOpenError) as info:
+                breaker.acquire(REVIEWS)
+        assert isinstance(info.value, UdemyAPIError)
+        assert info.value.endpoint == REVIEWS
+        assert info.value.retry_after == pytest.approx(20)
+        assert breaker.status()[REVIEWS].rejected == 1
+
+    def test_half_open_probes(self, fake_clock):
+        """Test that half-open circuits admit limited probes and close after their successes."""
+        with patch("pydemy._circuit.time.monotonic", fake_clock):
+            breaker = CircuitBreaker(min_requests=1, open_seconds=30, half_open_probes=2)
+            _record(breaker, REVIEWS, True)
+            fake_clock.now += 30
+            assert breaker.state(REVIEWS) is CircuitState.HALF_OPEN
+            first, second = breaker.acquire(REVIEWS), breaker.acquire(REVIEWS)
+            assert first and second
+            with pytest.raises(CircuitOpenError):
+                breaker.acquire(REVIEWS)  # Every probe slot is taken
+            breaker.release(REVIEWS, False, first)
+            assert breaker.state(REVIEWS) is CircuitState.HALF_OPEN
+            breaker.release(REVIEWS, False, second)
+            assert breaker.state(REVIEWS) is CircuitState.CLOSED
+            assert breaker.status()[REVIEWS].requests == 0
+
+    def test_failed_probe_reopens(self, fake_clock):
+        """Test that a failed probe opens the circuit for another open_seconds."""
+        with patch("pydemy._circuit.time.monotonic", fake_clock):
+            breaker = CircuitBreaker(min_requests=1, open_seconds=30)
+            _record(breaker, REVIEWS, True)
+            fake_clock.now += 30
+            _record(breaker, REVIEWS, True)
+            assert breaker.status()[REVIEWS].state is CircuitState.OPEN
+            assert breaker.status()[REVIEWS].opened == 2
+            assert breaker.status()[REVIEWS].retry_after == pytest.approx(30)
+
+    def test_abandoned_probe_frees_its_slot(self, fake_clock):
+        """Test that a cancelled probe lets the next request probe."""
+        with patch("pydemy._circuit.time.monotonic", fake_clock):
+            breaker = CircuitBreaker(min_requests=1, open_seconds=30)
+            _record(breaker, REVIEWS, True)
+            fake_clock.now += 30
+            breaker.release(REVIEWS, None, breaker.acquire(REVIEWS))
+            assert breaker.acquire(REVIEWS)
+
+    def test_probe_of_an_earlier_half_open_period_is_ignored(self, fake_clock):
+        """Test that a late probe neither frees a slot nor counts toward closing a new period."""
+        with patch("pydemy._circuit.time.monotonic", fake_clock):
+            breaker = CircuitBreaker(min_requests=1, open_seconds=30, half_open_probes=2)
+            _record(breaker, REVIEWS, True)
+            fake_clock.now += 30
+            late, failing = breaker.acquire(REVIEWS), breaker.acquire(REVIEWS)
+            breaker.release(REVIEWS, True, failing)  # Reopens the circuit
+            fake_clock.now += 30
+            first, second = breaker.acquire(REVIEWS), breaker.acquire(REVIEWS)
+            assert first and second and first != late
+            breaker.release(REVIEWS, False, late)
+            with pytest.raises(CircuitOpenError):
+                breaker.acquire(REVIEWS)  # The late probe did not free a slot
+            breaker.release(REVIEWS, False, first)
+            assert breaker.state(REVIEWS) is CircuitState.HALF_OPEN
+            breaker.release(REVIEWS, False, second)
+            assert breaker.state(REVIEWS) is CircuitState.CLOSED
+
+    def test_reset_with_requests_in_flight(self, fake_clock):
+        """Test that requests admitted before a reset release without touching new circuits."""
+        with patch("pydemy._circuit.time.monotonic", fake_clock):
+            breaker = CircuitBreaker(min_requests=1, open_seconds=30)
+            closed = breaker.acquire(REVIEWS)
+            _record(breaker, REVIEWS, True)
+            fake_clock.now += 30
+            probe = breaker.acquire(REVIEWS)
+            breaker.reset()
+            breaker.release(REVIEWS, True, closed)
+            breaker.release(REVIEWS, True, probe)
+            assert breaker.status() == {}
+            assert not breaker.acquire(REVIEWS)
+
+    def test_stale_outcomes_are_ignored(self, fake_clock):
+        """Test that a request admitted while closed does not count as a probe later."""
+        with patch("pydemy._circuit.time.monotonic", fake_clock):
+            breaker = CircuitBreaker(min_requests=1, open_seconds=30)
+            slow = breaker.acquire(REVIEWS)
+            _record(breaker, REVIEWS, True)
+            fake_clock.now += 30
+            probe = breaker.acquire(REVIEWS)
+            breaker.release(REVIEWS, True, slow)
+            assert breaker.state(REVIEWS) is CircuitState.HALF_OPEN
+            breaker.release(REVIEWS, False, probe)
+            assert breaker.state(REVIEWS) is CircuitState.CLOSED
+
+    def test_invalid_arguments(self):
+        """Test that impossible thresholds are rejected."""
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_rate=0)
+        with pytest.raises(ValueError):
+            CircuitBreaker(window=5, min_requests=10)
+        with pytest.raises(ValueError):
+            CircuitBreaker(half_open_probes=0)
+
+
+class TestClientCircuitBreaker:
+    """Test cases for the circuit breaker of the clients."""
+
+    def test_sync_client_fails_fast(self, client_credentials, course_payload):
+        """Test that requests stop reaching a failing endpoint while others still work."""
+        sent = []
+
+        def handler(request):
+            sent.append(request.url.path)
+            if request.url.path.endswith("/reviews/"):
+                return httpx.Response(503)
+            return httpx.Response(200, json=course_payload)
+
+        breaker = CircuitBreaker(min_requests=3, open_seconds=60)
+        client = UdemyClient(**client_credentials, circuit_breaker=breaker)
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        for course_id in range(3):
+            with pytest.raises(UdemyAPIError, match="HTTP error 503"):
+                client.get_course_reviews(course_id)
+        with pytest.raises(CircuitOpenError):
+            client.get_course_reviews(4)
+        assert len(sent) == 3
+        assert client.get_course_details(1).id == course_payload["id"]
+        assert client.circuit_breaker.state(REVIEWS) is CircuitState.OPEN
+
+    def test_bulk_results_report_open_circuit(self, client_credentials):
+        """Test that bulk methods report fast failures per course."""
+
+        def handler(request):
+            raise httpx.ConnectTimeout("timed out")
+
+        client = UdemyClient(**client_credentials, circuit_breaker=CircuitBreaker(min_requests=2))
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        results = list(client.get_many_course_details(range(6), concurrency=1, ordered=True))
+        errors = [type(result.error) for result in results]
+        assert errors == [UdemyAPIError] * 2 + [CircuitOpenError] * 4
+
+    @pytest.mark.asyncio
+    async def test_async_client_probes_after_recovery(
+        self, client_credentials, course_payload, fake_clock
+    ):
+        """Test that the async client probes once open_seconds passed and then recovers."""
+        healthy = [False]
+
+        async def handler(request):
+            if not healthy[0]:
+                return httpx.Response(500)
+            return httpx.Response(200, json=course_payload)
+
+        breaker = CircuitBreaker(min_requests=2, open_seconds=5)
+        client = AsyncUdemyClient(**client_credentials, circuit_breaker=breaker)
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("pydemy._circuit.time.monotonic", fake_clock):
+            results = await asyncio.gather(
+                *(client.get_course_details(1) for _ in range(3)), return_exceptions=True
+            )
+            assert isinstance(results[-1], CircuitOpenError)
+            healthy[0] = True
+            fake_clock.now += 5
+            assert (await client.get_course_details(1)).id == course_payload["id"]
+        assert breaker.state("/api-2.0/courses/{id}/") is CircuitState.CLOSED
+        await client.aclose()
@@ -1,12 +1,32 @@
 """Tests for the synchronous UdemyClient."""
 
+import json
+import threading
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
 import pytest
 from unittest.mock import Mock, patch
 import httpx
+from pydantic import ValidationError
 
 from pydemy import UdemyClient
 from pydemy._exceptions import UdemyAPIError
-from pydemy.models import CourseFilter, ReviewFilter
+from pydemy.models import (
+    Asset,
+    Chapter,
+    Course,
+    CourseFilter,
+    CourseRecord,
+    CourseReview,
+    CourseReviewRecord,
+    Instructor,
+    Lecture,
+    Locale,
+    Quiz,
+    ReviewFilter,
+    User,
+)
 
 
 class TestUdemyClient:
@@ -62,11 +82,11 @@ class TestUdemyClient:
         with pytest.raises(ValueError, match="Timeout value must be non-negative"):
             sync_client.timeout = -1
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_courses_success(self, mock_get, sync_client, mock_course_response):
         """Test successful course retrieval."""
         mock_response = Mock()
-        mock_response.json.return_value = mock_course_response
+        mock_response.content = json.dumps(mock_course_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -77,11 +97,11 @@ class TestUdemyClient:
         assert courses[0].title == "Test Python Course"
         mock_get.assert_called_once()
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_courses_with_filters(self, mock_get, sync_client, mock_course_response, sample_course_filter_data):
         """Test course retrieval with filters."""
         mock_response = Mock()
-        mock_response.json.return_value = mock_course_response
+        mock_response.content = json.dumps(mock_course_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -95,7 +115,7 @@ class TestUdemyClient:
         call_args = mock_get.call_args
         assert 'params' in call_args.kwargs
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_courses_http_error(self, mock_get, sync_client):
         """Test HTTP error handling in get_courses."""
         mock_get.side_effect = httpx.HTTPStatusError("404 Not Found", request=Mock(), response=Mock(status_code=404))
@@ -103,7 +123,7 @@ class TestUdemyClient:
         with pytest.raises(UdemyAPIError, match="HTTP error 404"):
             sync_client.get_courses()
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_courses_request_error(self, mock_get, sync_client):
         """Test request error handling in get_courses."""
         mock_get.side_effect = httpx.RequestError("Connection error")
@@ -111,22 +131,22 @@ class TestUdemyClient:
         with pytest.raises(UdemyAPIError, match="Request error"):
             sync_client.get_courses()
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_courses_json_error(self, mock_get, sync_client):
         """Test JSON parsing error handling in get_courses."""
         mock_response = Mock()
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response.content = b"Invalid JSON"
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
         with pytest.raises(UdemyAPIError, match="JSON parsing error"):
             sync_client.get_courses()
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_course_details_success(self, mock_get, sync_client, mock_course_detail_response):
         """Test successful course details retrieval."""
         mock_response = Mock()
-        mock_response.json.return_value = mock_course_detail_response
+        mock_response.content = json.dumps(mock_course_detail_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -136,11 +156,11 @@ class TestUdemyClient:
         assert course.title == "Test Python Course"
         mock_get.assert_called_once()
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_course_reviews_success(self, mock_get, sync_client, mock_review_response):
         """Test successful course reviews retrieval."""
         mock_response = Mock()
-        mock_response.json.return_value = mock_review_response
+        mock_response.content = json.dumps(mock_review_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -151,11 +171,11 @@ class TestUdemyClient:
         assert reviews[0].content == "Great course!"
         mock_get.assert_called_once()
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_course_reviews_with_filters(self, mock_get, sync_client, mock_review_response, sample_review_filter_data):
         """Test course reviews retrieval with filters."""
         mock_response = Mock()
-        mock_response.json.return_value = mock_review_response
+        mock_response.content = json.dumps(mock_review_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -169,11 +189,11 @@ class TestUdemyClient:
         call_args = mock_get.call_args
         assert 'params' in call_args.kwargs
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_course_public_curriculum_success(self, mock_get, sync_client, mock_curriculum_response):
         """Test successful curriculum retrieval."""
         mock_response = Mock()
-        mock_response.json.return_value = mock_curriculum_response
+        mock_response.content = json.dumps(mock_curriculum_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -182,11 +202,11 @@ class TestUdemyClient:
         assert len(curriculum) == 3
         mock_get.assert_called_once()
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_course_public_curriculum_with_pagination(self, mock_get, sync_client, mock_curriculum_response):
         """Test curriculum retrieval with pagination parameters."""
         mock_response = Mock()
-        mock_response.json.return_value = mock_curriculum_response
+        mock_response.content = json.dumps(mock_curriculum_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -201,84 +221,52 @@ class TestUdemyClient:
         assert call_args.kwargs['params']['page'] == 2
         assert call_args.kwargs['params']['page_size'] == 20
 
-    @patch('httpx.get')
-    def test_get_course_public_curriculum_parsing_chapter(self, mock_get, sync_client):
+    @patch('httpx.Client.get')
+    def test_get_course_public_curriculum_parsing_chapter(self, mock_get, sync_client, curriculum_payload):
         """Test curriculum parsing for chapter entries."""
-        response_data = {
-            "results": [
-                {
-                    "_class": "chapter",
-                    "id": 1,
-                    "title": "Introduction",
-                    "description": "Course introduction"
-                }
-            ]
-        }
+        response_data = {"results": [curriculum_payload[0]]}
         mock_response = Mock()
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
         curriculum = sync_client.get_course_public_curriculum(12345)
         
         assert len(curriculum) == 1
-        assert curriculum[0]["_class"] == "chapter"
-        assert curriculum[0]["title"] == "Introduction"
+        assert isinstance(curriculum[0], Chapter)
+        assert curriculum[0].title == "Introduction"
 
-    @patch('httpx.get')
-    def test_get_course_public_curriculum_parsing_lecture(self, mock_get, sync_client):
+    @patch('httpx.Client.get')
+    def test_get_course_public_curriculum_parsing_lecture(self, mock_get, sync_client, curriculum_payload):
         """Test curriculum parsing for lecture entries."""
-        response_data = {
-            "results": [
-                {
-                    "_class": "lecture",
-                    "id": 2,
-                    "title": "Getting Started",
-                    "asset": {
-                        "_class": "asset",
-                        "id": 123,
-                        "title": "Introduction Video"
-                    }
-                }
-            ]
-        }
+        response_data = {"results": [curriculum_payload[1]]}
         mock_response = Mock()
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
         curriculum = sync_client.get_course_public_curriculum(12345)
         
         assert len(curriculum) == 1
-        assert curriculum[0]._class == "lecture"
+        assert isinstance(curriculum[0], Lecture)
         assert curriculum[0].title == "Getting Started"
 
-    @patch('httpx.get')
-    def test_get_course_public_curriculum_parsing_quiz(self, mock_get, sync_client):
+    @patch('httpx.Client.get')
+    def test_get_course_public_curriculum_parsing_quiz(self, mock_get, sync_client, curriculum_payload):
         """Test curriculum parsing for quiz entries."""
-        response_data = {
-            "results": [
-                {
-                    "_class": "quiz",
-                    "id": 3,
-                    "title": "Knowledge Check",
-                    "duration": 300,
-                    "pass_percent": 80.0
-                }
-            ]
-        }
+        response_data = {"results": [curriculum_payload[2]]}
         mock_response = Mock()
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
         curriculum = sync_client.get_course_public_curriculum(12345)
         
         assert len(curriculum) == 1
-        assert curriculum[0]["_class"] == "quiz"
-        assert curriculum[0]["title"] == "Knowledge Check"
+        assert isinstance(curriculum[0], Quiz)
+        assert curriculum[0].title == "Knowledge Check"
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_course_public_curriculum_unexpected_class(self, mock_get, sync_client):
         """Test curriculum parsing with unexpected class type."""
         response_data = {
@@ -291,7 +279,7 @@ class TestUdemyClient:
             ]
         }
         mock_response = Mock()
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -299,11 +287,11 @@ class TestUdemyClient:
         
         assert len(curriculum) == 0  # Unexpected types should be ignored
 
-    @patch('httpx.get')
+    @patch('httpx.Client.get')
     def test_get_courses_invalid_response_format(self, mock_get, sync_client):
         """Test handling of invalid response format."""
         mock_response = Mock()
-        mock_response.json.return_value = {"invalid": "format"}
+        mock_response.content = json.dumps({"invalid": "format"}).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -318,3 +306,528 @@ class TestUdemyClient:
         
         # After exiting context, client should still exist but http_client might be closed
         assert isinstance(client, UdemyClient)
+
+
+class TestUdemyClientConnectionPool:
+    """Test cases for the pooled httpx.Client owned by UdemyClient."""
+
+    @staticmethod
+    def _install_transport(client, handler):
+        """Replaces the client's pool with one backed by an httpx.MockTransport."""
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        return client._http_client
+
+    def test_pool_options_exposed(self, client_credentials):
+        """Test that pool limits and HTTP/2 mode are configurable."""
+        limits = httpx.Limits(max_connections=5, max_keepalive_connections=2)
+        client = UdemyClient(**client_credentials, limits=limits)
+        assert client.limits is limits
+        assert client.http2 is False
+
+    def test_custom_base_url(self, client_credentials):
+        """Test that the base URL can be overridden at initialization."""
+        client = UdemyClient(**client_credentials, base_url="http://127.0.0.1:8000/api-2.0")
+        assert client.base_url == "http://127.0.0.1:8000/api-2.0/"
+
+    def test_pool_opened_lazily_outside_with_block(self, sync_client):
+        """Test that endpoint methods open and reuse one pool without a with block."""
+        assert not hasattr(sync_client, "_http_client")
+        first = sync_client._get_http_client()
+        assert sync_client._get_http_client() is first
+        sync_client.close()
+        assert first.is_closed
+        assert sync_client._get_http_client() is not first
+
+    def test_with_block_reuses_lazily_opened_pool(self, sync_client):
+        """Test that entering a with block keeps the open pool instead of leaking it."""
+        first = sync_client._get_http_client()
+        with sync_client:
+            assert sync_client._http_client is first
+        assert first.is_closed
+        with sync_client:
+            assert sync_client._http_client is not first
+            assert not sync_client._http_client.is_closed
+
+    def test_endpoint_methods_share_pool(
+        self, sync_client, course_payload, review_payload, curriculum_payload
+    ):
+        """Test that every endpoint method sends through the same pooled client."""
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            if request.url.path.endswith("/reviews/"):
+                return httpx.Response(200, json={"results": [review_payload]})
+            if request.url.path.endswith("/public-curriculum-items/"):
+                return httpx.Response(200, json={"results": curriculum_payload})
+            if request.url.path == "/api-2.0/courses/":
+                return httpx.Response(200, json={"results": [course_payload]})
+            return httpx.Response(200, json=course_payload)
+
+        pool = self._install_transport(sync_client, handler)
+        assert sync_client.get_courses()[0].id == 12345
+        assert sync_client.get_course_details(12345).title == "Test Python Course"
+        assert sync_client.get_course_reviews(12345)[0].rating == 5.0
+        assert len(sync_client.get_course_public_curriculum(12345)) == 3
+        assert sync_client._http_client is pool
+        assert len(paths) == 4
+
+    def test_request_sends_auth(self, sync_client, course_payload):
+        """Test that requests through the pool carry the client's basic auth."""
+        headers = {}
+
+        def handler(request):
+            headers.update(request.headers)
+            return httpx.Response(200, json=course_payload)
+
+        self._install_transport(sync_client, handler)
+        sync_client.get_course_details(12345)
+        assert headers["authorization"].startswith("Basic ")
+
+    def test_http2_without_h2_raises(self, client_credentials):
+        """Test that HTTP/2 mode reports a missing h2 dependency."""
+        with patch.dict("sys.modules", {"h2": None}):
+            with pytest.raises(UdemyAPIError, match="h2 package"):
+                UdemyClient(**client_credentials, http2=True)
+
+
+class TestUdemyClientPagination:
+    """Test cases for the auto-paginating iterators of UdemyClient."""
+
+    @staticmethod
+    def _paged_handler(payload, pages, requested):
+        """Builds a handler serving `pages` pages of one entry each, linked by next URLs."""
+
+        def handler(request):
+            page = int(request.url.params.get("page", 1))
+            requested.append(page)
+            next_url = None
+            if page < pages:
+                next_url = str(request.url.copy_merge_params({"page": page + 1}))
+            entry = dict(payload, id=page)
+            return httpx.Response(200, json={"count": pages, "next": next_url, "results": [entry]})
+
+        return handler
+
+    def test_iter_courses_follows_next_links(self, sync_client, course_payload):
+        """Test that iter_courses yields every course of every page in order."""
+        requested = []
+        sync_client._http_client = httpx.Client(
+            transport=httpx.MockTransport(self._paged_handler(course_payload, 4, requested))
+        )
+        courses = sync_client.iter_courses()
+        assert next(courses).id == 1
+        assert [course.id for course in courses] == [2, 3, 4]
+        assert requested == [1, 2, 3, 4]
+
+    def test_iter_course_reviews_stops_at_result_window(self, sync_client, review_payload):
+        """Test that pagination stops before page * page_size exceeds 10000."""
+        requested = []
+        sync_client._http_client = httpx.Client(
+            transport=httpx.MockTransport(self._paged_handler(review_payload, 100, requested))
+        )
+        filters = ReviewFilter(page=98, page_size=100)
+        reviews = list(sync_client.iter_course_reviews(12345, filters))
+        assert [review.id for review in reviews] == [98, 99, 100]
+        assert requested == [98, 99, 100]
+
+        requested.clear()
+        filters = ReviewFilter(page=97, page_size=102)
+        assert len(list(sync_client.iter_course_reviews(12345, filters))) == 2
+        assert requested == [97, 98]
+
+    def test_iter_courses_http_error(self, sync_client):
+        """Test that page errors surface as UdemyAPIError."""
+        sync_client._http_client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(503))
+        )
+        with pytest.raises(UdemyAPIError, match="HTTP error 503"):
+            list(sync_client.iter_courses())
+
+
+class TestUdemyClientBulkDetails:
+    """Test cases for UdemyClient.get_many_course_details."""
+
+    @staticmethod
+    def _details_handler(payload, failing_ids=()):
+        """Builds a handler serving course details, failing with 404 for `failing_ids`."""
+
+        def handler(request):
+            course_id = int(request.url.path.rstrip("/").rsplit("/", 1)[-1])
+            if course_id in failing_ids:
+                return httpx.Response(404)
+            return httpx.Response(200, json=dict(payload, id=course_id))
+
+        return handler
+
+    def test_ordered_results_with_failures(self, sync_client, course_payload):
+        """Test that failures are reported per ID and input order is kept."""
+        handler = self._details_handler(course_payload, failing_ids={3})
+        sync_client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        results = list(sync_client.get_many_course_details(range(1, 11), 4, ordered=True))
+
+        assert [result.course_id for result in results] == list(range(1, 11))
+        assert [result.ok for result in results].count(False) == 1
+        assert results[2].course is None
+        assert "HTTP error 404" in str(results[2].error)
+        assert results[0].course.id == 1
+
+    def test_completion_order_yields_every_id(self, sync_client, course_payload):
+        """Test that completion-order streaming yields one result per ID."""
+        handler = self._details_handler(course_payload)
+        sync_client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        results = sync_client.get_many_course_details(iter(range(50)), concurrency=8)
+
+        assert sorted(result.course.id for result in results) == list(range(50))
+
+    def test_invalid_concurrency(self, sync_client):
+        """Test that a concurrency below 1 is rejected."""
+        with pytest.raises(ValueError, match="Concurrency must be at least 1"):
+            list(sync_client.get_many_course_details([1], concurrency=0))
+
+
+class TestUdemyClientCoalescing:
+    """Test cases for single-flight request coalescing in UdemyClient."""
+
+    def test_concurrent_identical_calls_share_one_request(self, client_credentials, course_payload):
+        """Test that threads asking for the same course share one request and result."""
+        requests = []
+        release = threading.Event()
+
+        def handler(request):
+            requests.append(request.url)
+            release.wait(timeout=5)
+            return httpx.Response(200, json=course_payload)
+
+        client = UdemyClient(**client_credentials, coalesce_requests=True)
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(client.get_course_details, 12345) for _ in range(8)]
+            while client.coalesced_requests < 7:
+                time.sleep(0.001)
+            release.set()
+            courses = [future.result() for future in futures]
+
+        assert len(requests) == 1
+        assert all(course is courses[0] for course in courses)
+        assert client.coalesced_requests == 7
+        assert client._in_flight == {}
+
+    def test_errors_are_shared_and_not_sticky(self, client_credentials, course_payload):
+        """Test that a failed request is not reused by later calls."""
+        responses = [httpx.Response(500), httpx.Response(200, json=course_payload)]
+        client = UdemyClient(**client_credentials, coalesce_requests=True)
+        client._http_client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: responses.pop(0))
+        )
+        with pytest.raises(UdemyAPIError, match="HTTP error 500"):
+            client.get_course_details(12345)
+        assert client.get_course_details(12345).id == 12345
+
+    def test_interrupt_stays_with_the_leader(self, client_credentials):
+        """Test that an interrupted leader cancels its followers instead of interrupting them."""
+
+        class Interrupt(BaseException):
+            """Stands in for KeyboardInterrupt."""
+
+        release = threading.Event()
+
+        def handler(request):
+            release.wait(timeout=5)
+            raise Interrupt()
+
+        client = UdemyClient(**client_credentials, coalesce_requests=True)
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(client.get_course_details, 12345)
+            while not client._in_flight:
+                time.sleep(0.001)
+            follower = executor.submit(client.get_course_details, 12345)
+            while client.coalesced_requests < 1:
+                time.sleep(0.001)
+            release.set()
+            with pytest.raises(Interrupt):
+                leader.result()
+            with pytest.raises(CancelledError):
+                follower.result()
+        assert client._in_flight == {}
+
+
+class TestUdemyClientParseEntry:
+    """Test cases for the single-pass entry parser."""
+
+    def test_dispatches_on_class(self, course_payload, review_payload, curriculum_payload):
+        """Test that entries are validated against the model registered for their _class."""
+        course = UdemyClient._parse_entry(course_payload)
+        review = UdemyClient._parse_entry(review_payload)
+        lecture = UdemyClient._parse_entry(curriculum_payload[1])
+
+        assert isinstance(course, Course)
+        assert isinstance(course.visible_instructors[0], Instructor)
+        assert isinstance(course.locale, Locale)
+        assert isinstance(review, CourseReview)
+        assert isinstance(review.user, User)
+        assert isinstance(lecture, Lecture)
+        assert isinstance(lecture.asset, Asset)
+
+    def test_does_not_modify_entry(self, course_payload):
+        """Test that the raw entry is validated in place without being mutated."""
+        snapshot = {**course_payload}
+        UdemyClient._parse_entry(course_payload, Course)
+        assert course_payload == snapshot
+
+    def test_unknown_class(self, curriculum_payload):
+        """Test that an entry without a registered model raises UdemyAPIError."""
+        with pytest.raises(UdemyAPIError, match="Unexpected entry type: practice"):
+            UdemyClient._parse_entry(dict(curriculum_payload[0], _class="practice"))
+
+    def test_invalid_nested_entry(self, course_payload):
+        """Test that invalid nested objects fail the validation of the outer model."""
+        course_payload["locale"] = {"locale": "en_US"}
+        with pytest.raises(ValidationError):
+            UdemyClient._parse_entry(course_payload)
+
+
+class TestUdemyClientJSONValidation:
+    """Test cases for validating raw response bodies with cached TypeAdapters."""
+
+    def test_pages_validate_from_bytes(self, course_payload):
+        """Test that well-formed pages are validated without the per-entry parser."""
+        content = json.dumps(
+            {"count": 2, "next": "https://example.com/?page=2", "results": [course_payload] * 2}
+        ).encode()
+        with patch.object(UdemyClient, "_parse_entry", side_effect=AssertionError("parsed")):
+            courses = UdemyClient._parse_courses(content)
+            models, next_url = UdemyClient._validate_page(content, Course)
+
+        assert [course.id for course in courses] == [12345, 12345]
+        assert all(isinstance(course, Course) for course in models)
+        assert next_url == "https://example.com/?page=2"
+        assert UdemyClient._page_parser(Course) is UdemyClient._page_parser(Course)
+
+    def test_bare_entry_falls_back(self, course_payload):
+        """Test that a bare entry on a list endpoint is still parsed as a single result."""
+        courses = UdemyClient._parse_courses(json.dumps(course_payload).encode())
+        assert [course.id for course in courses] == [12345]
+
+    def test_malformed_page_reports_format(self, sync_client):
+        """Test that a page without a list of results fails with the generic error."""
+        sync_client._http_client = httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json={"results": "not_a_list"})
+            )
+        )
+        with pytest.raises(UdemyAPIError, match="Unexpected response format"):
+            sync_client.get_courses()
+        with pytest.raises(UdemyAPIError, match="Unexpected response format"):
+            list(sync_client.iter_courses())
+
+    def test_invalid_json(self, sync_client):
+        """Test that an undecodable body surfaces as a JSON parsing error."""
+        sync_client._http_client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b"{"))
+        )
+        with pytest.raises(UdemyAPIError, match="JSON parsing error"):
+            sync_client.get_course_reviews(12345)
+        with pytest.raises(UdemyAPIError, match="JSON parsing error"):
+            sync_client.get_course_details(12345)
+
+
+class TestUdemyClientCurriculum:
+    """Test cases for the discriminated-union curriculum parsing of UdemyClient."""
+
+    @staticmethod
+    def _curriculum_handler(items, pages, requested, count=None):
+        """Builds a handler serving `items` on each of `pages` pages linked by next URLs."""
+
+        def handler(request):
+            page = int(request.url.params.get("page", 1))
+            requested.append(page)
+            next_url = None
+            if page < pages:
+                next_url = str(request.url.copy_merge_params({"page": page + 1}))
+            body = {"next": next_url, "results": items}
+            if count is not None:
+                body["count"] = count
+            return httpx.Response(200, json=body)
+
+        return handler
+
+    def test_returns_models_in_one_pass(self, sync_client, curriculum_payload):
+        """Test that chapters, lectures and quizzes are validated into their models."""
+        sync_client._http_client = httpx.Client(
+            transport=httpx.MockTransport(
+                self._curriculum_handler(curriculum_payload, pages=1, requested=[])
+            )
+        )
+        with patch.object(UdemyClient, "_parse_entry", side_effect=AssertionError("parsed")):
+            curriculum = sync_client.get_course_public_curriculum(12345)
+
+        assert [type(item) for item in curriculum] == [Chapter, Lecture, Quiz]
+        assert isinstance(curriculum[1].asset, Asset)
+        assert "class_" not in curriculum[0].model_dump()
+        assert "class_" not in curriculum[2].model_dump()
+
+    def test_skips_items_without_model(self, sync_client, curriculum_payload):
+        """Test that item types without a model are skipped, keeping the others in order."""
+        items = [curriculum_payload[0], {"_class": "practice", "id": 9}, curriculum_payload[2]]
+        sync_client._http_client = httpx.Client(
+            transport=httpx.MockTransport(self._curriculum_handler(items, pages=1, requested=[]))
+        )
+        curriculum = sync_client.get_course_public_curriculum(12345)
+        assert [type(item) for item in curriculum] == [Chapter, Quiz]
+
+    def test_invalid_item(self, sync_client, curriculum_payload):
+        """Test that an invalid item of a known type surfaces as UdemyAPIError."""
+        items = [dict(curriculum_payload[1], asset={"id": "not-an-int"})]
+        sync_client._http_client = httpx.Client(
+            transport=httpx.MockTransport(self._curriculum_handler(items, pages=1, requested=[]))
+        )
+        with pytest.raises(UdemyAPIError, match="JSON parsing error"):
+            sync_client.get_course_public_curriculum(12345)
+
+    def test_iter_course_curriculum_walks_pages(self, sync_client, curriculum_payload):
+        """Test that iter_course_curriculum yields the items of every page in order."""
+        requested = []
+        sync_client._http_client = httpx.Client(
+            transport=httpx.MockTransport(
+                self._curriculum_handler(curriculum_payload, pages=3, requested=requested)
+            )
+        )
+        curriculum = list(sync_client.iter_course_curriculum(12345, page_size=3))
+        assert [type(item) for item in curriculum] == [Chapter, Lecture, Quiz] * 3
+        assert requested == [1, 2, 3]
+
+    def test_get_full_curriculum(self, sync_client, curriculum_page):
+        """Test that every page is fetched and grouped into ordered chapters."""
+        requested = []
+        pages = [curriculum_page(page, 3) for page in (1, 2, 3)]
+
+        def handler(request):
+            page = int(request.url.params["page"])
+            requested.append(page)
+            time.sleep(0.05 * (3 - page))  # Later pages answer first
+            return httpx.Response(200, json={"count": 9, "next": None, "results": pages[page - 1]})
+
+        sync_client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        sections = sync_client.get_full_curriculum(12345, page_size=3)
+
+        assert [section.chapter.id for section in sections] == [1, 2, 3]
+        assert all(
+            [type(item) for item in section.items] == [Lecture, Quiz] for section in sections
+        )
+        assert requested[0] == 1 and sorted(requested[1:]) == [2, 3]
+
+    def test_full_curriculum_sorts_out_of_order_pages(self, sync_client, curriculum_page):
+        """Test that items are put in course order by sort_order, not by the page serving them."""
+
+        def handler(request):
+            page = int(request.url.params["page"])
+            results = curriculum_page(4 - page, 3)  # The API serves the course back to front
+            return httpx.Response(200, json={"count": 9, "results": results})
+
+        sync_client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        sections = sync_client.get_full_curriculum(12345, page_size=3)
+        assert [section.chapter.id for section in sections] == [1, 2, 3]
+        sort_orders = [item.sort_order for section in sections for item in section.items]
+        assert sort_orders == [8, 7, 5, 4, 2, 1]
+
+    def test_full_curriculum_fetches_concurrently(self, sync_client, curriculum_payload):
+        """Test that the pages after the first are in flight together, up to concurrency."""
+        lock, active, peak = threading.Lock(), [0], [0]
+
+        def handler(request):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return httpx.Response(200, json={"count": 30, "results": curriculum_payload})
+
+        sync_client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        sections = sync_client.get_full_curriculum(12345, page_size=3, concurrency=4)
+        assert len(sections) == 10
+        assert peak[0] == 4
+
+    def test_full_curriculum_without_count(self, sync_client, curriculum_payload):
+        """Test that pages without a count are walked through their next links."""
+        requested = []
+        sync_client._http_client = httpx.Client(
+            transport=httpx.MockTransport(
+                self._curriculum_handler(curriculum_payload, pages=2, requested=requested)
+            )
+        )
+        sections = sync_client.get_full_curriculum(12345, page_size=3)
+        assert len(sections) == 2 and requested == [1, 2]
+
+    def test_full_curriculum_leading_items(self, sync_client, curriculum_payload):
+        """Test that items before the first chapter form a section without a chapter."""
+        items = [dict(curriculum_payload[1], sort_order=4), *curriculum_payload]
+        sync_client._http_client = httpx.Client(
+            transport=httpx.MockTransport(
+                self._curriculum_handler(items, pages=1, requested=[], count=4)
+            )
+        )
+        sections = sync_client.get_full_curriculum(12345)
+        assert [section.chapter is None for section in sections] == [True, False]
+        assert [type(item) for item in sections[0].items] == [Lecture]
+
+    def test_full_curriculum_invalid_concurrency(self, sync_client):
+        """Test that a concurrency below one is rejected."""
+        with pytest.raises(ValueError):
+            sync_client.get_full_curriculum(12345, concurrency=0)
+
+
+class TestUdemyClientLeanRecords:
+    """Test cases for the lean record mode of UdemyClient."""
+
+    def test_get_courses_lean(self, sync_client, course_payload):
+        """Test that lean courses are slotted records that convert to equal models."""
+        sync_client._http_client = httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json={"results": [course_payload]})
+            )
+        )
+        course = sync_client.get_courses()[0]
+        record = sync_client.get_courses(lean=True)[0]
+
+        assert isinstance(record, CourseRecord)
+        assert not hasattr(record, "__dict__")
+        assert not hasattr(record.visible_instructors[0], "__dict__")
+        assert record.title == course.title
+        assert record.locale.locale == course.locale.locale
+        assert record.to_model() == course
+
+    def test_records_are_frozen(self, review_payload):
+        """Test that records cannot be modified after parsing."""
+        record = UdemyClient._parse_entry(review_payload, CourseReviewRecord)
+        with pytest.raises(AttributeError):
+            record.rating = 1.0
+
+    def test_iter_course_reviews_lean(self, sync_client, review_payload):
+        """Test that the review iterator yields records in lean mode."""
+        sync_client._http_client = httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200, json={"next": None, "results": [review_payload]}
+                )
+            )
+        )
+        reviews = list(sync_client.iter_course_reviews(12345, lean=True))
+        assert [type(review) for review in reviews] == [CourseReviewRecord]
+        assert reviews[0].to_model() == UdemyClient._parse_entry(review_payload, CourseReview)
+
+    def test_invalid_lean_entry(self, sync_client, review_payload):
+        """Test that lean entries are validated like models."""
+        sync_client._http_client = httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200, json={"results": [dict(review_payload, rating="bad")]}
+                )
+            )
+        )
+        with pytest.raises(UdemyAPIError, match="JSON parsing error"):
+            sync_client.get_course_reviews(12345, lean=True)
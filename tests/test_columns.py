@@ -0,0 +1,163 @@
+"""Tests for the columnar review and course containers."""
+
+import importlib.util
+import math
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from pydemy import (
+    CourseColumns,
+    DictionaryColumn,
+    ReviewColumns,
+    StringColumn,
+    UdemyClient,
+)
+from pydemy._exceptions import UdemyAPIError
+from pydemy.models import CourseReview, CourseReviewRecord
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+def _review(payload, review_id, name, content):
+    """Returns a CourseReview built from `payload` with a different id, user and content."""
+    user = dict(payload["user"], name=name, display_name=name)
+    return CourseReview.model_validate(dict(payload, id=review_id, user=user, content=content))
+
+
+class TestStringColumn:
+    """Test cases for the packed string column."""
+
+    def test_packs_and_decodes(self):
+        """Test that strings round-trip through one buffer, including non-ASCII text."""
+        column = StringColumn()
+        column.extend(["Great", "", "Très bien ✓"])
+        assert len(column) == 3
+        assert list(column) == ["Great", "", "Très bien ✓"]
+        assert column[-1] == "Très bien ✓"
+        assert list(column.offsets) == [0, 5, 5, 5 + len("Très bien ✓".encode())]
+
+    def test_exported_string_buffer_is_not_half_extended(self):
+        """Test that a string column with an exported buffer appends neither data nor offsets."""
+        column = StringColumn()
+        column.extend(["a"])
+        view = memoryview(column.data)
+        with pytest.raises(BufferError):
+            column.extend(["b", "c"])
+        view.release()
+        assert list(column) == ["a"] and list(column.offsets) == [0, 1]
+
+
+class TestDictionaryColumn:
+    """Test cases for the dictionary-encoded column."""
+
+    def test_encodes_repeated_values_once(self):
+        """Test that each distinct value is stored once and rows hold codes."""
+        column = DictionaryColumn()
+        column.extend(["Jane", "John", "Jane"])
+        column.extend(["John"])
+        assert column.categories == ["Jane", "John"]
+        assert list(column.codes) == [0, 1, 0, 1]
+        assert list(column) == ["Jane", "John", "Jane", "John"]
+
+
+class TestReviewColumns:
+    """Test cases for ReviewColumns."""
+
+    def test_extend_by_page(self, review_payload):
+        """Test that pages of models and records are appended column by column."""
+        columns = ReviewColumns([_review(review_payload, 1, "Jane", "Good")])
+        columns.extend(
+            [
+                UdemyClient._parse_entry(dict(review_payload, id=2), CourseReviewRecord),
+                _review(review_payload, 3, "Jane", "Meh"),
+            ]
+        )
+
+        assert len(columns) == 3
+        assert list(columns["id"]) == [1, 2, 3]
+        assert list(columns["rating"]) == [5.0, 5.0, 5.0]
+        assert list(columns["content"]) == ["Good", "Great course!", "Meh"]
+        assert columns["user_name"].categories == ["Jane"]
+        created = datetime(2023, 1, 1, tzinfo=timezone.utc).timestamp() * 1_000_000
+        assert list(columns["created"]) == [created] * 3
+
+    def test_failed_batch_leaves_table_unchanged(self, review_payload):
+        """Test that a row failing a getter appends nothing, keeping columns aligned."""
+        columns = ReviewColumns([_review(review_payload, 1, "Jane", "Good")])
+        broken = _review(review_payload, 3, "John", "Meh").model_copy(update={"content": None})
+        with pytest.raises(AttributeError):
+            columns.extend([_review(review_payload, 2, "Jane", "Fine"), broken])
+
+        assert {name: len(column) for name, column in columns.columns.items()} == {
+            name: 1 for name in columns.columns
+        }
+        columns.extend([_review(review_payload, 2, "Jane", "Fine")])
+        assert list(columns["id"]) == [1, 2] and list(columns["content"]) == ["Good", "Fine"]
+
+    def test_exported_column_leaves_table_unchanged(self, review_payload):
+        """Test that a view blocking a later column rolls back the columns extended before it."""
+        columns = ReviewColumns([_review(review_payload, 1, "Jane", "Good")])
+        view = memoryview(columns["user_display_name"].codes)
+        with pytest.raises(BufferError):
+            columns.extend([_review(review_payload, 2, "John", "Fine")])
+
+        assert {name: len(column) for name, column in columns.columns.items()} == {
+            name: 1 for name in columns.columns
+        }
+        assert list(columns["content"]) == ["Good"]
+        assert columns["user_name"].categories == ["Jane"]
+        view.release()
+        columns.extend([_review(review_payload, 2, "John", "Fine")])
+        assert list(columns["user_name"]) == ["Jane", "John"]
+
+    def test_from_client_pages(self, sync_client, review_payload):
+        """Test that the iterator's lean records can be collected straight into columns."""
+        sync_client._http_client = httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200, json={"next": None, "results": [review_payload] * 3}
+                )
+            )
+        )
+        columns = ReviewColumns(sync_client.iter_course_reviews(12345, lean=True))
+        assert list(columns["id"]) == [review_payload["id"]] * 3
+
+    @pytest.mark.skipif(not HAS_NUMPY, reason="numpy is not installed")
+    def test_to_numpy_is_zero_copy(self, review_payload):
+        """Test that numeric and datetime columns are exported as views of the arrays."""
+        import numpy
+
+        columns = ReviewColumns([_review(review_payload, 1, "Jane", "Good")] * 2)
+        arrays = columns.to_numpy()
+        assert arrays["rating"].mean() == 5.0
+        assert arrays["created"].dtype == numpy.dtype("datetime64[us]")
+        assert numpy.shares_memory(arrays["id"], numpy.asarray(memoryview(columns["id"])))
+        data, offsets = arrays["content"]
+        assert bytes(data[offsets[0] : offsets[1]]) == b"Good"
+        assert arrays["user_name"].tolist() == [0, 0]
+
+    @pytest.mark.skipif(HAS_NUMPY, reason="numpy is installed")
+    def test_to_numpy_without_numpy(self, review_payload):
+        """Test that exporting without NumPy raises a helpful UdemyAPIError."""
+        columns = ReviewColumns([_review(review_payload, 1, "Jane", "Good")])
+        with pytest.raises(UdemyAPIError, match="pip install pydemy\\[numpy\\]"):
+            columns.to_numpy()
+
+
+class TestCourseColumns:
+    """Test cases for CourseColumns."""
+
+    def test_columns(self, course_payload):
+        """Test that prices, flags and dictionary-encoded locales are collected."""
+        free = dict(course_payload, id=2, is_paid=False, price_detail=None)
+        columns = CourseColumns(
+            [UdemyClient._parse_entry(course_payload), UdemyClient._parse_entry(free)]
+        )
+        assert list(columns["id"]) == [12345, 2]
+        assert list(columns["is_paid"]) == [1, 0]
+        assert columns["price_amount"][0] == 19.99
+        assert math.isnan(columns["price_amount"][1])
+        assert list(columns["locale"]) == ["en_US", "en_US"]
+        assert columns["locale"].categories == ["en_US"]
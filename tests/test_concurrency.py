@@ -0,0 +1,228 @@
+"""Tests for the adaptive concurrency limiter and its use by the clients."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from pydemy import AdaptiveLimiter, AsyncUdemyClient, UdemyClient
+
+
+def _complete(limiter, count, latency=0.01, status_code=200):
+    """Sends and completes `count` requests, all in flight together up to the limit."""
+    for _ in range(count):
+        limiter.acquire()
+        limiter.release(latency, status_code)
+
+
+def _saturate(limiter, latency=0.01, status_code=200):
+    """Completes one window with the full limit of requests in flight."""
+    done = 0
+    while done < limiter.window:
+        batch = min(limiter.limit, limiter.window - done)
+        for _ in range(batch):
+            limiter.acquire()
+        for _ in range(batch):
+            limiter.release(latency, status_code)
+        done += batch
+
+
+class TestAdaptiveLimiter:
+    """Test cases for AdaptiveLimiter."""
+
+    def test_grows_additively_when_saturated(self):
+        """Test that healthy windows with the limit in use grow it by `increase`."""
+        limiter = AdaptiveLimiter(initial_limit=4, window=8, increase=2)
+        _saturate(limiter)
+        _saturate(limiter)
+        assert limiter.limit == 8
+        assert [change.reason for change in limiter.history] == ["increase", "increase"]
+
+    def test_idle_windows_do_not_grow(self):
+        """Test that the limit only grows when the requests in flight reached it."""
+        limiter = AdaptiveLimiter(initial_limit=4, window=8)
+        _complete(limiter, 16)  # One request in flight at a time
+        assert limiter.limit == 4 and not limiter.history
+
+    def test_throttling_halves_once_per_burst(self):
+        """Test that 429s shrink the limit at once, but one burst only shrinks it once."""
+        limiter = AdaptiveLimiter(initial_limit=16, window=100)
+        for _ in range(8):
+            limiter.acquire()
+        for _ in range(8):
+            limiter.release(1.0, 429)  # Sent before the first decrease
+        assert limiter.limit == 8
+        assert limiter.throttled == 8
+        _complete(limiter, 1, latency=0.0, status_code=429)  # Sent after the decrease
+        assert limiter.limit == 4
+        assert [change.reason for change in limiter.history] == ["throttled", "throttled"]
+
+    def test_errors_shrink_the_limit(self):
+        """Test that a window with more failures than error_threshold shrinks the limit."""
+        limiter = AdaptiveLimiter(initial_limit=8, window=10, error_threshold=0.2)
+        _complete(limiter, 7)
+        _complete(limiter, 3, status_code=None)  # Connection errors and timeouts
+        assert limiter.limit == 4
+        assert limiter.history[-1].reason == "errors"
+        assert limiter.history[-1].error_rate == pytest.approx(0.3)
+
+    def test_latency_target(self):
+        """Test that a latency percentile above the target shrinks the limit."""
+        limiter = AdaptiveLimiter(initial_limit=8, window=10, latency_target=0.5)
+        _complete(limiter, 10, latency=0.8)
+        assert limiter.limit == 4
+        assert limiter.history[-1].reason == "latency"
+        assert limiter.history[-1].latency == 0.8
+
+    def test_derived_latency_target(self):
+        """Test that without a target, latency is compared with the fastest window."""
+        limiter = AdaptiveLimiter(initial_limit=4, window=8, latency_tolerance=2.0)
+        _saturate(limiter, latency=0.1)
+        assert limiter.limit == 5
+        _saturate(limiter, latency=0.15)  # Within twice the baseline
+        assert limiter.limit == 6
+        _saturate(limiter, latency=0.5)
+        assert limiter.limit == 3
+        assert limiter.metrics()["baseline_latency"] == 0.1
+
+    def test_bounds(self):
+        """Test that the limit stays within min_limit and max_limit."""
+        limiter = AdaptiveLimiter(initial_limit=2, min_limit=2, max_limit=3, window=2)
+        for _ in range(3):
+            _saturate(limiter)
+        assert limiter.limit == 3
+        _complete(limiter, 10, latency=0.0, status_code=429)
+        assert limiter.limit == 2
+
+    def test_blocks_threads_over_the_limit(self):
+        """Test that threads wait for a slot once the limit is in flight."""
+        limiter = AdaptiveLimiter(initial_limit=2, window=100)
+        limiter.acquire()
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def worker():
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        assert not acquired.wait(0.05)
+        assert limiter.metrics()["waiting"] == 1
+        limiter.release(0.01, 200)
+        assert acquired.wait(1)
+        thread.join()
+        assert limiter.in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_async_waiters_and_cancellation(self):
+        """Test that tasks wait for a slot and a cancelled waiter does not keep one."""
+        limiter = AdaptiveLimiter(initial_limit=1, window=100)
+        await limiter.acquire_async()
+        cancelled = asyncio.ensure_future(limiter.acquire_async())
+        waiting = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        limiter.release(0.01, 200)
+        await asyncio.wait_for(waiting, 1)
+        assert limiter.in_flight == 1 and limiter.metrics()["waiting"] == 0
+
+    def test_metrics(self):
+        """Test the metrics snapshot."""
+        limiter = AdaptiveLimiter(initial_limit=3, window=100)
+        _complete(limiter, 2, latency=0.2)
+        _complete(limiter, 1, status_code=503)
+        metrics = limiter.metrics()
+        assert metrics["limit"] == 3 and metrics["in_flight"] == 0
+        assert metrics["completed"] == 3 and metrics["errors"] == 1
+        assert metrics["window_median_latency"] == 0.2
+
+    def test_invalid_arguments(self):
+        """Test that inconsistent limits and factors are rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(initial_limit=10, max_limit=5)
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(min_limit=0)
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(decrease=1.0)
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(latency_percentile=0)
+
+
+class TestClientConcurrencyLimiter:
+    """Test cases for the concurrency limiter of the clients."""
+
+    def test_bulk_requests_follow_the_limit(self, client_credentials, course_payload):
+        """Test that bulk requests stay within the limit, which shrinks on 429 responses."""
+        lock, active, peak, calls = threading.Lock(), [0], [0], [0]
+
+        def handler(request):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+                calls[0] += 1
+                throttled = calls[0] <= 4
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            if throttled:
+                return httpx.Response(429)
+            return httpx.Response(200, json=course_payload)
+
+        limiter = AdaptiveLimiter(initial_limit=4, window=1000)
+        client = UdemyClient(**client_credentials, concurrency_limiter=limiter)
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        results = list(client.get_many_course_details(range(24), concurrency=16))
+
+        assert client.concurrency_limiter is limiter
+        assert sum(not result.ok for result in results) == 4
+        assert limiter.limit == 2 and peak[0] <= 4
+        assert limiter.in_flight == 0 and limiter.completed == 24
+
+    @pytest.mark.asyncio
+    async def test_async_pages_follow_the_limit(self, client_credentials, review_payload):
+        """Test that the async client holds a slot per request and releases it on errors."""
+        active, peak = [0], [0]
+
+        async def handler(request):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+            if request.url.params.get("page") == "3":
+                raise httpx.ConnectError("refused")
+            return httpx.Response(200, json={"results": [review_payload]})
+
+        limiter = AdaptiveLimiter(initial_limit=2, window=1000)
+        client = AsyncUdemyClient(**client_credentials, concurrency_limiter=limiter)
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        results = await asyncio.gather(
+            *(client.get_full_curriculum(course_id, page_size=1) for course_id in range(6)),
+            return_exceptions=True,
+        )
+        assert len(results) == 6 and peak[0] == 2
+        assert limiter.in_flight == 0 and limiter.completed == 6
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_frees_its_slot(self, client_credentials):
+        """Test that a request cancelled in flight frees its slot without counting as an error."""
+        started = asyncio.Event()
+
+        async def handler(request):
+            started.set()
+            await asyncio.sleep(10)
+
+        limiter = AdaptiveLimiter(initial_limit=1, window=1000)
+        client = AsyncUdemyClient(**client_credentials, concurrency_limiter=limiter)
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        task = asyncio.ensure_future(client.get_course_details(1))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert limiter.in_flight == 0 and limiter.errors == 0 and limiter.completed == 0
+        await client.aclose()
@@ -0,0 +1,209 @@
+"""Tests for the batch course enrichment."""
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from pydemy import AsyncUdemyClient, CourseEnrichment, UdemyClient
+from pydemy._enrichment import EnrichmentPlan
+from pydemy._exceptions import UdemyAPIError
+from pydemy.models import Chapter, Lecture, Quiz
+
+
+class FakeCourses:
+    """Mock API serving course details, reviews and 3-item curriculum pages for any course."""
+
+    def __init__(self, course_payload, review_payload, curriculum_page, pages=3):
+        self.course_payload = course_payload
+        self.review_payload = review_payload
+        self.curriculum_page = curriculum_page
+        self.pages = pages
+        self.delays = {}  # (course ID, part) -> seconds
+        self.failing = set()  # (course ID, part)
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def respond(self, request):
+        """Returns the course ID, part, delay and response of a request."""
+        segments = request.url.path.strip("/").split("/")
+        course_id = int(segments[segments.index("courses") + 1])
+        part = {"reviews": "reviews", "public-curriculum-items": "curriculum"}.get(
+            segments[-1], "details"
+        )
+        with self.lock:
+            self.requests.append((course_id, part, request.url.params.get("page")))
+        delay = self.delays.get((course_id, part), 0)
+        if (course_id, part) in self.failing:
+            return delay, httpx.Response(503)
+        if part == "details":
+            return delay, httpx.Response(200, json=dict(self.course_payload, id=course_id))
+        if part == "reviews":
+            return delay, httpx.Response(200, json={"results": [self.review_payload]})
+        page = int(request.url.params["page"])
+        results = self.curriculum_page(page, self.pages)
+        count = self.pages * len(results)
+        return delay, httpx.Response(200, json={"count": count, "results": results})
+
+    def __call__(self, request):
+        delay, response = self.respond(request)
+        time.sleep(delay)
+        return response
+
+    async def handle_async(self, request):
+        """Asynchronous handler for httpx.AsyncClient."""
+        delay, response = self.respond(request)
+        await asyncio.sleep(delay)
+        return response
+
+
+@pytest.fixture
+def api(course_payload, review_payload, curriculum_page):
+    """Fixture providing the fake API."""
+    return FakeCourses(course_payload, review_payload, curriculum_page)
+
+
+@pytest.fixture
+def client(client_credentials, api):
+    """Fixture providing a client answered by the fake API."""
+    client = UdemyClient(**client_credentials)
+    client._http_client = httpx.Client(transport=httpx.MockTransport(api))
+    return client
+
+
+class TestEnrichCourses:
+    """Test cases for UdemyClient.enrich_courses."""
+
+    def test_assembles_every_part(self, client, api):
+        """Test that each course gets its details, reviews and whole curriculum."""
+        results = list(client.enrich_courses([1, 2, 3], page_size=3))
+
+        assert sorted(result.course_id for result in results) == [1, 2, 3]
+        for result in results:
+            assert isinstance(result, CourseEnrichment) and result.ok
+            assert result.course.id == result.course_id
+            assert len(result.reviews) == 1
+            assert [section.chapter.id for section in result.curriculum] == [1, 2, 3]
+            assert [type(item) for item in result.curriculum[0].items] == [Lecture, Quiz]
+        assert len(api.requests) == 3 * 5
+
+    def test_yields_courses_as_they_complete(self, client, api):
+        """Test that a slow course does not hold back the ones finished after it started."""
+        api.delays[(1, "curriculum")] = 0.2
+        results = [result.course_id for result in client.enrich_courses([1, 2], page_size=3)]
+        assert results == [2, 1]
+
+    def test_failed_parts_are_reported(self, client, api):
+        """Test that a failing request only drops its own part."""
+        api.failing.add((2, "reviews"))
+        results = {result.course_id: result for result in client.enrich_courses([1, 2])}
+
+        assert results[1].ok
+        assert not results[2].ok
+        assert set(results[2].errors) == {"reviews"}
+        assert isinstance(results[2].errors["reviews"], UdemyAPIError)
+        assert results[2].reviews is None
+        assert results[2].course is not None and results[2].curriculum is not None
+
+    def test_weighted_budget(self, client, api):
+        """Test that the weights of the requests in flight never exceed the budget."""
+        weights = {"details": 1, "reviews": 1, "curriculum": 3}
+        lock, load, peak = threading.Lock(), [0], [0]
+
+        def handler(request):
+            weight = 3 if "curriculum" in request.url.path else 1
+            with lock:
+                load[0] += weight
+                peak[0] = max(peak[0], load[0])
+            time.sleep(0.01)
+            with lock:
+                load[0] -= weight
+            return api(request)
+
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        results = list(client.enrich_courses(range(1, 7), concurrency=4, weights=weights))
+        assert len(results) == 6
+        assert peak[0] == 4
+
+    def test_course_ids_are_consumed_lazily(self, client):
+        """Test that at most `concurrency` courses are open at a time."""
+        consumed = []
+
+        def course_ids():
+            for course_id in range(1, 101):
+                consumed.append(course_id)
+                yield course_id
+
+        results = client.enrich_courses(course_ids(), concurrency=2)
+        next(results)
+        assert len(consumed) <= 3
+        results.close()
+
+    def test_invalid_arguments(self, client):
+        """Test that a concurrency, weight or part the plan cannot use is rejected."""
+        with pytest.raises(ValueError, match="Concurrency"):
+            next(client.enrich_courses([1], concurrency=0))
+        with pytest.raises(ValueError, match="Weights"):
+            next(client.enrich_courses([1], weights={"reviews": 0}))
+        with pytest.raises(ValueError, match="instructors"):
+            next(client.enrich_courses([1], weights={"instructors": 1}))
+
+
+class TestEnrichmentPlan:
+    """Test cases for the job graph of EnrichmentPlan."""
+
+    def test_follow_up_pages_go_first(self, client, curriculum_payload):
+        """Test that a course's remaining curriculum pages start before the next course."""
+        plan = EnrichmentPlan(client, [1, 2], concurrency=2, page_size=3)
+        items = client._parse_curriculum(json.dumps({"results": curriculum_payload}).encode())
+        course, page = object(), (items, None, 9)
+
+        details, reviews = plan.start()
+        assert [(job.order, job.part) for job in (details, reviews)] == [
+            (0, "details"),
+            (0, "reviews"),
+        ]
+        assert plan.finish(details, course) == []
+        assert plan.start() == []  # The curriculum page needs 2 units and only 1 is free
+        plan.finish(reviews, [])
+
+        for number in (1, 2, 3):  # Pages 2 and 3 are only planned once page 1 tells the count
+            (job,) = plan.start()
+            assert (job.order, job.part, job.page) == (0, "curriculum", number)
+            finished = plan.finish(job, page)
+
+        (done,) = finished
+        assert done.course_id == 1 and done.course is course
+        assert [type(section.chapter) for section in done.curriculum] == [Chapter] * 3
+        assert [job.order for job in plan.start()] == [1, 1]
+
+
+class TestAsyncEnrichCourses:
+    """Test cases for AsyncUdemyClient.enrich_courses."""
+
+    @pytest.mark.asyncio
+    async def test_assembles_courses_concurrently(self, client_credentials, api):
+        """Test that courses are enriched within the budget and yielded as they complete."""
+        api.delays[(1, "details")] = 0.1
+        client = AsyncUdemyClient(**client_credentials)
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(api.handle_async))
+        results = [result async for result in client.enrich_courses([1, 2, 3], page_size=3)]
+
+        assert [result.course_id for result in results][-1] == 1
+        assert all(result.ok for result in results)
+        assert all(len(result.curriculum) == 3 for result in results)
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_failed_part(self, client_credentials, api):
+        """Test that a failing curriculum page is reported without the curriculum."""
+        api.failing.add((1, "curriculum"))
+        client = AsyncUdemyClient(**client_credentials)
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(api.handle_async))
+        (result,) = [result async for result in client.enrich_courses([1])]
+        assert result.curriculum is None and set(result.errors) == {"curriculum"}
+        assert result.course is not None and result.reviews is not None
+        await client.aclose()
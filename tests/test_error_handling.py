@@ -1,5 +1,6 @@
 """Tests for error handling scenarios."""
 
+import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
@@ -40,7 +41,7 @@ class TestErrorHandling:
         assert str(error) == "Test error message"
         assert isinstance(error, Exception)
 
-    @patch("httpx.get")
+    @patch("httpx.Client.get")
     def test_http_status_error_handling(self, mock_get, sync_client):
         """Test HTTP status error handling."""
         mock_response = Mock()
@@ -53,7 +54,7 @@ class TestErrorHandling:
         with pytest.raises(UdemyAPIError, match="HTTP error 404"):
             sync_client.get_courses()
 
-    @patch("httpx.get")
+    @patch("httpx.Client.get")
     def test_http_status_error_500(self, mock_get, sync_client):
         """Test HTTP 500 error handling."""
         mock_response = Mock()
@@ -66,7 +67,7 @@ class TestErrorHandling:
         with pytest.raises(UdemyAPIError, match="HTTP error 500"):
             sync_client.get_courses()
 
-    @patch("httpx.get")
+    @patch("httpx.Client.get")
     def test_http_status_error_401(self, mock_get, sync_client):
         """Test HTTP 401 unauthorized error handling."""
         mock_response = Mock()
@@ -79,7 +80,7 @@ class TestErrorHandling:
         with pytest.raises(UdemyAPIError, match="HTTP error 401"):
             sync_client.get_courses()
 
-    @patch("httpx.get")
+    @patch("httpx.Client.get")
     def test_request_error_handling(self, mock_get, sync_client):
         """Test request error handling."""
         mock_get.side_effect = httpx.RequestError("Connection timeout")
@@ -87,7 +88,7 @@ class TestErrorHandling:
         with pytest.raises(UdemyAPIError, match="Request error"):
             sync_client.get_courses()
 
-    @patch("httpx.get")
+    @patch("httpx.Client.get")
     def test_request_error_handling_dns(self, mock_get, sync_client):
         """Test DNS resolution error handling."""
         mock_get.side_effect = httpx.RequestError("DNS resolution failed")
@@ -95,75 +96,77 @@ class TestErrorHandling:
         with pytest.raises(UdemyAPIError, match="Request error"):
             sync_client.get_courses()
 
-    @patch("httpx.get")
+    @patch("httpx.Client.get")
     def test_json_parsing_error_handling(self, mock_get, sync_client):
         """Test JSON parsing error handling."""
         mock_response = Mock()
-        mock_response.json.side_effect = ValueError("Invalid JSON format")
+        mock_response.content = b"Invalid JSON format"
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
         with pytest.raises(UdemyAPIError, match="JSON parsing error"):
             sync_client.get_courses()
 
-    @patch("httpx.get")
+    @patch("httpx.Client.get")
     def test_json_parsing_error_empty_response(self, mock_get, sync_client):
         """Test JSON parsing error with empty response."""
         mock_response = Mock()
-        mock_response.json.side_effect = ValueError("Expecting value: line 1 column 1")
+        mock_response.content = b"Expecting value: line 1 column 1"
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
         with pytest.raises(UdemyAPIError, match="JSON parsing error"):
             sync_client.get_courses()
 
-    @patch("httpx.get")
+    @patch("httpx.Client.get")
     def test_unexpected_response_format_handling(self, mock_get, sync_client):
         """Test unexpected response format handling."""
         mock_response = Mock()
-        mock_response.json.return_value = {"invalid": "format"}
+        mock_response.content = json.dumps({"invalid": "format"}).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
         with pytest.raises(UdemyAPIError, match="Unexpected response format"):
             sync_client.get_courses()
 
-    @patch("httpx.get")
+    @patch("httpx.Client.get")
     def test_unexpected_response_format_no_results(self, mock_get, sync_client):
         """Test unexpected response format without results key."""
         mock_response = Mock()
-        mock_response.json.return_value = {"data": []}
+        mock_response.content = json.dumps({"data": []}).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
         with pytest.raises(UdemyAPIError, match="Unexpected response format"):
             sync_client.get_courses()
 
-    @patch("httpx.get")
+    @patch("httpx.Client.get")
     def test_unexpected_response_format_non_list_results(self, mock_get, sync_client):
         """Test unexpected response format with non-list results."""
         mock_response = Mock()
-        mock_response.json.return_value = {"results": "not_a_list"}
+        mock_response.content = json.dumps({"results": "not_a_list"}).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
         with pytest.raises(UdemyAPIError, match="Unexpected response format"):
             sync_client.get_courses()
 
-    @patch("httpx.get")
+    @patch("httpx.Client.get")
     def test_pydantic_validation_error_handling(self, mock_get, sync_client):
         """Test Pydantic validation error handling."""
         mock_response = Mock()
         # Return invalid data that will fail Pydantic validation
-        mock_response.json.return_value = {
-            "results": [
-                {
-                    "_class": "course",
-                    "id": "invalid_id",  # Should be int
-                    "title": "Test Course",
-                }
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "results": [
+                    {
+                        "_class": "course",
+                        "id": "invalid_id",  # Should be int
+                        "title": "Test Course",
+                    }
+                ]
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -178,7 +181,7 @@ class TestErrorHandling:
         mock_client_instance.get.side_effect = httpx.HTTPStatusError(
             "404 Not Found", request=Mock(), response=Mock(status_code=404)
         )
-        mock_async_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_async_client_class.return_value = mock_client_instance
 
         with pytest.raises(UdemyAPIError, match="HTTP error 404"):
             await async_client.get_courses()
@@ -189,7 +192,7 @@ class TestErrorHandling:
         """Test async request error handling."""
         mock_client_instance = AsyncMock()
         mock_client_instance.get.side_effect = httpx.RequestError("Connection timeout")
-        mock_async_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_async_client_class.return_value = mock_client_instance
 
         with pytest.raises(UdemyAPIError, match="Request error"):
             await async_client.get_courses()
@@ -200,10 +203,10 @@ class TestErrorHandling:
         """Test async JSON parsing error handling."""
         mock_client_instance = AsyncMock()
         mock_response = AsyncMock()
-        mock_response.json.side_effect = ValueError("Invalid JSON format")
+        mock_response.content = b"Invalid JSON format"
         mock_response.raise_for_status.return_value = None
         mock_client_instance.get.return_value = mock_response
-        mock_async_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_async_client_class.return_value = mock_client_instance
 
         with pytest.raises(UdemyAPIError, match="JSON parsing error"):
             await async_client.get_courses()
@@ -216,10 +219,10 @@ class TestErrorHandling:
         """Test async unexpected response format handling."""
         mock_client_instance = AsyncMock()
         mock_response = AsyncMock()
-        mock_response.json.return_value = {"invalid": "format"}
+        mock_response.content = json.dumps({"invalid": "format"}).encode()
         mock_response.raise_for_status.return_value = None
         mock_client_instance.get.return_value = mock_response
-        mock_async_client_class.return_value.__aenter__.return_value = mock_client_instance
+        mock_async_client_class.return_value = mock_client_instance
 
         with pytest.raises(UdemyAPIError, match="Unexpected response format"):
             await async_client.get_courses()
@@ -234,7 +237,7 @@ class TestErrorHandling:
             assert e.__cause__ is original_error
             assert str(e.__cause__) == "Original error"
 
-    @patch("httpx.get")
+    @patch("httpx.Client.get")
     def test_error_chaining_in_client_methods(self, mock_get, sync_client):
         """Test error chaining in client methods."""
         mock_get.side_effect = httpx.RequestError("Connection error")
@@ -245,7 +248,7 @@ class TestErrorHandling:
             assert e.__cause__ is not None
             assert isinstance(e.__cause__, httpx.RequestError)
 
-    @patch("httpx.get")
+    @patch("httpx.Client.get")
     def test_multiple_error_types_in_same_method(self, mock_get, sync_client):
         """Test multiple error types in the same method."""
         # Test HTTP error
@@ -262,7 +265,7 @@ class TestErrorHandling:
 
         # Test JSON error
         mock_response = Mock()
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response.content = b"Invalid JSON"
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         with pytest.raises(UdemyAPIError, match="JSON parsing error"):
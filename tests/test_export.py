@@ -0,0 +1,206 @@
+"""Tests for the streaming JSON Lines export."""
+
+import asyncio
+import gzip
+import io
+import json
+import threading
+from datetime import datetime
+
+import httpx
+import pytest
+
+from pydemy import (
+    AsyncJSONLWriter,
+    JSONLWriter,
+    UdemyClient,
+    export_jsonl,
+    export_jsonl_async,
+)
+from pydemy._results import CurriculumSection
+from pydemy.models import CourseReview
+
+
+class RecordingFile(io.BytesIO):
+    """BytesIO that records the size of every write."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append(len(data))
+        return super().write(data)
+
+
+class FakeStreamWriter:
+    """Minimal asyncio.StreamWriter stand-in that records writes and drains."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.drains = 0
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        self.drains += 1
+
+
+def _lines(data):
+    """Returns the decoded JSON lines of `data`."""
+    return [json.loads(line) for line in data.splitlines()]
+
+
+class TestJSONLWriter:
+    """Test cases for the synchronous export."""
+
+    def test_exports_models_records_and_dicts(self, review_payload, curriculum_payload):
+        """Test that models, lean records and plain values become one JSON line each."""
+        review = CourseReview.model_validate(review_payload)
+        record = UdemyClient._parse_review_records(
+            json.dumps({"results": [review_payload]}).encode()
+        )[0]
+        chapter = UdemyClient._parse_curriculum(
+            json.dumps({"results": curriculum_payload[:1]}).encode()
+        )[0]
+        target = io.BytesIO()
+
+        assert export_jsonl([review, record, chapter, {"id": 1}], target) == 4
+        lines = _lines(target.getvalue())
+        assert lines[0] == lines[1] == review.model_dump(mode="json")
+        assert lines[0]["created"] == "2023-01-01T00:00:00+00:00"
+        assert "class_" not in lines[2] and lines[2]["title"] == "Introduction"
+        assert lines[3] == {"id": 1}
+        assert not target.closed
+
+    def test_nested_models_and_datetimes(self, curriculum_payload):
+        """Test that results holding models and naive datetimes are exported as real JSON."""
+        chapter = UdemyClient._parse_curriculum(
+            json.dumps({"results": curriculum_payload[:1]}).encode()
+        )[0]
+        target = io.BytesIO()
+        export_jsonl(
+            [CurriculumSection(chapter, []), {"at": datetime(2023, 1, 1, 12, 30)}], target
+        )
+        section, value = _lines(target.getvalue())
+        assert section == [chapter.model_dump(mode="json"), []]
+        assert value == {"at": "2023-01-01T12:30:00"}
+
+    def test_unsupported_values_are_rejected(self):
+        """Test that values without a JSON form raise TypeError instead of being stringified."""
+        target = io.BytesIO()
+        with pytest.raises(TypeError, match="Cannot export dict"):
+            export_jsonl([{"lock": threading.Lock()}], target)
+
+    def test_fixed_size_chunks(self, review_payload):
+        """Test that every write but the last has exactly chunk_size bytes."""
+        target = RecordingFile()
+        with JSONLWriter(target, chunk_size=100) as writer:
+            writer.write_many(CourseReview.model_validate(review_payload) for _ in range(20))
+            assert len(writer._encoder._buffer) < 100
+        assert set(target.writes[:-1]) == {100}
+        assert 0 < target.writes[-1] <= 100
+        assert len(_lines(target.getvalue())) == 20
+
+    def test_writes_while_consuming(self, review_payload):
+        """Test that chunks are written before the source iterator is exhausted."""
+        target = RecordingFile()
+        written_before_end = []
+
+        def reviews():
+            for _ in range(50):
+                yield review_payload
+            written_before_end.append(len(target.writes))
+
+        export_jsonl(reviews(), target, chunk_size=256)
+        assert written_before_end[0] > 0
+
+    def test_gzip_by_suffix(self, tmp_path, review_payload):
+        """Test that .gz paths are compressed and readable with gzip."""
+        path = tmp_path / "reviews.jsonl.gz"
+        export_jsonl([review_payload] * 3, path, chunk_size=16)
+        with gzip.open(path, "rb") as file:
+            assert _lines(file.read()) == [review_payload] * 3
+
+    def test_from_client_iterator(self, sync_client, review_payload, tmp_path):
+        """Test exporting straight from a paginating client iterator."""
+        sync_client._http_client = httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200, json={"next": None, "results": [review_payload] * 5}
+                )
+            )
+        )
+        path = tmp_path / "reviews.jsonl"
+        assert export_jsonl(sync_client.iter_course_reviews(1, lean=True), path) == 5
+        assert len(_lines(path.read_bytes())) == 5
+
+    def test_invalid_chunk_size(self):
+        """Test that chunk sizes below one byte are rejected."""
+        with pytest.raises(ValueError):
+            JSONLWriter(io.BytesIO(), chunk_size=0)
+
+
+class TestAsyncJSONLWriter:
+    """Test cases for the asynchronous export."""
+
+    @pytest.mark.asyncio
+    async def test_gzip_file_from_async_iterator(self, tmp_path, async_client, review_payload):
+        """Test exporting an AsyncUdemyClient iterator into a gzip file."""
+        async_client._http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200, json={"next": None, "results": [review_payload] * 5}
+                )
+            )
+        )
+        path = tmp_path / "reviews.jsonl.gz"
+        reviews = async_client.iter_course_reviews(1, lean=True)
+        assert await export_jsonl_async(reviews, path, chunk_size=32) == 5
+        with gzip.open(path, "rb") as file:
+            assert len(_lines(file.read())) == 5
+        await async_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_backpressure(self, review_payload):
+        """Test that writes suspend while max_pending chunks wait for a slow file."""
+        release = asyncio.Event()
+        target = RecordingFile()
+
+        class SlowFile(RecordingFile):
+            def write(self, data):
+                asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+                return target.write(data)
+
+        loop = asyncio.get_running_loop()
+        writer = AsyncJSONLWriter(SlowFile(), chunk_size=10, max_pending=2)
+        blocked = asyncio.create_task(writer.write_many([review_payload] * 5))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+        assert writer._queue.qsize() == 2
+        release.set()
+        assert await blocked == 5
+        await writer.aclose()
+        assert len(_lines(target.getvalue())) == 5
+
+    @pytest.mark.asyncio
+    async def test_stream_writer_is_drained(self, review_payload):
+        """Test that stream writers are drained after every chunk."""
+        stream = FakeStreamWriter()
+        async with AsyncJSONLWriter(stream, chunk_size=64) as writer:
+            await writer.write_many([review_payload] * 3)
+        assert _lines(bytes(stream.data)) == [review_payload] * 3
+        assert stream.drains == -(-len(stream.data) // 64)
+
+    @pytest.mark.asyncio
+    async def test_write_errors_are_raised(self, review_payload):
+        """Test that an error of the target surfaces from the writer."""
+
+        class BrokenFile(io.BytesIO):
+            def write(self, data):
+                raise OSError("disk full")
+
+        with pytest.raises(OSError, match="disk full"):
+            async with AsyncJSONLWriter(BrokenFile(), chunk_size=8) as writer:
+                await writer.write_many([review_payload] * 3)
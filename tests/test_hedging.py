@@ -0,0 +1,215 @@
+"""Tests for hedged requests and their use by the async client."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from pydemy import (
+    AdaptiveLimiter,
+    AsyncUdemyClient,
+    CircuitBreaker,
+    HedgingPolicy,
+    TokenBucket,
+)
+
+DETAILS = "/api-2.0/courses/{id}/"
+
+
+def _funded(**kwargs):
+    """Returns a policy with a fixed delay whose budget allows one hedge."""
+    policy = HedgingPolicy(initial_delay=0.01, **kwargs)
+    policy._budget = 1.0
+    return policy
+
+
+def _call(latencies, results):
+    """Returns a send() whose n-th call sleeps latencies[n] and returns results[n]."""
+    calls = []
+
+    async def send():
+        index = len(calls)
+        calls.append(index)
+        await asyncio.sleep(latencies[index])
+        if isinstance(results[index], Exception):
+            raise results[index]
+        return results[index]
+
+    return send, calls
+
+
+class TestHedgingPolicy:
+    """Test cases for HedgingPolicy."""
+
+    def test_delay_follows_the_percentile(self):
+        """Test that the delay is the endpoint's latency percentile once enough are known."""
+        policy = HedgingPolicy(percentile=0.9, window=10, min_samples=5, min_delay=0.05)
+        for latency in (0.1, 0.2, 0.3, 0.4):
+            policy.record(DETAILS, latency)
+        assert policy.delay(DETAILS) is None  # Too few latencies to judge
+        for latency in (0.5, 0.6, 0.7, 0.8, 0.9, 1.0):
+            policy.record(DETAILS, latency)
+        assert policy.delay(DETAILS) == 0.9
+        assert policy.delay("/api-2.0/courses/") is None
+        for _ in range(10):
+            policy.record(DETAILS, 0.01)
+        assert policy.delay(DETAILS) == 0.05
+
+    @pytest.mark.asyncio
+    async def test_fast_request_is_not_hedged(self):
+        """Test that a request answering within the delay is sent once."""
+        policy = _funded()
+        send, calls = _call([0.0], ["primary"])
+        assert await policy.run(DETAILS, send) == "primary"
+        assert calls == [0] and policy.hedges_issued == 0
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_and_cancels_the_primary(self):
+        """Test that a slow request is hedged and the faster hedge's answer is used."""
+        policy = _funded()
+        send, calls = _call([10, 0.0], ["primary", "hedge"])
+        assert await asyncio.wait_for(policy.run(DETAILS, send), 1) == "hedge"
+        assert calls == [0, 1]
+        assert policy.hedges_issued == 1 and policy.hedges_won == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_primary_latency_is_recorded(self):
+        """Test that a primary beaten by its hedge still adds its elapsed time to the window."""
+        policy = _funded()
+        send, _ = _call([10, 0.0], ["primary", "hedge"])
+        await asyncio.wait_for(policy.run(DETAILS, send), 1)
+        hedge_latency, primary_latency = policy._latencies[DETAILS]
+        assert primary_latency >= 0.01 > hedge_latency
+
+    @pytest.mark.asyncio
+    async def test_primary_can_still_win(self):
+        """Test that the primary's answer is used when it arrives before the hedge's."""
+        policy = _funded()
+        send, _ = _call([0.03, 10], ["primary", "hedge"])
+        assert await asyncio.wait_for(policy.run(DETAILS, send), 1) == "primary"
+        assert policy.hedges_issued == 1 and policy.hedges_won == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_call_waits_for_the_other(self):
+        """Test that a failure of one call does not hide the other call's answer."""
+        policy = _funded()
+        send, _ = _call([0.03, 0.05], [httpx.ConnectError("refused"), "hedge"])
+        assert await policy.run(DETAILS, send) == "hedge"
+        policy = _funded()
+        send, _ = _call([0.03, 0.0], [httpx.ConnectError("primary"), httpx.ConnectError("hedge")])
+        with pytest.raises(httpx.ConnectError, match="primary"):
+            await policy.run(DETAILS, send)
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_the_extra_load(self):
+        """Test that hedges stay within max_extra_load of the requests."""
+        policy = HedgingPolicy(initial_delay=0.001, max_extra_load=0.25, burst=1)
+        send, calls = _call([0.01] * 40, list(range(40)))
+        for _ in range(20):
+            await policy.run(DETAILS, send)
+        assert policy.requests == 20 and policy.hedges_issued == 5
+        assert len(calls) == 25
+        assert policy.metrics()["extra_load"] == 0.25
+
+    @pytest.mark.asyncio
+    async def test_cancelling_the_caller_cancels_both_calls(self):
+        """Test that no request outlives a cancelled caller."""
+        policy = _funded()
+        started = []
+
+        async def send():
+            task = asyncio.current_task()
+            started.append(task)
+            await asyncio.sleep(10)
+
+        caller = asyncio.ensure_future(policy.run(DETAILS, send))
+        await asyncio.sleep(0.05)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+        assert len(started) == 2 and all(task.cancelled() for task in started)
+
+    def test_invalid_arguments(self):
+        """Test that impossible percentiles and budgets are rejected."""
+        with pytest.raises(ValueError):
+            HedgingPolicy(percentile=1)
+        with pytest.raises(ValueError):
+            HedgingPolicy(max_extra_load=0)
+        with pytest.raises(ValueError):
+            HedgingPolicy(burst=0.5)
+        with pytest.raises(ValueError):
+            HedgingPolicy(window=10, min_samples=20)
+
+
+class TestClientHedging:
+    """Test cases for the hedging policy of the async client."""
+
+    @pytest.mark.asyncio
+    async def test_slow_course_details_are_hedged(self, client_credentials, course_payload):
+        """Test that a slow course details request is answered by its hedge."""
+        calls = [0]
+
+        async def handler(request):
+            calls[0] += 1
+            if calls[0] == 1:
+                await asyncio.sleep(10)
+            return httpx.Response(200, json=course_payload)
+
+        policy = _funded()
+        client = AsyncUdemyClient(**client_credentials, hedging_policy=policy)
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        course = await asyncio.wait_for(client.get_course_details(1), 1)
+
+        assert course.id == course_payload["id"]
+        assert client.hedging_policy is policy
+        assert calls[0] == 2 and policy.hedges_won == 1
+        assert policy.metrics()["delays"] == {DETAILS: 0.01}
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_hedges_go_through_the_limits(self, client_credentials, course_payload):
+        """Test that hedges take a rate limit token and wait for a concurrency slot."""
+        calls = [0]
+
+        async def handler(request):
+            calls[0] += 1
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=course_payload)
+
+        rate_limiter = TokenBucket(rate=1000, burst=10)
+        client = AsyncUdemyClient(
+            **client_credentials,
+            hedging_policy=_funded(),
+            rate_limiter=rate_limiter,
+            concurrency_limiter=AdaptiveLimiter(initial_limit=1, max_limit=1),
+        )
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        await client.get_course_details(1)
+
+        assert rate_limiter.acquired == 2  # The hedge took a token...
+        assert calls[0] == 1  # ...but never got the only concurrency slot
+        assert client.concurrency_limiter.in_flight == 0
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_rejects_hedges(self, client_credentials, course_payload):
+        """Test that a hedge rejected by the circuit breaker leaves the primary's answer."""
+        calls = [0]
+
+        async def handler(request):
+            calls[0] += 1
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=course_payload)
+
+        breaker = CircuitBreaker(min_requests=1, open_seconds=0)
+        breaker.release(DETAILS, True, breaker.acquire(DETAILS))  # Half-open, one probe slot
+        client = AsyncUdemyClient(
+            **client_credentials, hedging_policy=_funded(), circuit_breaker=breaker
+        )
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        course = await client.get_course_details(1)
+
+        assert course.id == course_payload["id"] and calls[0] == 1
+        assert breaker.status()[DETAILS].rejected == 1
+        await client.aclose()
@@ -0,0 +1,118 @@
+"""Tests for the local course index."""
+
+import pytest
+
+from pydemy import CourseIndex, UdemyClient
+from pydemy.models import CourseFilter, CourseRecord, Ordering, Price
+
+
+@pytest.fixture
+def courses(course_payload):
+    """Fixture providing four courses with different titles, prices and locales."""
+    entries = [
+        dict(course_payload, id=1, title="Python for Beginners", headline="Learn Python"),
+        dict(course_payload, id=2, title="Advanced Python", headline="Decorators and more"),
+        dict(
+            course_payload,
+            id=3,
+            title="Java Basics",
+            is_paid=False,
+            price_detail=None,
+            instructor_name="Ada Python",
+        ),
+        dict(
+            course_payload,
+            id=4,
+            title="Python en español",
+            price_detail=dict(course_payload["price_detail"], amount=49.99),
+            locale=dict(course_payload["locale"], locale="es_ES"),
+        ),
+    ]
+    return [UdemyClient._parse_entry(entry) for entry in entries]
+
+
+class TestCourseIndex:
+    """Test cases for CourseIndex."""
+
+    def test_full_text_search(self, courses):
+        """Test that every word must match title, headline or instructor name."""
+        index = CourseIndex()
+        assert index.upsert(courses) == 4
+        assert len(index) == 4
+
+        found = index.search(CourseFilter(search="python", page_size=10))
+        assert {course.id for course in found} == {1, 2, 3, 4}
+        assert [c.id for c in index.search(CourseFilter(search="beginners python"))] == [1]
+        assert [c.id for c in index.search(CourseFilter(search="decorators"))] == [2]
+        assert index.search(CourseFilter(search="rust")) == []
+        # Query syntax is escaped, not interpreted: a stray quote is not an FTS5 error
+        assert len(index.search(CourseFilter(search='"python OR'))) == 0
+        assert len(index.search(CourseFilter(search='python"'))) == 4
+
+    def test_returns_copies_of_upserted_courses(self, courses):
+        """Test that results equal the upserted courses without sharing their objects."""
+        index = CourseIndex()
+        index.upsert(courses)
+        found = index.search(CourseFilter(search="java"))[0]
+        assert found == courses[2] and found is not courses[2]
+        assert index.get(2) == courses[1]
+        assert index.get(2) is not index.get(2)
+        assert index.get(99) is None
+
+    def test_filters(self, courses):
+        """Test price, language, locale and price range filters."""
+        index = CourseIndex()
+        index.upsert(courses)
+
+        def ids(*args, **kwargs):
+            return sorted(course.id for course in index.search(*args, **kwargs))
+
+        assert ids(CourseFilter(price=Price.PRICE_FREE)) == [3]
+        assert ids(CourseFilter(price=Price.PRICE_PAID)) == [1, 2, 4]
+        assert ids(CourseFilter(language="es")) == [4]
+        assert ids(locale="en_US") == [1, 2, 3]
+        assert ids(min_price=20) == [4]
+        assert ids(max_price=0) == [3]
+        assert ids(CourseFilter()) == [1, 2, 3, 4]  # The default language is not applied
+
+    def test_ordering_and_pages(self, courses):
+        """Test price ordering and page / page_size."""
+        index = CourseIndex()
+        index.upsert(courses)
+        ordered = CourseFilter(ordering=Ordering.PRICE_HIGH_TO_LOW, page_size=2)
+        assert [c.id for c in index.search(ordered)] == [4, 1]
+        ordered = CourseFilter(ordering=Ordering.PRICE_HIGH_TO_LOW, page=2, page_size=2)
+        assert [c.id for c in index.search(ordered)] == [2, 3]
+
+    def test_unsupported_filters(self, courses):
+        """Test that filters the index cannot answer are rejected."""
+        index = CourseIndex()
+        with pytest.raises(ValueError, match="has_closed_caption"):
+            index.search(CourseFilter(has_closed_caption=True))
+        with pytest.raises(ValueError, match="highest-rated"):
+            index.search(CourseFilter(ordering=Ordering.HIGHEST_RATED))
+
+    def test_upsert_replaces_and_delete(self, courses):
+        """Test that upserts replace the indexed text and deletes remove courses."""
+        index = CourseIndex()
+        index.upsert(courses)
+        update = {"title": "Rust for Beginners", "headline": "Learn Rust"}
+        index.upsert([courses[0].model_copy(update=update)])
+        assert [c.id for c in index.search(CourseFilter(search="rust"))] == [1]
+        assert 1 not in {c.id for c in index.search(CourseFilter(search="python"))}
+        index.delete(1)
+        assert index.search(CourseFilter(search="rust")) == []
+        assert len(index) == 3
+
+    def test_persistent_index(self, tmp_path, course_payload):
+        """Test that a file index keeps courses across instances and accepts lean records."""
+        path = tmp_path / "courses.db"
+        index = CourseIndex(path)
+        index.upsert([UdemyClient._parse_entry(course_payload, CourseRecord)])
+        index.close()
+
+        reopened = CourseIndex(path)
+        found = reopened.search(CourseFilter(search="python"))
+        assert [course.id for course in found] == [course_payload["id"]]
+        assert found[0] == UdemyClient._parse_entry(course_payload)
+        reopened.close()
@@ -1,13 +1,16 @@
 """Tests for Pydantic models."""
 
+import json
+
 import pytest
 from pydantic import ValidationError
 
 from pydemy.models import (
-    Course, CourseReview, CourseFilter, ReviewFilter,
+    Course, CourseCategory, CourseReview, CourseFilter, ReviewFilter,
     Instructor, Locale, PriceDetail, Chapter, Lecture,
-    Asset, Quiz, User
+    Asset, Quiz, User, dump_many_json
 )
+from pydemy.models._course_subcategory import CourseSubcategory
 
 
 class TestCourseFilter:
@@ -40,6 +43,30 @@ class TestCourseFilter:
         assert data["category"] == "Development"
         assert data["price"] == "paid"
 
+    def test_course_filter_category_models(self):
+        """Test that known category and subcategory pairs validate and others are rejected."""
+        development = CourseCategory(sort_order=0, title="Development", title_cleaned="dev")
+        web = CourseSubcategory(
+            category=development, sort_order=0, title="Web Development", title_cleaned="web"
+        )
+        filter_obj = CourseFilter(category=development, subcategory=web)
+        assert filter_obj.subcategory.title == "Web Development"
+        assert filter_obj.model_dump(exclude_unset=True)["category"] == {
+            "sort_order": 0,
+            "title": "Development",
+            "title_cleaned": "dev",
+        }
+        assert filter_obj.model_dump(mode="json", exclude_unset=True) == {
+            "category": "Development",
+            "subcategory": "Web Development",
+        }
+
+        music = CourseCategory(sort_order=0, title="Music", title_cleaned="music")
+        with pytest.raises(ValidationError):
+            CourseFilter(category=music, subcategory=web)
+        with pytest.raises(ValidationError):
+            CourseFilter(category=development.model_copy(update={"title": "Knitting"}))
+
 
 class TestReviewFilter:
     """Test cases for ReviewFilter model."""
@@ -407,3 +434,35 @@ class TestModelValidation:
         """Test Instructor missing required field."""
         with pytest.raises(ValidationError):
             Instructor(id=678)  # Missing required display_name field
+
+
+class TestSerialization:
+    """Test cases for the ISO 8601 serialization of datetime models."""
+
+    def test_model_dump_isoformats_datetimes(self, review_payload):
+        """Test that model_dump returns ISO 8601 strings for datetime fields."""
+        review = CourseReview.model_validate(review_payload)
+        data = review.model_dump()
+        assert data["created"] == "2023-01-01T00:00:00+00:00"
+        assert data["user"] == {"title": "Jane Smith", "name": "Jane", "display_name": "Jane Smith"}
+        assert json.loads(review.model_dump_json()) == data
+
+    def test_nested_models_and_exclude(self, curriculum_payload):
+        """Test that nested datetimes are converted and dump options are honored."""
+        lecture = Lecture.model_validate(curriculum_payload[1])
+        data = lecture.model_dump(exclude={"description"})
+        assert data["asset"]["created"] == "2023-01-01T00:00:00+00:00"
+        assert "description" not in data
+        assert "class_" not in data
+
+    def test_dump_many_json(self, curriculum_payload):
+        """Test that mixed models serialize to one JSON array matching model_dump_json."""
+        items = [
+            Chapter.model_validate(curriculum_payload[0]),
+            Lecture.model_validate(curriculum_payload[1]),
+            Quiz.model_validate(curriculum_payload[2]),
+        ]
+        expected = [json.loads(item.model_dump_json()) for item in items]
+        assert json.loads(dump_many_json(items)) == expected
+        assert json.loads(dump_many_json(iter(items))) == expected
+        assert dump_many_json([]) == b"[]"
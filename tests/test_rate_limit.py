@@ -0,0 +1,135 @@
+"""Tests for the token-bucket rate limiters and their use by the clients."""
+
+import asyncio
+import multiprocessing
+from unittest.mock import patch
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+import httpx
+import pytest
+
+from pydemy import AsyncUdemyClient, FileTokenBucket, TokenBucket, UdemyClient
+
+
+def _take_tokens(path, count, queue):
+    """Takes `count` tokens from a shared file bucket in a separate process."""
+    bucket = FileTokenBucket(path, rate=0.001, burst=10)
+    queue.put([bucket._reserve() for _ in range(count)])
+
+
+class TestTokenBucket:
+    """Test cases for the in-process token bucket."""
+
+    def test_burst_then_steady_rate(self, fake_clock):
+        """Test that a full bucket allows a burst and then spaces requests by 1 / rate."""
+        with patch("pydemy._rate_limit.time.monotonic", fake_clock):
+            bucket = TokenBucket(rate=10, burst=3)
+            delays = [bucket._reserve() for _ in range(5)]
+            assert delays[:3] == [0.0, 0.0, 0.0]
+            assert delays[3] == pytest.approx(0.1)
+            assert delays[4] == pytest.approx(0.2)
+
+            fake_clock.now += 10  # An idle period refills at most `burst` tokens
+            assert [bucket._reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+            assert bucket._reserve() > 0
+
+    def test_acquire_records_throttling(self):
+        """Test that acquire() sleeps for the reserved delay and records it."""
+        bucket = TokenBucket(rate=1000, burst=1)
+        with patch("pydemy._rate_limit.time.sleep") as mock_sleep:
+            bucket.acquire()
+            bucket.acquire()
+        assert bucket.acquired == 2
+        assert mock_sleep.call_count <= 1
+        assert bucket.throttled_seconds == pytest.approx(
+            sum(call.args[0] for call in mock_sleep.call_args_list)
+        )
+
+    @pytest.mark.parametrize("rate, burst", [(0, 1), (-1, 1), (1, 0)])
+    def test_invalid_configuration(self, rate, burst):
+        """Test that the rate must be positive and the burst at least 1."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=rate, burst=burst)
+
+    @pytest.mark.asyncio
+    async def test_acquire_async_spaces_tasks(self):
+        """Test that concurrent tasks are throttled to the configured rate."""
+        bucket = TokenBucket(rate=200, burst=1)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(5)))
+        assert loop.time() - start >= 4 / 200 * 0.9
+        assert bucket.acquired == 5
+
+
+class TestFileTokenBucket:
+    """Test cases for the file-backed token bucket shared between processes."""
+
+    def test_instances_share_one_quota(self, tmp_path):
+        """Test that two buckets on the same file draw from the same tokens."""
+        path = tmp_path / "bucket"
+        first = FileTokenBucket(path, rate=0.001, burst=2)
+        second = FileTokenBucket(path, rate=0.001, burst=2)
+        assert first._reserve() == 0.0
+        assert second._reserve() == 0.0
+        assert first._reserve() > 0
+        assert second._reserve() > 0
+
+    def test_processes_share_one_quota(self, tmp_path):
+        """Test that worker processes split a single burst between them."""
+        path = str(tmp_path / "bucket")
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        workers = [context.Process(target=_take_tokens, args=(path, 8, queue)) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+        delays = queue.get(timeout=30) + queue.get(timeout=30)
+        for worker in workers:
+            worker.join(timeout=30)
+        assert sum(1 for delay in delays if delay == 0.0) == 10
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(fcntl is None, reason="requires fcntl")
+    async def test_acquire_async_does_not_block_the_loop(self, tmp_path):
+        """Test that tasks keep running while another process holds the state file lock."""
+        path = tmp_path / "bucket"
+        bucket = FileTokenBucket(path, rate=100, burst=1)
+        with open(path, "wb") as holder:
+            fcntl.flock(holder.fileno(), fcntl.LOCK_EX)
+            acquiring = asyncio.ensure_future(bucket.acquire_async())
+            await asyncio.sleep(0.05)  # Would never run if the loop were blocked on the lock
+            assert not acquiring.done()
+            fcntl.flock(holder.fileno(), fcntl.LOCK_UN)
+        assert await asyncio.wait_for(acquiring, 5) == 0.0
+
+
+class TestClientRateLimiting:
+    """Test cases for throttling in the clients."""
+
+    def test_sync_requests_acquire_tokens(self, client_credentials, course_payload):
+        """Test that every request sent to the API takes a token."""
+        bucket = TokenBucket(rate=1000, burst=100)
+        client = UdemyClient(**client_credentials, rate_limiter=bucket)
+        client._http_client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=course_payload))
+        )
+        for _ in range(3):
+            client.get_course_details(12345)
+        assert client.rate_limiter is bucket
+        assert bucket.acquired == 3
+
+    @pytest.mark.asyncio
+    async def test_async_requests_acquire_tokens(self, client_credentials, course_payload):
+        """Test that the async client waits on the limiter without blocking the loop."""
+        bucket = TokenBucket(rate=1000, burst=100)
+        client = AsyncUdemyClient(**client_credentials, rate_limiter=bucket)
+        client._http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=course_payload))
+        )
+        await asyncio.gather(*(client.get_course_details(course_id) for course_id in range(4)))
+        assert bucket.acquired == 4
+        await client.aclose()
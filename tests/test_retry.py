@@ -0,0 +1,156 @@
+"""Tests for the retry policy and its use by the clients."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from pydemy import AsyncUdemyClient, RetryAttempt, RetryPolicy, UdemyClient
+from pydemy._exceptions import UdemyAPIError
+
+
+def _flaky_handler(statuses, payload, headers=None):
+    """Returns a mock transport handler answering with `statuses` in turn, then `payload`."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if len(requests) <= len(statuses):
+            return httpx.Response(statuses[len(requests) - 1], headers=headers or {})
+        return httpx.Response(200, json=payload)
+
+    handler.requests = requests
+    return handler
+
+
+class TestRetryPolicy:
+    """Test cases for the retry decisions of RetryPolicy."""
+
+    def test_exponential_backoff(self):
+        """Test that the backoff doubles per attempt up to max_backoff."""
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=3.0, jitter=False)
+        assert [policy.backoff(attempt) for attempt in range(1, 5)] == [0.5, 1.0, 2.0, 3.0]
+
+    def test_full_jitter_bounds(self):
+        """Test that jittered backoffs stay between zero and the exponential value."""
+        policy = RetryPolicy(backoff_factor=1.0, max_backoff=30.0)
+        delays = [policy.backoff(3) for _ in range(200)]
+        assert all(0 <= delay <= 4.0 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_retry_after_seconds_and_date(self):
+        """Test that Retry-After is parsed as delay-seconds or as an HTTP date."""
+        assert RetryPolicy.retry_after(httpx.Response(429, headers={"Retry-After": "7"})) == 7.0
+        later = datetime.now(timezone.utc) + timedelta(seconds=30)
+        response = httpx.Response(503, headers={"Retry-After": format_datetime(later, True)})
+        assert 25 < RetryPolicy.retry_after(response) <= 30
+        assert (
+            RetryPolicy.retry_after(httpx.Response(429, headers={"Retry-After": "soon"})) is None
+        )
+        assert RetryPolicy.retry_after(httpx.Response(429)) is None
+
+    def test_next_delay(self):
+        """Test which outcomes are retried and how long the policy waits."""
+        policy = RetryPolicy(max_attempts=3, backoff_factor=1.0, jitter=False)
+        assert policy.next_delay("GET", 1, httpx.Response(502)) == 1.0
+        assert policy.next_delay("GET", 2, error=httpx.ConnectTimeout("timeout")) == 2.0
+        assert policy.next_delay("GET", 3, httpx.Response(502)) is None  # Attempts exhausted
+        assert policy.next_delay("GET", 1, httpx.Response(404)) is None
+        assert policy.next_delay("GET", 1, httpx.Response(200)) is None
+        assert policy.next_delay("POST", 1, httpx.Response(503)) is None  # Not idempotent
+        assert policy.next_delay("GET", 1, httpx.Response(429, headers={"Retry-After": "4"})) == 4
+        assert (
+            policy.next_delay("GET", 1, httpx.Response(429, headers={"Retry-After": "600"}))
+            is None
+        )
+
+    def test_invalid_max_attempts(self):
+        """Test that at least one attempt is required."""
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+
+class TestClientRetries:
+    """Test cases for retrying requests in the clients."""
+
+    def test_retries_transient_status_then_succeeds(self, client_credentials, course_payload):
+        """Test that a 502 is retried and the following success is returned."""
+        attempts = []
+        policy = RetryPolicy(jitter=False, on_attempt=attempts.append)
+        client = UdemyClient(**client_credentials, retry_policy=policy)
+        handler = _flaky_handler([502], course_payload)
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        with patch("pydemy._client.time.sleep") as mock_sleep:
+            course = client.get_course_details(12345)
+
+        assert course.id == course_payload["id"]
+        assert len(handler.requests) == 2
+        mock_sleep.assert_called_once_with(0.5)
+        assert client.retry_policy is policy
+        assert [attempt.status_code for attempt in attempts] == [502, 200]
+        assert [attempt.will_retry for attempt in attempts] == [True, False]
+        assert all(isinstance(attempt, RetryAttempt) for attempt in attempts)
+        assert all(attempt.elapsed >= 0 for attempt in attempts)
+
+    def test_honors_retry_after(self, client_credentials, course_payload):
+        """Test that a 429 waits as long as its Retry-After header asks."""
+        client = UdemyClient(**client_credentials, retry_policy=RetryPolicy())
+        handler = _flaky_handler([429], course_payload, headers={"Retry-After": "2"})
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        with patch("pydemy._client.time.sleep") as mock_sleep:
+            client.get_course_details(12345)
+        mock_sleep.assert_called_once_with(2.0)
+
+    def test_retries_transport_errors(self, client_credentials, course_payload):
+        """Test that connection errors are retried like transient statuses."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ConnectError("connection refused", request=request)
+            return httpx.Response(200, json=course_payload)
+
+        client = UdemyClient(**client_credentials, retry_policy=RetryPolicy(jitter=False))
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        with patch("pydemy._client.time.sleep"):
+            assert client.get_course_details(12345).id == course_payload["id"]
+        assert len(calls) == 2
+
+    def test_exhausted_retries_raise(self, client_credentials, course_payload):
+        """Test that the last failure is raised once every attempt failed."""
+        client = UdemyClient(**client_credentials, retry_policy=RetryPolicy(max_attempts=3))
+        handler = _flaky_handler([503, 503, 503], course_payload)
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        with patch("pydemy._client.time.sleep") as mock_sleep:
+            with pytest.raises(UdemyAPIError, match="HTTP error 503"):
+                client.get_course_details(12345)
+        assert len(handler.requests) == 3
+        assert mock_sleep.call_count == 2
+
+    def test_no_retries_without_policy(self, client_credentials, course_payload):
+        """Test that failures are raised immediately by default."""
+        client = UdemyClient(**client_credentials)
+        handler = _flaky_handler([502], course_payload)
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        with pytest.raises(UdemyAPIError, match="HTTP error 502"):
+            client.get_course_details(12345)
+        assert len(handler.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_retries(self, client_credentials, course_payload):
+        """Test that the async client retries without blocking the event loop."""
+        attempts = []
+        policy = RetryPolicy(jitter=False, on_attempt=attempts.append)
+        client = AsyncUdemyClient(**client_credentials, retry_policy=policy)
+        handler = _flaky_handler([500, 504], course_payload)
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("pydemy._async_client.asyncio.sleep") as mock_sleep:
+            course = await client.get_course_details(12345)
+
+        assert course.id == course_payload["id"]
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
+        assert [attempt.status_code for attempt in attempts] == [500, 504, 200]
+        await client.aclose()
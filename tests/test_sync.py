@@ -0,0 +1,232 @@
+"""Tests for the resumable catalogue sync."""
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from pydemy import CatalogSync, CourseIndex, SyncPartition, UdemyClient
+from pydemy._exceptions import UdemyAPIError
+from pydemy._sync import default_partitions
+from pydemy.models import CourseFilter, CourseRecord
+
+PARTITIONS = [SyncPartition("Development", "Web Development"), SyncPartition("Music")]
+
+
+class FakeCatalogue:
+    """Mock API serving course pages per category and subcategory, newest course first."""
+
+    def __init__(self, course_payload, courses):
+        self.course_payload = course_payload
+        self.courses = courses  # Partition key -> course IDs, newest first
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request.url)
+        params = request.url.params
+        assert params["ordering"] == "newest"
+        key = f"{params['category']}|{params.get('subcategory', '')}"
+        page, page_size = int(params["page"]), int(params["page_size"])
+        ids = self.courses.get(key, [])[(page - 1) * page_size : page * page_size]
+        next_url = None
+        if page * page_size < len(self.courses.get(key, [])):
+            next_url = str(request.url.copy_merge_params({"page": page + 1}))
+        results = [dict(self.course_payload, id=course_id) for course_id in ids]
+        return httpx.Response(200, json={"next": next_url, "results": results})
+
+
+@pytest.fixture
+def catalogue(course_payload):
+    """Fixture providing a catalogue of 5 web development and 2 music courses."""
+    return FakeCatalogue(
+        course_payload,
+        {"Development|Web Development": [15, 14, 13, 12, 11], "Music|": [22, 21]},
+    )
+
+
+@pytest.fixture
+def client(client_credentials, catalogue):
+    """Fixture providing a client answered by the fake catalogue."""
+    client = UdemyClient(**client_credentials)
+    client._http_client = httpx.Client(transport=httpx.MockTransport(catalogue))
+    return client
+
+
+def _sync(client, path, received, **kwargs):
+    """Returns a CatalogSync over PARTITIONS that collects the received course IDs."""
+    return CatalogSync(
+        client,
+        path,
+        on_page=lambda partition, courses: received.extend(course.id for course in courses),
+        partitions=PARTITIONS,
+        filters=CourseFilter(page_size=2),
+        **kwargs,
+    )
+
+
+class TestCatalogSync:
+    """Test cases for CatalogSync."""
+
+    def test_full_walk(self, tmp_path, client, catalogue):
+        """Test that the first run walks every page of every partition."""
+        received = []
+        stats = _sync(client, tmp_path / "sync.db", received).run()
+
+        assert received == [15, 14, 13, 12, 11, 22, 21]
+        assert stats.pages == len(catalogue.requests) == 5  # Music's full page needs a second
+        assert stats.new_courses == 7
+        assert stats.complete and not stats.resumed
+
+    def test_resumes_from_checkpoint(self, tmp_path, client, catalogue):
+        """Test that an interrupted run continues from its stored page number."""
+        received = []
+        path = tmp_path / "sync.db"
+        first = _sync(client, path, received).run(max_pages=2)
+        assert not first.complete and received == [15, 14, 13, 12]
+
+        resumed = _sync(client, path, received).run()
+        assert resumed.resumed and resumed.run_id == first.run_id
+        assert received == [15, 14, 13, 12, 11, 22, 21]
+        assert [url.params["page"] for url in catalogue.requests] == ["1", "2", "3", "1", "2"]
+
+    def test_failed_page_is_retried_on_resume(self, tmp_path, client):
+        """Test that a page whose consumer failed is delivered again after a crash."""
+        received, calls = [], []
+
+        def on_page(partition, courses):
+            calls.append(len(calls))
+            if len(calls) == 2:
+                raise RuntimeError("crash")
+            received.extend(course.id for course in courses)
+
+        sync = CatalogSync(
+            client,
+            tmp_path / "sync.db",
+            on_page,
+            partitions=PARTITIONS,
+            filters=CourseFilter(page_size=2),
+        )
+        with pytest.raises(RuntimeError):
+            sync.run()
+        sync.run()
+        assert received == [15, 14, 13, 12, 11, 22, 21]
+
+    def test_api_error_keeps_checkpoint(self, tmp_path, client_credentials, catalogue):
+        """Test that an API failure leaves the fetched pages checkpointed."""
+        failing = {"count": 0}
+
+        def handler(request):
+            failing["count"] += 1
+            if failing["count"] == 2:
+                return httpx.Response(503)
+            return catalogue(request)
+
+        client = UdemyClient(**client_credentials)
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        received = []
+        sync = _sync(client, tmp_path / "sync.db", received)
+        with pytest.raises(UdemyAPIError):
+            sync.run()
+        assert sync.run().resumed
+        assert received == [15, 14, 13, 12, 11, 22, 21]
+
+    def test_later_runs_fetch_only_the_delta(self, tmp_path, client, catalogue):
+        """Test that after a complete run only pages up to a known course are fetched."""
+        path = tmp_path / "sync.db"
+        _sync(client, path, []).run()
+        catalogue.courses["Development|Web Development"][:0] = [17, 16]
+        catalogue.requests.clear()
+
+        received = []
+        sync = _sync(client, path, received)
+        stats = sync.run()
+        assert received == [17, 16, 15, 14, 22, 21]
+        assert stats.new_courses == 2 and not stats.resumed and stats.run_id == 2
+        assert len(catalogue.requests) == 3  # Instead of 5 for a full walk
+        assert sync.known_courses(PARTITIONS[0]) == 7
+        assert sync.known_courses() == 9
+
+    def test_courses_in_several_partitions_are_new_once(self, tmp_path, client, catalogue):
+        """Test that new_courses counts distinct courses, like known_courses()."""
+        catalogue.courses["Music|"] = [22, 15]
+        sync = _sync(client, tmp_path / "sync.db", [])
+        stats = sync.run()
+        assert stats.new_courses == sync.known_courses() == 6
+        assert sync.known_courses(PARTITIONS[1]) == 2
+
+    def test_feeds_a_course_index(self, tmp_path, client):
+        """Test syncing lean records straight into a CourseIndex."""
+        index = CourseIndex()
+        CatalogSync(
+            client,
+            tmp_path / "sync.db",
+            lambda partition, courses: index.upsert(courses),
+            partitions=PARTITIONS,
+            filters=CourseFilter(page_size=2),
+            lean=True,
+        ).run()
+        assert len(index) == 7
+
+    def test_lean_pages(self, tmp_path, client):
+        """Test that lean syncs pass CourseRecord objects to on_page."""
+        types = set()
+        CatalogSync(
+            client,
+            tmp_path / "sync.db",
+            lambda partition, courses: types.update(type(course) for course in courses),
+            partitions=PARTITIONS[1:],
+            lean=True,
+        ).run()
+        assert types == {CourseRecord}
+
+    def test_category_filling_the_window_is_split(self, tmp_path, client, catalogue, monkeypatch):
+        """Test that a category past the result window is walked by subcategory instead."""
+        monkeypatch.setattr("pydemy._sync._RESULT_WINDOW", 6)
+        catalogue.courses["Development|"] = [18, 17, 16, 15, 14, 13, 12, 11]
+        catalogue.courses["Development|Mobile Development"] = [18, 17, 16]
+        path = tmp_path / "sync.db"
+        received = []
+        sync = CatalogSync(
+            client,
+            path,
+            on_page=lambda partition, courses: received.extend(course.id for course in courses),
+            partitions=[SyncPartition("Development")],
+            filters=CourseFilter(page_size=2),
+        )
+        stats = sync.run()
+
+        assert stats.complete
+        assert set(received) == set(range(11, 19))
+        assert sync.known_courses(SyncPartition("Development", "Web Development")) == 5
+        catalogue.requests.clear()
+        sync.run()
+        assert all("subcategory" in url.params for url in catalogue.requests)
+
+    def test_subcategory_filling_the_window_raises(self, tmp_path, client, monkeypatch):
+        """Test that a partition that cannot be split is never recorded as complete."""
+        monkeypatch.setattr("pydemy._sync._RESULT_WINDOW", 4)
+        sync = _sync(client, tmp_path / "sync.db", [])
+        for _ in range(2):
+            with pytest.raises(UdemyAPIError, match="more than 4 courses"):
+                sync.run()
+        assert not sync._connection.execute(
+            "SELECT complete FROM sync_partitions WHERE key = ?", (PARTITIONS[0].key,)
+        ).fetchone()[0]
+
+    def test_default_partitions(self):
+        """Test that the default partitions are one request chain per category."""
+        partitions = default_partitions()
+        assert SyncPartition("Development") in partitions
+        assert len(partitions) == len(set(partitions)) == 15
+        assert all(partition.subcategory is None for partition in partitions)
+
+    def test_partition_filters(self):
+        """Test that a partition narrows the filters sent through the public client API."""
+        filters = PARTITIONS[0].filters(CourseFilter(page_size=2, language="de"))
+        assert UdemyClient._query_params(filters) == {
+            "page_size": "2",
+            "language": "de",
+            "category": "Development",
+            "subcategory": "Web Development",
+        }
+        with pytest.raises(ValidationError):
+            SyncPartition("Music", "Knitting").filters(CourseFilter())